@@ -0,0 +1,20 @@
+from fastapi import Request
+from src.llm_extractor import LLMExtractor
+from src.snapshots import SnapshotStore
+
+
+def get_extractor(request: Request) -> LLMExtractor:
+    """
+    The process-wide extractor created in the app lifespan. It wraps one
+    pooled AsyncOpenAIClient, so every request reuses the same keep-alive
+    connections instead of opening a new HTTP client.
+    """
+    return request.app.state.extractor
+
+
+def get_snapshot_store(request: Request) -> SnapshotStore | None:
+    """
+    Prediction snapshots /api/evaluate records and can score from, or None
+    unless EVAL_SNAPSHOT_DIR is set.
+    """
+    return getattr(request.app.state, "snapshots", None)
@@ -2,27 +2,55 @@ import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
 
-from api.routes import extract, evaluate
+from lib.openai_client import AsyncOpenAIClient, load_env, pool_settings_from_env
+from lib.rate_limiter import RateLimiter
+from lib.replay_client import replay_client_from_env
+from src.extraction_cache import close_default_cache
+from src.llm_extractor import LLMExtractor
+from src.snapshots import SnapshotStore, snapshot_dir_from_env
+from api.routes import extract, evaluate, stats
 from api.exceptions import unhandled_exception_handler
+from api.responses import FastJSONResponse
 
-load_dotenv()
 
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
+def _pooled_client() -> AsyncOpenAIClient:
     api_key = os.getenv("OPENAI_API_KEY", "")
     if not api_key or not api_key.startswith("sk-"):
         raise RuntimeError(
             "OPENAI_API_KEY is missing or invalid. "
             "Set it in your .env file before starting the server."
         )
-    yield
+    return AsyncOpenAIClient(
+        api_key=api_key,
+        rate_limiter=RateLimiter.from_env(),
+        **pool_settings_from_env(),
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled, rate-limited client per process; routes receive the extractor through get_extractor().
+    # With LLM_CASSETTE set the client is served from a cassette, and replay mode needs no API key.
+    client = replay_client_from_env(_pooled_client, asynchronous=True) or _pooled_client()
+    app.state.extractor = LLMExtractor.from_env(async_client=client)
+    snapshot_dir = snapshot_dir_from_env()
+    app.state.snapshots = SnapshotStore(snapshot_dir) if snapshot_dir else None
+    try:
+        yield
+    finally:
+        await client.aclose()
+        close_default_cache()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="anote-cohart API", version="1.0.0", lifespan=lifespan)
+    load_env()
+    app = FastAPI(
+        title="anote-cohart API",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=FastJSONResponse,
+    )
 
     allowed_origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
     app.add_middleware(
@@ -37,6 +65,7 @@ def create_app() -> FastAPI:
 
     app.include_router(extract.router, prefix="/api")
     app.include_router(evaluate.router, prefix="/api")
+    app.include_router(stats.router, prefix="/api")
 
     return app
 
@@ -14,3 +14,6 @@ class EvaluationResponse(BaseModel):
     decisions: SectionMetrics
     follow_ups: SectionMetrics
     text_threshold: float
+    matching: str = "optimal"
+    similarity: str = "token_f1"
+    snapshot: str | None = None
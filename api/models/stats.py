@@ -0,0 +1,43 @@
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    hit_rate: float
+    memory_entries: int
+    disk_entries: int
+
+
+class ResponseModeStats(BaseModel):
+    extractions: int
+    retried: int
+    attempts: int
+    retry_rate: float
+
+
+class RetryStats(BaseModel):
+    retries: int
+    prompt_tokens: int
+    replay_prompt_tokens: int
+    tokens_saved: int
+    by_response_mode: dict[str, ResponseModeStats] = {}
+
+
+class RateLimitStats(BaseModel):
+    requests_available: float | None = None
+    tokens_available: float | None = None
+    concurrency_limit: int
+    in_flight: int
+    queue_depth: int
+    admitted: int
+    rate_limited: int
+    total_wait_seconds: float
+    mean_wait_seconds: float
+
+
+class StatsResponse(BaseModel):
+    cache: CacheStats | None = None
+    retries: RetryStats
+    rate_limit: RateLimitStats | None = None
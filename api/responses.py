@@ -0,0 +1,15 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from lib import jsonio
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered through lib.jsonio, so JSON_BACKEND picks orjson
+    or the standard library for every API response.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return jsonio.dumpb(content)
@@ -1,9 +1,13 @@
-import json
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from api.dependencies import get_extractor, get_snapshot_store
 from api.models.evaluation import EvaluationResponse, SectionMetrics
 from api.services.transcript_validator import validate_transcript
 from api.services.extractor_service import run_extraction
+from lib import jsonio
 from src.evaluator import evaluate
+from src.llm_extractor import LLMExtractor
+from src.similarity import DEFAULT_SIMILARITY, SIMILARITIES
+from src.snapshots import SnapshotExtractor, SnapshotStore
 
 router = APIRouter()
 
@@ -13,6 +17,11 @@ async def evaluate_endpoint(
     transcript: UploadFile = File(...),
     gold: UploadFile = File(...),
     threshold: float = Form(0.75),
+    greedy: bool = Form(False),
+    similarity: str = Form(DEFAULT_SIMILARITY),
+    from_snapshot: bool = Form(False),
+    extractor: LLMExtractor = Depends(get_extractor),
+    snapshots: SnapshotStore | None = Depends(get_snapshot_store),
 ):
     transcript_bytes = await transcript.read()
     gold_bytes = await gold.read()
@@ -23,10 +32,13 @@ async def evaluate_endpoint(
         raise HTTPException(status_code=422, detail="Transcript must be UTF-8 encoded text.")
 
     try:
-        gold_data = json.loads(gold_bytes.decode("utf-8"))
-    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        gold_data = jsonio.loads(gold_bytes.decode("utf-8"))
+    except (UnicodeDecodeError, jsonio.JSONDecodeError) as exc:
         raise HTTPException(status_code=422, detail=f"Gold file must be valid UTF-8 JSON: {exc}")
 
+    if similarity not in SIMILARITIES:
+        raise HTTPException(status_code=422, detail=f"similarity must be one of {list(SIMILARITIES)}.")
+
     validation = validate_transcript(transcript_content)
     if not validation.valid:
         raise HTTPException(
@@ -38,8 +50,13 @@ async def evaluate_endpoint(
             },
         )
 
-    result = run_extraction(transcript_content)
-    scores = evaluate(result.model_dump(), gold_data, text_threshold=threshold)
+    if from_snapshot and snapshots is None:
+        raise HTTPException(status_code=422, detail="Prediction snapshots are disabled on this server.")
+    if snapshots is not None:
+        extractor = SnapshotExtractor(snapshots, extractor, mode="replay" if from_snapshot else "record")
+
+    predicted = await run_extraction(transcript_content, extractor)
+    scores = evaluate(predicted, gold_data, text_threshold=threshold, greedy=greedy, similarity=similarity)
 
     def to_metrics(section: dict, has_owner_due: bool) -> SectionMetrics:
         return SectionMetrics(
@@ -55,4 +72,7 @@ async def evaluate_endpoint(
         decisions=to_metrics(scores["decisions"], has_owner_due=False),
         follow_ups=to_metrics(scores["follow_ups"], has_owner_due=True),
         text_threshold=scores["text_threshold"],
+        matching=scores["matching"],
+        similarity=scores["similarity"],
+        snapshot=extractor.last_entry["key"] if snapshots is not None else None,
     )
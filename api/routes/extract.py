@@ -1,13 +1,17 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.responses import StreamingResponse
+from api.dependencies import get_extractor
 from api.models.extraction import ExtractionResponse
+from api.models.validation import TranscriptValidationResult
+from api.responses import FastJSONResponse
 from api.services.transcript_validator import validate_transcript
-from api.services.extractor_service import run_extraction
+from api.services.extractor_service import run_extraction, stream_extraction
+from src.llm_extractor import LLMExtractor
 
 router = APIRouter()
 
 
-@router.post("/extract", response_model=ExtractionResponse)
-async def extract(file: UploadFile = File(...)):
+async def _read_transcript(file: UploadFile) -> tuple[str, TranscriptValidationResult]:
     raw_bytes = await file.read()
     try:
         content = raw_bytes.decode("utf-8")
@@ -25,6 +29,27 @@ async def extract(file: UploadFile = File(...)):
                 "warnings": validation.warnings,
             },
         )
+    return content, validation
+
+
+@router.post("/extract", response_model=ExtractionResponse)
+async def extract(
+    file: UploadFile = File(...),
+    extractor: LLMExtractor = Depends(get_extractor),
+):
+    content, validation = await _read_transcript(file)
+    data = await run_extraction(content, extractor)
+    # response_model documents the shape; returning a Response skips FastAPI's re-validation
+    return FastJSONResponse({**data, "validation": validation.model_dump()})
+
 
-    result = run_extraction(content)
-    return ExtractionResponse(**result.model_dump(), validation=validation)
+@router.post("/extract/stream")
+async def extract_stream(
+    file: UploadFile = File(...),
+    extractor: LLMExtractor = Depends(get_extractor),
+):
+    content, validation = await _read_transcript(file)
+    return StreamingResponse(
+        stream_extraction(content, extractor, validation),
+        media_type="application/x-ndjson",
+    )
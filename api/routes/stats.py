@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends
+from api.dependencies import get_extractor
+from api.models.stats import CacheStats, RateLimitStats, RetryStats, StatsResponse
+from src.llm_extractor import LLMExtractor
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=StatsResponse)
+async def stats(extractor: LLMExtractor = Depends(get_extractor)):
+    cache = extractor.cache
+    limiter = getattr(extractor.async_client, "rate_limiter", None)
+    return StatsResponse(
+        cache=CacheStats(**cache.stats()) if cache else None,
+        retries=RetryStats(**extractor.retry_stats.as_dict()),
+        rate_limit=RateLimitStats(**limiter.stats()) if limiter else None,
+    )
@@ -1,27 +1,90 @@
+from lib import jsonio
 from fastapi import HTTPException
 from src.llm_extractor import LLMExtractor
+from src.snapshots import SnapshotMiss
 from api.models.extraction import ExtractionResult
+from api.models.validation import TranscriptValidationResult
 
 
-def run_extraction(transcript: str) -> ExtractionResult:
-    extractor = LLMExtractor()
-    try:
-        data = extractor.extract(transcript)
-    except ValueError as exc:
-        raise HTTPException(
+def _to_http_exception(exc: Exception) -> HTTPException:
+    if isinstance(exc, SnapshotMiss):
+        return HTTPException(status_code=404, detail=str(exc))
+    if isinstance(exc, ValueError):
+        return HTTPException(
             status_code=502,
             detail=f"Extraction failed after maximum retries: {exc}",
         )
-    except Exception as exc:
-        msg = str(exc).lower()
-        if "auth" in msg or "api key" in msg or "unauthorized" in msg or "401" in msg:
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid or missing OpenAI API key.",
-            )
-        raise HTTPException(
-            status_code=502,
-            detail=f"Upstream LLM error: {exc}",
+    msg = str(exc).lower()
+    if "auth" in msg or "api key" in msg or "unauthorized" in msg or "401" in msg:
+        return HTTPException(
+            status_code=401,
+            detail="Invalid or missing OpenAI API key.",
         )
+    return HTTPException(
+        status_code=502,
+        detail=f"Upstream LLM error: {exc}",
+    )
+
+
+def _optional_field_defaults() -> dict[str, dict]:
+    sections = {}
+    for section, field in ExtractionResult.model_fields.items():
+        item_model = field.annotation.__args__[0]
+        sections[section] = {
+            name: item_field.default
+            for name, item_field in item_model.model_fields.items()
+            if not item_field.is_required()
+        }
+    return sections
+
+
+# Optional item fields the response models fill in, e.g. follow_ups[].reason
+_OPTIONAL_FIELD_DEFAULTS = _optional_field_defaults()
+
+
+def _fill_optional_fields(section: str, item: dict) -> None:
+    for name, default in _OPTIONAL_FIELD_DEFAULTS[section].items():
+        item.setdefault(name, default)
+
+
+async def run_extraction(transcript: str, extractor: LLMExtractor) -> dict:
+    """
+    The extraction payload as plain dicts in the shape of ExtractionResult.
+    The extractor has already checked it against the output contract, so it
+    is not validated into models a second time; only the optional fields the
+    models would default are filled in.
+    """
+    try:
+        data = await extractor.aextract(transcript)
+    except Exception as exc:
+        raise _to_http_exception(exc)
+
+    for section in _OPTIONAL_FIELD_DEFAULTS:
+        for item in data.get(section, []):
+            _fill_optional_fields(section, item)
+    return data
+
+
+async def stream_extraction(transcript: str, extractor: LLMExtractor, validation: TranscriptValidationResult):
+    """
+    NDJSON lines for /api/extract/stream: the validation result first, then
+    one line per item as the model produces it, with the same optional-field
+    defaults as run_extraction, then a final "done" line.
+    Failures after the stream has started are reported as an "error" line,
+    since the HTTP status has already been sent.
+    """
+    yield _ndjson({"event": "validation", "validation": validation.model_dump()})
+    try:
+        async for event in extractor.astream(transcript):
+            if event["event"] == "item":
+                _fill_optional_fields(event["section"], event["item"])
+            yield _ndjson(event)
+    except Exception as exc:
+        error = _to_http_exception(exc)
+        yield _ndjson({"event": "error", "status_code": error.status_code, "detail": error.detail})
+        return
+    yield _ndjson({"event": "done"})
+
 
-    return ExtractionResult(**data)
+def _ndjson(event: dict) -> bytes:
+    return jsonio.dumpb(event) + b"\n"
@@ -1,9 +1,7 @@
-import re
 from api.models.validation import TranscriptValidationResult
+from src.transcript_analysis import analyze_transcript, count_speaker_lines
 
-_SPEAKER_LINE_RE = re.compile(r"^\s*[A-Za-z][A-Za-z\s\-']+:\s+\S", re.MULTILINE)
-_DATE_HEADER_RE = re.compile(r"Date:\s*[A-Za-z]{3}\s+\d{1,2},\s+\d{4}")
-_MEETING_HEADER_RE = re.compile(r"Meeting:", re.IGNORECASE)
+MIN_SPEAKER_LINES = 2
 
 
 def validate_transcript(content: str) -> TranscriptValidationResult:
@@ -17,8 +15,8 @@ def validate_transcript(content: str) -> TranscriptValidationResult:
     if len(content) > 500_000:
         errors.append("Transcript exceeds maximum length of 500,000 characters.")
 
-    speaker_lines = _SPEAKER_LINE_RE.findall(content)
-    if len(speaker_lines) < 2:
+    # Stops at the second speaker line; rejected uploads are never indexed or cached
+    if count_speaker_lines(content, limit=MIN_SPEAKER_LINES) < MIN_SPEAKER_LINES:
         errors.append(
             "Transcript must contain at least 2 speaker lines (format: 'Speaker: text')."
         )
@@ -26,15 +24,17 @@ def validate_transcript(content: str) -> TranscriptValidationResult:
     if errors:
         return TranscriptValidationResult(valid=False, errors=errors, warnings=warnings)
 
-    if not _DATE_HEADER_RE.search(content):
+    # One scan serves the checks below, and is reused by the extractor for the meeting date and chunking
+    index = analyze_transcript(content)
+    if index.date_header is None:
         warnings.append(
             "Missing 'Date: Mon DD, YYYY' header — due-date normalization will be skipped."
         )
 
-    if not _MEETING_HEADER_RE.search(content):
+    if not index.has_meeting_header:
         warnings.append("Missing 'Meeting:' header.")
 
-    word_count = len(content.split())
+    word_count = index.word_count
     if word_count < 50:
         warnings.append(f"Transcript is very short ({word_count} words); results may be limited.")
 
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Due-phrase normalization throughput: the compiled, memoized engine in
+src.date_normalizer against the previous rule-by-rule implementation, over
+millions of phrases drawn from a realistic mix. Also checks that both give
+identical NormalizedDue results for every phrase.
+
+    python benchmarks/due_normalization.py --phrases 2000000
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.date_normalizer import (
+    MONTHS,
+    WEEKDAYS,
+    NormalizedDue,
+    _next_or_same_weekday,
+    _next_weekday_strictly_after,
+    normalize_due_many,
+    normalize_due_raw,
+)
+
+PHRASES = [
+    "by Friday", "Friday", "by next Wednesday", "next Monday", "Monday", "on Tuesday",
+    "today", "tomorrow", "in 3 days", "in 1 day", "in 2 weeks", "in 10 days",
+    "end of month", "by end of month", "end of March", "by end of June",
+    "Jan 25", "January 25th", "Feb 3, 2026", "before March 15", "Dec 31st",
+    "early next week", "next week", "soon", "asap", "EOW", "later this week",
+    "when the build is green", "Q3", None, "",
+]
+
+
+def legacy_normalize_due_raw(
+    meeting_date: date,
+    due_raw: Optional[str],
+) -> NormalizedDue:
+    # Pre-compilation implementation, kept verbatim as the reference for speed and results
+    if not due_raw:
+        return NormalizedDue(due=None, needs_human_review=False)
+
+    s = due_raw.strip().lower()
+
+    # Mark ambiguous phrases for review (expand this list over time)
+    ambiguous_markers = [
+        "early next week",
+        "later this week",
+        "sometime next week",
+        "next week",
+        "soon",
+        "asap",
+        "end of week",
+        "eow",
+    ]
+    if any(marker in s for marker in ambiguous_markers):
+        return NormalizedDue(
+            due=None,
+            needs_human_review=True,
+            reason=f"Ambiguous due phrase: '{due_raw}'"
+        )
+
+    # Remove leading "by" / "on" / "before" for parsing
+    s = re.sub(r"^(by|on|before)\s+", "", s).strip()
+
+    # Handle "next <weekday>" explicitly (strictly after meeting date)
+    m_next = re.match(r"^next\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)$", s)
+    if m_next:
+        wd = WEEKDAYS[m_next.group(1)]
+        dt = _next_weekday_strictly_after(meeting_date, wd)
+        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
+
+    # Handle plain weekday (interpret as next-or-same occurrence after meeting date)
+    m_wd = re.match(r"^(monday|tuesday|wednesday|thursday|friday|saturday|sunday)$", s)
+    if m_wd:
+        wd = WEEKDAYS[m_wd.group(1)]
+        dt = _next_or_same_weekday(meeting_date, wd)
+        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
+
+    # Handle "today" / "tomorrow"
+    if s == "today":
+        return NormalizedDue(due=meeting_date.isoformat(), needs_human_review=False)
+    if s == "tomorrow":
+        dt = meeting_date + timedelta(days=1)
+        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
+
+    # Handle "in N days" / "in N weeks"
+    m_in_days = re.match(r"^in\s+(\d+)\s+days?$", s)
+    if m_in_days:
+        dt = meeting_date + timedelta(days=int(m_in_days.group(1)))
+        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
+
+    m_in_weeks = re.match(r"^in\s+(\d+)\s+weeks?$", s)
+    if m_in_weeks:
+        dt = meeting_date + timedelta(weeks=int(m_in_weeks.group(1)))
+        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
+
+    # Handle "end of month" / "end of <month>"
+    m_eom = re.match(r"^end\s+of\s+month$", s)
+    if m_eom:
+        import calendar
+        last_day = calendar.monthrange(meeting_date.year, meeting_date.month)[1]
+        dt = date(meeting_date.year, meeting_date.month, last_day)
+        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
+
+    m_eom_named = re.match(r"^end\s+of\s+([a-z]{3,9})$", s)
+    if m_eom_named:
+        import calendar
+        mon_str = m_eom_named.group(1).capitalize()[:3]
+        if mon_str in MONTHS:
+            month_num = MONTHS[mon_str]
+            year = meeting_date.year
+            last_day = calendar.monthrange(year, month_num)[1]
+            dt = date(year, month_num, last_day)
+            return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
+
+    # Handle specific dates: "Jan 25", "January 25", "Jan 25th", "January 25, 2026"
+    FULL_MONTHS = {
+        "january": "Jan", "february": "Feb", "march": "Mar", "april": "Apr",
+        "may": "May", "june": "Jun", "july": "Jul", "august": "Aug",
+        "september": "Sep", "october": "Oct", "november": "Nov", "december": "Dec",
+    }
+    m_date = re.match(
+        r"^([a-z]{3,9})\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?$", s
+    )
+    if m_date:
+        raw_mon = m_date.group(1)
+        # Normalize full month name to 3-letter abbreviation
+        mon_key = FULL_MONTHS.get(raw_mon, raw_mon.capitalize()[:3])
+        if mon_key in MONTHS:
+            month_num = MONTHS[mon_key]
+            day_num = int(m_date.group(2))
+            year_num = int(m_date.group(3)) if m_date.group(3) else meeting_date.year
+            try:
+                dt = date(year_num, month_num, day_num)
+                return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
+            except ValueError:
+                pass
+
+    # If we got here, we couldn't parse it confidently
+    return NormalizedDue(
+        due=None,
+        needs_human_review=True,
+        reason=f"Unrecognized due phrase: '{due_raw}'"
+    )
+
+
+def _phrase_stream(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [rng.choice(PHRASES) for _ in range(count)]
+
+
+def _timed(fn) -> tuple[float, list]:
+    start = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - start, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--phrases", type=int, default=1_000_000, help="Phrases to normalize. Defaults to 1000000.")
+    parser.add_argument("--meetings", type=int, default=50, help="Distinct meeting dates. Defaults to 50.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    phrases = _phrase_stream(args.phrases, args.seed)
+    meetings = [date(2026, 1, 5) + timedelta(days=7 * i) for i in range(args.meetings)]
+    per_meeting = len(phrases) // len(meetings)
+    batches = [(m, phrases[i * per_meeting:(i + 1) * per_meeting]) for i, m in enumerate(meetings)]
+
+    legacy_s, legacy_out = _timed(lambda: [legacy_normalize_due_raw(m, p) for m, batch in batches for p in batch])
+    single_s, single_out = _timed(lambda: [normalize_due_raw(m, p) for m, batch in batches for p in batch])
+    many_s, many_out = _timed(lambda: [d for m, batch in batches for d in normalize_due_many(m, batch)])
+
+    assert legacy_out == single_out == many_out, "results differ from the reference implementation"
+    total = per_meeting * len(meetings)
+    print(f"{total} phrases over {len(meetings)} meeting dates (results identical)")
+    for name, seconds in (("legacy", legacy_s), ("normalize_due_raw", single_s), ("normalize_due_many", many_s)):
+        print(f"{name:<20} {seconds:8.3f} s  {total / seconds / 1e6:7.2f} M phrases/s  {legacy_s / seconds:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Section scoring on a large synthetic gold set:
+
+  previous loop   best_text_match per prediction, re-tokenizing every unused
+                  gold text each time
+  greedy          same matches, scored once per section
+  optimal         maximum-weight assignment over the same scores
+
+Each is run with the inverted index (pure Python) and, when NumPy is
+installed and the section is small enough, the dense matrix.
+
+    python benchmarks/evaluation_matching.py --items 1000
+    python benchmarks/evaluation_matching.py --items 20000 --skip-previous
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import matching
+from src.evaluator import _score_section, best_text_match
+
+def _sections(items: int, seed: int):
+    rng = random.Random(seed)
+    # Vocabulary grows with the gold set, as it does for real corpora
+    words = [f"w{i}" for i in range(max(400, items))]
+    gold = [{"text": " ".join(rng.choices(words, k=rng.randint(5, 12)))} for _ in range(items)]
+    pred = []
+    for g in gold:
+        tokens = g["text"].split()
+        # Drop or swap a word or two, so most predictions still clear the threshold
+        for _ in range(rng.randint(0, 2)):
+            tokens[rng.randrange(len(tokens))] = rng.choice(words)
+        pred.append({"text": " ".join(tokens)})
+    rng.shuffle(pred)
+    return pred, gold
+
+
+def previous_loop(pred, gold, threshold):
+    used, matched = set(), []
+    for p in pred:
+        gi, score = best_text_match(p["text"], gold, used)
+        if gi is not None and score >= threshold:
+            used.add(gi)
+            matched.append((p["text"], gold[gi]["text"], score))
+    return matched
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=500, help="Gold and predicted items. Defaults to 500.")
+    parser.add_argument("--threshold", type=float, default=0.75)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-previous", action="store_true", help="Skip the quadratic previous loop.")
+    args = parser.parse_args()
+
+    pred, gold = _sections(args.items, args.seed)
+    print(f"{args.items} x {args.items} items")
+    reference = None
+    if not args.skip_previous:
+        elapsed, reference = _timed(lambda: previous_loop(pred, gold, args.threshold))
+        print(f"{'previous loop':<24} {elapsed * 1000:9.1f} ms   matched {len(reference)}")
+
+    for backend, engine in (("python", "index"), ("numpy", "dense")):
+        try:
+            matching.set_backend(backend)
+        except ImportError:
+            print(f"{engine:<24} (numpy not installed)")
+            continue
+        if engine == "dense" and args.items * args.items > matching.DENSE_MAX_CELLS:
+            print(f"{engine:<24} (section above DENSE_MAX_CELLS)")
+            continue
+        elapsed, greedy = _timed(lambda: _score_section(pred, gold, args.threshold, greedy=True))
+        if reference is not None:
+            assert [(m["pred"]["text"], m["gold"]["text"], m["text_score"]) for m in greedy["matched"]] == reference
+        print(f"{'greedy (' + engine + ')':<24} {elapsed * 1000:9.1f} ms   matched {len(greedy['matched'])}")
+        elapsed, optimal = _timed(lambda: _score_section(pred, gold, args.threshold))
+        print(f"{'optimal (' + engine + ')':<24} {elapsed * 1000:9.1f} ms   matched {len(optimal['matched'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Reproducible extractor and API throughput on the data/ transcripts, served
+from a recorded cassette instead of live OpenAI calls.
+
+Record once (needs OPENAI_API_KEY):
+    python benchmarks/replay_throughput.py --record
+
+Replay anywhere, e.g. in CI, with simulated upstream latency:
+    python benchmarks/replay_throughput.py --latency lognormal:1.5,0.4 --seed 7
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.services.extractor_service import run_extraction
+from lib.openai_client import AsyncOpenAIClient
+from lib.replay_client import AsyncReplayClient, Cassette
+from src.batch import resolve_transcript_paths
+from src.llm_extractor import LLMExtractor
+
+DEFAULT_CASSETTE = Path(__file__).resolve().parent / "cassettes" / "data.jsonl"
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _report(name: str, latencies: list[float], wall: float) -> None:
+    print(
+        f"{name:<10} {len(latencies):>4} transcripts  {len(latencies) / wall:8.2f}/s  "
+        f"p50 {statistics.median(latencies) * 1000:8.1f} ms  "
+        f"p95 {_percentile(latencies, 95) * 1000:8.1f} ms"
+    )
+
+
+async def _timed(coro) -> float:
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start
+
+
+async def _run(transcripts: list[str], client, concurrency: int, call) -> tuple[list[float], float]:
+    # No cache, so every pass exercises the full client -> validation -> normalization path
+    extractor = LLMExtractor(async_client=client)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(transcript: str) -> float:
+        async with semaphore:
+            return await _timed(call(transcript, extractor))
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(bounded(t) for t in transcripts))
+    return list(latencies), time.perf_counter() - start
+
+
+async def main_async(args) -> None:
+    paths = resolve_transcript_paths(args.data)
+    transcripts = [p.read_text() for p in paths]
+    transcripts = [t for t in transcripts if t.strip()] * args.repeat
+    cassette = Cassette(args.cassette)
+
+    if args.record:
+        client = AsyncReplayClient(cassette, inner=AsyncOpenAIClient(), mode="auto")
+        await _run(transcripts[: len(paths)], client, args.concurrency, lambda t, e: e.aextract(t))
+        await client.aclose()
+        print(f"Cassette has {len(cassette)} recorded completions: {args.cassette}")
+        return
+
+    if not len(cassette):
+        sys.exit(f"Cassette {args.cassette} is empty; record it first with --record.")
+
+    client = AsyncReplayClient(cassette, latency=args.latency, seed=args.seed)
+    print(f"latency={args.latency or 'none'} seed={args.seed} concurrency={args.concurrency}")
+    _report("extractor", *await _run(transcripts, client, args.concurrency, lambda t, e: e.aextract(t)))
+    _report("api", *await _run(transcripts, client, args.concurrency, run_extraction))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data", default="data/", help="Transcript directory, glob or manifest. Defaults to data/.")
+    parser.add_argument("--cassette", default=str(DEFAULT_CASSETTE), help="Cassette JSONL path.")
+    parser.add_argument("--record", action="store_true", help="Record missing completions from the live API.")
+    parser.add_argument("--latency", help="Simulated latency: none, recorded, fixed:S, uniform:A,B, lognormal:M,S.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for sampled latencies. Defaults to 0.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Extractions in flight. Defaults to 8.")
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over the corpus. Defaults to 10.")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
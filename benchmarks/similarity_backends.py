@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Section scoring cost and agreement for each similarity backend on a large
+synthetic gold set:
+
+  token_f1      current scorer (reference)
+  char_jaccard  character trigram Jaccard
+  minhash       MinHash/LSH estimate of char_jaccard
+
+Predictions are gold items with words dropped, swapped or inflected. For
+each backend the benchmark reports scoring time, precision/recall against
+the true pairs, and how often a prediction gets the same gold item (or the
+same "no match") as the token_f1 reference.
+
+    python benchmarks/similarity_backends.py --items 2000
+    python benchmarks/similarity_backends.py --items 20000 --skip char_jaccard
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.evaluator import _score_section
+from src.similarity import DEFAULT_SIMILARITY, SIMILARITIES
+
+
+def _words(count: int, rng: random.Random):
+    # Pronounceable pseudo-words, so character n-grams vary the way they do in prose
+    syllables = [c + v for c in "bcdfghjklmnprstvwz" for v in "aeiou"]
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choices(syllables, k=rng.randint(1, 4))))
+    return sorted(words)
+
+
+def _sections(items: int, seed: int):
+    rng = random.Random(seed)
+    words = _words(max(400, items), rng)
+    gold = [{"text": " ".join(rng.choices(words, k=rng.randint(5, 12)))} for _ in range(items)]
+    pred = []
+    for source, g in enumerate(gold):
+        tokens = g["text"].split()
+        for _ in range(rng.randint(0, 2)):
+            k = rng.randrange(len(tokens))
+            edit = rng.random()
+            if edit < 0.4:
+                tokens[k] += rng.choice(["s", "ed", "ing"])
+            elif edit < 0.7:
+                tokens[k] = rng.choice(words)
+            elif len(tokens) > 1:
+                del tokens[k]
+        pred.append({"text": " ".join(tokens), "source": source})
+    rng.shuffle(pred)
+    return pred, gold
+
+
+def _assignment(result, gold):
+    index = {id(g): j for j, g in enumerate(gold)}
+    return {m["pred"]["source"]: index[id(m["gold"])] for m in result["matched"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=2000, help="Gold and predicted items. Defaults to 2000.")
+    parser.add_argument("--threshold", type=float, default=0.75, help="token_f1 threshold. Defaults to 0.75.")
+    parser.add_argument(
+        "--char-threshold",
+        type=float,
+        default=0.6,
+        help="char_jaccard and minhash threshold; Jaccard runs lower than F1. Defaults to 0.6.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--skip",
+        action="append",
+        default=[],
+        choices=[name for name in SIMILARITIES if name != DEFAULT_SIMILARITY],
+        help="Leave a backend out, e.g. the exact char_jaccard on very large sets.",
+    )
+    args = parser.parse_args()
+
+    pred, gold = _sections(args.items, args.seed)
+    print(f"{args.items} x {args.items} items")
+    print(f"{'similarity':<14} {'threshold':>9} {'time':>11} {'precision':>10} {'recall':>7} {'agreement':>10}")
+
+    reference = None
+    for name in (name for name in SIMILARITIES if name not in args.skip):
+        threshold = args.threshold if name == DEFAULT_SIMILARITY else args.char_threshold
+        start = time.perf_counter()
+        result = _score_section(pred, gold, threshold, similarity=name)
+        elapsed = time.perf_counter() - start
+
+        assigned = _assignment(result, gold)
+        if reference is None:
+            reference = assigned
+        correct = sum(gold_index == source for source, gold_index in assigned.items())
+        precision = correct / len(pred) if pred else 0.0
+        recall = correct / len(gold) if gold else 0.0
+        agreement = sum(assigned.get(p["source"]) == reference.get(p["source"]) for p in pred) / len(pred)
+        print(
+            f"{name:<14} {threshold:>9.2f} {elapsed * 1000:>8.1f} ms {precision:>10.3f} {recall:>7.3f} {agreement:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
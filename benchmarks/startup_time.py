@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Startup cost of the CLI and API entry points, measured in fresh interpreters
+with `python -X importtime`. Exits non-zero when a target imports a module it
+should only load on demand, or when --budget-ms is given and exceeded.
+
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --runs 10 --budget-ms 500
+"""
+import argparse
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# name -> (code run in a fresh interpreter, top-level modules it must not import)
+TARGETS = {
+    "main.py": ("import main", ("openai", "dotenv", "fastapi")),
+    "eval.py": ("import eval", ("openai", "dotenv", "fastapi")),
+    "api.main:create_app": ("from api.main import create_app; create_app()", ("openai",)),
+}
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _run(code: str) -> tuple[float, list[tuple[int, int, str]], set[str]]:
+    probe = f"{code}\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    imports = [
+        (int(self_us), int(cumulative_us), name)
+        for self_us, cumulative_us, _, name in _IMPORTTIME_RE.findall(proc.stderr)
+    ]
+    return wall, imports, set(proc.stdout.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per target. Defaults to 5.")
+    parser.add_argument("--budget-ms", type=float, help="Fail when a target's best import time exceeds this.")
+    parser.add_argument("--top", type=int, default=5, help="Slowest imports to list per target. Defaults to 5.")
+    args = parser.parse_args()
+
+    failures = []
+    for name, (code, forbidden) in TARGETS.items():
+        runs = [_run(code) for _ in range(args.runs)]
+        wall, imports, modules = min(runs, key=lambda run: run[0])
+        total_ms = sum(self_us for self_us, _, _ in imports) / 1000
+        print(f"{name:<22} import {total_ms:8.1f} ms   process {wall * 1000:8.1f} ms (best of {args.runs})")
+        for self_us, cumulative_us, module in sorted(imports, key=lambda i: -i[0])[: args.top]:
+            print(f"    {module:<40} self {self_us / 1000:7.1f} ms   cumulative {cumulative_us / 1000:7.1f} ms")
+
+        loaded = sorted(module for module in forbidden if module in modules)
+        if loaded:
+            failures.append(f"{name} imports {', '.join(loaded)} at startup")
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            failures.append(f"{name} import time {total_ms:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of one /api/extract response for a large model output:
+
+  previous chain  json.loads -> _validate_schema -> ExtractionResult(**data)
+                  -> model_dump() -> ExtractionResponse(**...) -> response_model
+                  re-validation and serialization
+  single pass     OUTPUT_VALIDATOR.validate_json(raw) -> optional-field defaults
+                  -> one JSON serialization
+
+    python benchmarks/validation_chain.py --items 2000
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.models.extraction import ExtractionResponse, ExtractionResult
+from api.models.validation import TranscriptValidationResult
+from api.services.extractor_service import _OPTIONAL_FIELD_DEFAULTS
+from src.llm_extractor import LLMExtractor
+
+
+def _payload(items: int) -> str:
+    def action(i):
+        return {
+            "text": f"Send revised onboarding mocks to design, batch {i}",
+            "owner": "Priya",
+            "due_raw": "by Friday",
+            "due": None,
+            "evidence": f"Priya: I'll update the onboarding screens and share mocks by Friday ({i}).",
+            "needs_human_review": False,
+            "reason": None,
+        }
+
+    def decision(i):
+        return {"text": f"Park the dashboard redesign, item {i}", "evidence": f"Alex: Let's park that ({i})."}
+
+    def follow_up(i):
+        return {
+            "text": f"Schedule a follow-up once mocks are ready, item {i}",
+            "owner": None,
+            "due_raw": None,
+            "due": None,
+            "evidence": f"Alex: we should schedule a follow-up meeting ({i}).",
+        }
+
+    return json.dumps(
+        {
+            "action_items": [action(i) for i in range(items)],
+            "decisions": [decision(i) for i in range(items)],
+            "follow_ups": [follow_up(i) for i in range(items)],
+        }
+    )
+
+
+def previous_chain(raw: str, extractor: LLMExtractor, validation: TranscriptValidationResult) -> bytes:
+    data = json.loads(raw)
+    extractor._validate_schema(data)
+    result = ExtractionResult(**data)
+    response = ExtractionResponse(**result.model_dump(), validation=validation)
+    # What FastAPI does with a returned model when response_model is set
+    return ExtractionResponse.model_validate(response.model_dump()).model_dump_json().encode("utf-8")
+
+
+def single_pass(raw: str, extractor: LLMExtractor, validation: TranscriptValidationResult) -> bytes:
+    data = extractor._parse_output(raw)
+    for section, defaults in _OPTIONAL_FIELD_DEFAULTS.items():
+        for item in data[section]:
+            for name, default in defaults.items():
+                item.setdefault(name, default)
+    return json.dumps({**data, "validation": validation.model_dump()}).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000, help="Items per section. Defaults to 1000.")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per variant. Defaults to 20.")
+    args = parser.parse_args()
+
+    raw = _payload(args.items)
+    extractor = LLMExtractor()
+    validation = TranscriptValidationResult(valid=True)
+    assert json.loads(previous_chain(raw, extractor, validation)) == json.loads(single_pass(raw, extractor, validation))
+
+    print(f"{3 * args.items} items, {len(raw) / 1024:.0f} KiB of model output")
+    results = {}
+    for name, fn in (("previous chain", previous_chain), ("single pass", single_pass)):
+        best = min(timeit.repeat(lambda: fn(raw, extractor, validation), number=1, repeat=args.repeat))
+        results[name] = best
+        print(f"{name:<15} {best * 1000:9.2f} ms")
+    print(f"speedup         {results['previous chain'] / results['single pass']:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,258 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import sys
 
-from src.eval_runner import format_evaluation_report, run_evaluation
+from lib import jsonio
+from src.eval_runner import (
+    DEFAULT_SWEEP,
+    format_evaluation_report,
+    format_sweep_report,
+    parse_threshold_grid,
+    run_evaluation,
+    run_threshold_sweep,
+)
+from src.llm_extractor import LLMExtractor
+from src.run_history import DEFAULT_HISTORY_PATH, RunHistory, compare_runs, format_comparison, history_path_from_env
+from src.similarity import DEFAULT_SIMILARITY, SIMILARITIES
+from src.snapshots import DEFAULT_SNAPSHOT_DIR, SnapshotMiss, snapshot_dir_from_env, with_snapshots
+
+
+async def _run_corpus(args) -> None:
+    # Imported here so single-pair runs keep their startup cost
+    from lib.openai_client import AsyncOpenAIClient, load_env, pool_settings_from_env
+    from lib.rate_limiter import RateLimiter
+    from lib.replay_client import replay_client_from_env
+    from src.corpus_eval import format_corpus_report, load_completed, load_pairs, run_corpus, summarize_corpus
+
+    pairs = load_pairs(args.corpus)
+    if not pairs:
+        print(f"Error: no pairs in manifest: {args.corpus}", file=sys.stderr)
+        sys.exit(1)
+
+    completed = {}
+    if args.resume:
+        if not args.output:
+            print("Error: --resume needs --output.", file=sys.stderr)
+            sys.exit(1)
+        completed = load_completed(args.output, args.threshold, args.greedy, args.similarity)
+        print(f"Resuming: {len(completed)} of {len(pairs)} pairs already scored", file=sys.stderr)
+
+    load_env()
+    limiter = RateLimiter.from_env()
+
+    def pooled_client() -> AsyncOpenAIClient:
+        return AsyncOpenAIClient(rate_limiter=limiter, **pool_settings_from_env())
+
+    # Scoring snapshots makes no model calls, so no client is opened
+    client = None
+    if not args.from_snapshot:
+        client = replay_client_from_env(pooled_client, asynchronous=True) or pooled_client()
+    extractor = with_snapshots(LLMExtractor.from_env(async_client=client), args.snapshot_dir, args.from_snapshot)
+
+    def progress(done: int, total: int, record: dict) -> None:
+        status = "ok" if record["ok"] else f"error: {record['error']}"
+        print(f"[{done}/{total}] {record['transcript_path']} {status}", file=sys.stderr)
+
+    out = open(args.output, "a" if args.resume else "w") if args.output else sys.stdout
+    try:
+        records = await run_corpus(
+            pairs,
+            extractor,
+            out,
+            concurrency=args.concurrency,
+            workers=args.workers,
+            text_threshold=args.threshold,
+            greedy=args.greedy,
+            similarity=args.similarity,
+            completed=completed,
+            progress=progress,
+        )
+    finally:
+        if args.output:
+            out.close()
+        if client is not None:
+            await client.aclose()
+
+    summary = summarize_corpus(records, bootstrap_samples=args.bootstrap, seed=args.seed)
+    print(format_corpus_report(summary), file=sys.stderr if not args.output else sys.stdout)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Run extraction against a labeled transcript and report evaluation metrics."
     )
-    parser.add_argument("transcript_path", help="Path to the transcript text file.")
-    parser.add_argument("gold_path", help="Path to the gold JSON file.")
+    parser.add_argument("transcript_path", nargs="?", help="Path to the transcript text file.")
+    parser.add_argument("gold_path", nargs="?", help="Path to the gold JSON file.")
     parser.add_argument(
         "--threshold",
         type=float,
         default=0.75,
         help="Minimum text similarity threshold for a match. Defaults to 0.75.",
     )
+    parser.add_argument(
+        "--greedy",
+        action="store_true",
+        help="Match each prediction in order to its best unused gold item instead of by optimal assignment.",
+    )
+    parser.add_argument(
+        "--similarity",
+        choices=SIMILARITIES,
+        default=DEFAULT_SIMILARITY,
+        help="Text similarity used to match items: token F1, character trigram Jaccard, "
+        f"or its MinHash/LSH approximation for very large gold sets. Defaults to {DEFAULT_SIMILARITY}.",
+    )
+    parser.add_argument(
+        "--corpus",
+        metavar="MANIFEST",
+        help='.json/.jsonl manifest of {"transcript": ..., "gold": ...} pairs to evaluate together.',
+    )
+    parser.add_argument("--output", help="With --corpus, write one JSONL record per pair here instead of stdout.")
+    parser.add_argument("--resume", action="store_true", help="With --corpus, skip pairs already scored in --output.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum extractions in flight in corpus mode. Defaults to 8.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Scoring processes in corpus mode; 0 scores in the main process. Defaults to 0.",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=1000,
+        help="Bootstrap samples for corpus confidence intervals; 0 disables them. Defaults to 1000.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Bootstrap seed. Defaults to 0.")
+    parser.add_argument(
+        "--sweep",
+        nargs="?",
+        const=DEFAULT_SWEEP,
+        metavar="GRID",
+        help=f'Score one extraction at every threshold in GRID ("start:stop:step" or "0.6,0.7,0.8") '
+        f"instead of at --threshold. Defaults to {DEFAULT_SWEEP}.",
+    )
+    parser.add_argument("--pr-curve", metavar="PATH", help="With --sweep, also write the points as JSON here.")
+    parser.add_argument(
+        "--from-snapshot",
+        action="store_true",
+        help="Score the stored prediction snapshot for the current prompt version and model instead of calling the model.",
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        nargs="?",
+        const=DEFAULT_SNAPSHOT_DIR,
+        default=snapshot_dir_from_env(),
+        metavar="DIR",
+        help=f"Record each prediction as a snapshot in DIR ({DEFAULT_SNAPSHOT_DIR} if omitted), or read it from "
+        "there with --from-snapshot. Defaults to EVAL_SNAPSHOT_DIR; snapshots are off when neither is set.",
+    )
+    parser.add_argument(
+        "--history",
+        nargs="?",
+        const=DEFAULT_HISTORY_PATH,
+        metavar="PATH",
+        help=f"Record the run's metrics, timings and token usage in a SQLite file ({DEFAULT_HISTORY_PATH} "
+        "if omitted). Defaults to EVAL_HISTORY_PATH; runs are not recorded when neither is set. "
+        "Single-pair runs only.",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const="previous",
+        metavar="RUN_ID",
+        help="After the run, compare it with RUN_ID from --history, or by default with the previous run "
+        "of the same pair, and flag latency and cost regressions. Single-pair runs only.",
+    )
     args = parser.parse_args()
 
+    if args.sweep or args.corpus:
+        given = [flag for flag, value in (("--history", args.history), ("--compare", args.compare)) if value]
+        if given:
+            mode = "--sweep" if args.sweep else "--corpus"
+            parser.error(f"{' and '.join(given)} cannot be used with {mode}; run history covers single-pair runs only.")
+    args.history = args.history or history_path_from_env()
+    if args.compare and not args.history:
+        parser.error("--compare needs --history or EVAL_HISTORY_PATH.")
+    if args.compare not in (None, "previous") and not args.compare.isdigit():
+        parser.error(f"--compare takes a run id, got {args.compare!r}.")
+    if args.from_snapshot and not args.snapshot_dir:
+        print("Error: --from-snapshot needs --snapshot-dir or EVAL_SNAPSHOT_DIR.", file=sys.stderr)
+        sys.exit(1)
+    if args.corpus:
+        asyncio.run(_run_corpus(args))
+        return
+    if not (args.transcript_path and args.gold_path):
+        parser.print_usage(sys.stderr)
+        sys.exit(1)
+
+    extractor = with_snapshots(LLMExtractor.from_env(), args.snapshot_dir, args.from_snapshot)
+    try:
+        _evaluate(args, extractor)
+    except SnapshotMiss as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _evaluate(args, extractor) -> None:
+    if args.sweep:
+        try:
+            thresholds = parse_threshold_grid(args.sweep)
+        except ValueError as exc:
+            print(f"Error: invalid --sweep grid {args.sweep!r}: {exc}", file=sys.stderr)
+            sys.exit(1)
+        sweep = run_threshold_sweep(
+            transcript_path=args.transcript_path,
+            gold_path=args.gold_path,
+            thresholds=thresholds,
+            extractor=extractor,
+            greedy=args.greedy,
+            similarity=args.similarity,
+        )
+        if args.pr_curve:
+            with open(args.pr_curve, "w") as f:
+                f.write(jsonio.dumps(sweep))
+        print(format_sweep_report(sweep))
+        return
+
     result = run_evaluation(
         transcript_path=args.transcript_path,
         gold_path=args.gold_path,
         text_threshold=args.threshold,
+        extractor=extractor,
+        greedy=args.greedy,
+        similarity=args.similarity,
     )
     print(format_evaluation_report(result))
+    if args.history:
+        _record_history(args, extractor, result)
+
+
+def _record_history(args, extractor, result) -> None:
+    history = RunHistory(args.history)
+    try:
+        run = history.record(
+            result,
+            model=extractor.model,
+            prompt_version=extractor.prompt_version(),
+            source="snapshot" if args.from_snapshot else "model",
+        )
+        if not args.compare:
+            return
+        if args.compare == "previous":
+            baseline = history.previous(run)
+            missing = "no earlier run of this pair to compare with"
+        else:
+            baseline = history.get(int(args.compare))
+            missing = f"no run {args.compare} in {args.history}"
+        print()
+        print(format_comparison(compare_runs(baseline, run)) if baseline else f"Run #{run['id']}: {missing}.")
+    finally:
+        history.close()
 
 
 if __name__ == "__main__":
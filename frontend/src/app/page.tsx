@@ -1,7 +1,7 @@
 "use client";
 
 import { useState } from "react";
-import { extractTranscript, ExtractionApiError } from "@/lib/api";
+import { extractTranscriptStream, ExtractionApiError } from "@/lib/api";
 import { ExtractionResponse, ValidationErrorDetail } from "@/types/extraction";
 import UploadForm from "@/components/UploadForm";
 import ResultsPanel from "@/components/ResultsPanel";
@@ -11,7 +11,7 @@ import ErrorAlert from "@/components/ErrorAlert";
 type AppState =
   | { status: "idle" }
   | { status: "loading" }
-  | { status: "success"; data: ExtractionResponse }
+  | { status: "success"; data: ExtractionResponse; streaming: boolean }
   | { status: "error"; message: string; validationErrors?: string[] };
 
 const EXAMPLE_LINES: { type: string; text: string }[] = [
@@ -70,9 +70,25 @@ export default function Home() {
 
   async function handleSubmit(file: File) {
     setState({ status: "loading" });
+    let data = null as ExtractionResponse | null;
     try {
-      const data = await extractTranscript(file);
-      setState({ status: "success", data });
+      // Render items as they stream in instead of waiting for the full completion
+      await extractTranscriptStream(file, (event) => {
+        if (event.event === "validation") {
+          data = { action_items: [], decisions: [], follow_ups: [], validation: event.validation };
+        } else if (event.event === "item" && data) {
+          data = {
+            ...data,
+            [event.section]: [...data[event.section], event.item],
+          } as ExtractionResponse;
+        } else {
+          return;
+        }
+        setState({ status: "success", data, streaming: true });
+      });
+      if (data) {
+        setState({ status: "success", data, streaming: false });
+      }
     } catch (err) {
       if (err instanceof ExtractionApiError) {
         const detail = err.detail;
@@ -595,6 +611,7 @@ export default function Home() {
           {state.status === "success" && (
             <>
               <ResultsPanel data={state.data} />
+              {state.streaming && <LoadingSpinner />}
               <button
                 onClick={handleReset}
                 className="w-full rounded-lg border px-4 py-2 text-sm font-medium text-slate-300 transition-colors hover:text-white"
@@ -1,4 +1,8 @@
-import { ExtractionResponse, ValidationErrorDetail } from "@/types/extraction";
+import {
+  ExtractionResponse,
+  ExtractionStreamEvent,
+  ValidationErrorDetail,
+} from "@/types/extraction";
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL ?? "http://localhost:8000";
 
@@ -18,6 +22,17 @@ export class ExtractionApiError extends Error {
   }
 }
 
+async function toApiError(res: Response): Promise<ExtractionApiError> {
+  let detail: ValidationErrorDetail | string;
+  try {
+    const json = await res.json();
+    detail = json.detail ?? json;
+  } catch {
+    detail = await res.text();
+  }
+  return new ExtractionApiError(res.status, detail);
+}
+
 export async function extractTranscript(
   file: File
 ): Promise<ExtractionResponse> {
@@ -31,15 +46,49 @@ export async function extractTranscript(
   });
 
   if (!res.ok) {
-    let detail: ValidationErrorDetail | string;
-    try {
-      const json = await res.json();
-      detail = json.detail ?? json;
-    } catch {
-      detail = await res.text();
-    }
-    throw new ExtractionApiError(res.status, detail);
+    throw await toApiError(res);
   }
 
   return res.json() as Promise<ExtractionResponse>;
 }
+
+/**
+ * Streams /api/extract/stream (NDJSON) and calls onEvent for every line, so
+ * items can be rendered as soon as the model finishes each one.
+ */
+export async function extractTranscriptStream(
+  file: File,
+  onEvent: (event: ExtractionStreamEvent) => void
+): Promise<void> {
+  const form = new FormData();
+  form.append("file", file);
+
+  const res = await fetch(`${API_URL}/api/extract/stream`, {
+    method: "POST",
+    body: form,
+  });
+
+  if (!res.ok || !res.body) {
+    throw await toApiError(res);
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffered = "";
+
+  for (;;) {
+    const { value, done } = await reader.read();
+    buffered += decoder.decode(value, { stream: !done });
+    const lines = buffered.split("\n");
+    buffered = lines.pop() ?? "";
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      const event = JSON.parse(line) as ExtractionStreamEvent;
+      if (event.event === "error") {
+        throw new ExtractionApiError(event.status_code, event.detail);
+      }
+      onEvent(event);
+    }
+    if (done) break;
+  }
+}
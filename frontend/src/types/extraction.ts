@@ -41,3 +41,14 @@ export interface ValidationErrorDetail {
   errors: string[];
   warnings: string[];
 }
+
+export type ExtractionSection = "action_items" | "decisions" | "follow_ups";
+
+export type ExtractionStreamEvent =
+  | { event: "validation"; validation: TranscriptValidationResult }
+  | { event: "item"; section: "action_items"; index: number; item: ActionItem }
+  | { event: "item"; section: "decisions"; index: number; item: Decision }
+  | { event: "item"; section: "follow_ups"; index: number; item: FollowUp }
+  | { event: "invalid_item"; section: ExtractionSection; index: number; error: string }
+  | { event: "error"; status_code: number; detail: string }
+  | { event: "done" };
@@ -0,0 +1,72 @@
+import json
+import os
+from typing import Any
+
+# One switch for every hot JSON path (API responses, gold files, JSONL output):
+#   JSON_BACKEND=auto    orjson when installed, stdlib json otherwise (default)
+#   JSON_BACKEND=orjson  require orjson
+#   JSON_BACKEND=stdlib  always use the standard library
+JSON_BACKENDS = ("auto", "orjson", "stdlib")
+
+# orjson.JSONDecodeError subclasses this, so callers catch one type for either backend
+JSONDecodeError = json.JSONDecodeError
+
+_orjson = None
+
+
+def _select_backend(name: str) -> str:
+    global _orjson
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"JSON_BACKEND must be one of {JSON_BACKENDS}.")
+    if name == "stdlib":
+        _orjson = None
+        return "stdlib"
+    try:
+        import orjson
+    except ImportError:
+        if name == "orjson":
+            raise
+        _orjson = None
+        return "stdlib"
+    _orjson = orjson
+    return "orjson"
+
+
+def set_backend(name: str) -> str:
+    """
+    Switch backends at runtime (tests and benchmarks); returns the backend in use.
+    """
+    global BACKEND
+    BACKEND = _select_backend(name)
+    return BACKEND
+
+
+BACKEND = _select_backend(os.getenv("JSON_BACKEND", "auto"))
+
+
+def loads(data: str | bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumpb(obj: Any) -> bytes:
+    """
+    Compact UTF-8 JSON bytes, as sent in HTTP responses.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def dumps_line(obj: Any) -> str:
+    """
+    One JSONL record, newline included.
+    """
+    return dumps(obj) + "\n"
@@ -1,34 +1,164 @@
-from openai import OpenAI
+# The openai SDK and python-dotenv are imported on first use, not at module import:
+# the SDK alone takes most of a second to import, which CLI paths such as --help,
+# bulk ingest and evaluation-only runs never need.
+import asyncio
 import os
-from dotenv import load_dotenv
+import time
+from contextlib import asynccontextmanager
+
+from lib import usage
+from lib.rate_limiter import RateLimiter, is_retryable_error, retry_delay
+from lib.tokens import estimate_request_tokens
+
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# The SDK's own default; with a rate limiter attached the clients make these retries themselves
+DEFAULT_MAX_RETRIES = 2
+
+_env_loaded = False
+
+
+def load_env() -> None:
+    # Load .env into the environment once, before the first setting is read from it
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
+
+
+def _resolve_api_key(api_key: str | None) -> str:
+    load_env()
+
+    # Use the provided API key or fall back to the environment variable
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+
+    # Ensure that api key was provided
+    if not api_key:
+        raise ValueError("API key must be provided either as an argument or in the environment variable 'OPENAI_API_KEY'.")
+    return api_key
+
+
+def pool_settings_from_env() -> dict:
+    """
+    Connection pool settings for a long-lived client:
+      OPENAI_MAX_CONNECTIONS, OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+      OPENAI_KEEPALIVE_EXPIRY, OPENAI_TIMEOUT, OPENAI_CONNECT_TIMEOUT
+    """
+    load_env()
+    return {
+        "max_connections": int(os.getenv("OPENAI_MAX_CONNECTIONS", 100)),
+        "max_keepalive_connections": int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", 20)),
+        "keepalive_expiry": float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", 30.0)),
+        "timeout": float(os.getenv("OPENAI_TIMEOUT", 60.0)),
+        "connect_timeout": float(os.getenv("OPENAI_CONNECT_TIMEOUT", 5.0)),
+    }
+
+
+def _http_client_kwargs(
+    max_connections: int | None,
+    max_keepalive_connections: int | None,
+    keepalive_expiry: float | None,
+    timeout: float | None,
+    connect_timeout: float | None,
+) -> dict:
+    # Keep the SDK defaults unless the caller set at least one pool or timeout option
+    settings = (max_connections, max_keepalive_connections, keepalive_expiry, timeout, connect_timeout)
+    if all(value is None for value in settings):
+        return {}
+    from openai import DEFAULT_CONNECTION_LIMITS, Timeout
+
+    def given(value, default):
+        # An explicit 0 (e.g. keepalive_expiry=0 to turn keep-alive off) is kept, not defaulted
+        return default if value is None else value
+
+    # The SDK's httpx Limits type, so the pool config always matches the installed httpx
+    limits = type(DEFAULT_CONNECTION_LIMITS)(
+        max_connections=given(max_connections, DEFAULT_CONNECTION_LIMITS.max_connections),
+        max_keepalive_connections=given(max_keepalive_connections, DEFAULT_CONNECTION_LIMITS.max_keepalive_connections),
+        keepalive_expiry=given(keepalive_expiry, DEFAULT_CONNECTION_LIMITS.keepalive_expiry),
+    )
+    return {"limits": limits, "timeout": Timeout(given(timeout, 60.0), connect=given(connect_timeout, 5.0))}
+
+
+def _total_tokens(response) -> int | None:
+    return getattr(getattr(response, "usage", None), "total_tokens", None)
 
-load_dotenv()
 
 class OpenAIClient:
 
-    # Initialize the OpenAI client with the provided API key
-    def __init__(self, api_key: str | None = None):
-        # Use the provided API key or fall back to the environment variable
-        api_key = api_key or os.getenv("OPENAI_API_KEY")
+    # Initialize the OpenAI client with the provided API key and default sampling settings.
+    # Pool settings size the keep-alive HTTP pool; one instance is safe to share across threads.
+    def __init__(self,
+                 api_key: str | None = None,
+                 model: str = DEFAULT_MODEL,
+                 temperature: float = 0.0,
+                 max_connections: int | None = None,
+                 max_keepalive_connections: int | None = None,
+                 keepalive_expiry: float | None = None,
+                 timeout: float | None = None,
+                 connect_timeout: float | None = None,
+                 rate_limiter: RateLimiter | None = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+        ):
+        from openai import DefaultHttpxClient, OpenAI
+
+        http_kwargs = _http_client_kwargs(
+            max_connections, max_keepalive_connections, keepalive_expiry, timeout, connect_timeout
+        )
+        self.client = OpenAI(
+            api_key=_resolve_api_key(api_key),
+            http_client=DefaultHttpxClient(**http_kwargs) if http_kwargs else None,
+            # Behind a limiter the SDK must not retry on its own: every attempt, and every 429,
+            # has to pass through the limiter so its buckets and concurrency window stay honest
+            max_retries=0 if rate_limiter is not None else max_retries,
+        )
+        self.model = model
+        self.temperature = temperature
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+
+    # Close the underlying connection pool
+    def close(self) -> None:
+        self.client.close()
 
-        # Ensure that api key was provided
-        if not api_key:
-            raise ValueError("API key must be provided either as an argument or in the environment variable 'OPENAI_API_KEY'.")
+    # Create one completion. Behind a rate limiter each attempt is admitted separately, rate limits
+    # and transient errors are retried with backoff, and the TPM reservation is settled from usage.
+    def _create(self, **request):
+        if self.rate_limiter is None:
+            start = time.perf_counter()
+            response = self.client.chat.completions.create(**request)
+            usage.record_call(time.perf_counter() - start, response.usage)
+            return response
 
-        self.client = OpenAI(api_key=api_key)
+        reserved = estimate_request_tokens(request["messages"])
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.rate_limiter.limit(reserved):
+                    start = time.perf_counter()
+                    response = self.client.chat.completions.create(**request)
+            except Exception as exc:
+                if attempt == self.max_retries or not is_retryable_error(exc):
+                    raise
+                time.sleep(retry_delay(attempt))
+                continue
+            self.rate_limiter.reconcile(reserved, _total_tokens(response))
+            usage.record_call(time.perf_counter() - start, response.usage)
+            return response
 
     # Method to create a chat completion using the OpenAI client
-    def chat_completion(self, 
-                        messages: list[dict], 
-                        model: str = "gpt-4o-mini", 
-                        temperature: float = 0.0,
+    def chat_completion(self,
+                        messages: list[dict],
+                        model: str | None = None,
+                        temperature: float | None = None,
                         response_format: dict | None = None
         ):
-        
-        # Generate a chat completion using the OpenAI client with the specified parameters
-        response = self.client.chat.completions.create(
-            model=model,
-            temperature=temperature,
+
+        # Generate a chat completion; latency and token usage go to the caller's usage meter, if any
+        response = self._create(
+            model=model or self.model,
+            temperature=self.temperature if temperature is None else temperature,
             messages=messages,
             response_format=response_format,
         )
@@ -36,3 +166,125 @@ class OpenAIClient:
         # Return the content of the first message in the response choices
         return response.choices[0].message.content
 
+
+class AsyncOpenAIClient:
+
+    # Initialize the async OpenAI client; calls are awaited so they never block the event loop
+    def __init__(self,
+                 api_key: str | None = None,
+                 model: str = DEFAULT_MODEL,
+                 temperature: float = 0.0,
+                 max_connections: int | None = None,
+                 max_keepalive_connections: int | None = None,
+                 keepalive_expiry: float | None = None,
+                 timeout: float | None = None,
+                 connect_timeout: float | None = None,
+                 rate_limiter: RateLimiter | None = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+        ):
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+        http_kwargs = _http_client_kwargs(
+            max_connections, max_keepalive_connections, keepalive_expiry, timeout, connect_timeout
+        )
+        self.client = AsyncOpenAI(
+            api_key=_resolve_api_key(api_key),
+            http_client=DefaultAsyncHttpxClient(**http_kwargs) if http_kwargs else None,
+            # Behind a limiter the SDK must not retry on its own: every attempt, and every 429,
+            # has to pass through the limiter so its buckets and concurrency window stay honest
+            max_retries=0 if rate_limiter is not None else max_retries,
+        )
+        self.model = model
+        self.temperature = temperature
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+
+    # Close the underlying connection pool
+    async def aclose(self) -> None:
+        await self.client.close()
+
+    # Wait for the shared rate limiter, if any, to admit a call with these messages
+    @asynccontextmanager
+    async def _admit(self, messages: list[dict]):
+        if self.rate_limiter is None:
+            yield
+            return
+        async with self.rate_limiter.alimit(estimate_request_tokens(messages)):
+            yield
+
+    # Async counterpart of OpenAIClient._create
+    async def _create(self, **request):
+        if self.rate_limiter is None:
+            start = time.perf_counter()
+            response = await self.client.chat.completions.create(**request)
+            usage.record_call(time.perf_counter() - start, response.usage)
+            return response
+
+        reserved = estimate_request_tokens(request["messages"])
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.rate_limiter.alimit(reserved):
+                    start = time.perf_counter()
+                    response = await self.client.chat.completions.create(**request)
+            except Exception as exc:
+                if attempt == self.max_retries or not is_retryable_error(exc):
+                    raise
+                await asyncio.sleep(retry_delay(attempt))
+                continue
+            self.rate_limiter.reconcile(reserved, _total_tokens(response))
+            usage.record_call(time.perf_counter() - start, response.usage)
+            return response
+
+    # Coroutine counterpart of OpenAIClient.chat_completion with the same signature
+    async def chat_completion(self,
+                              messages: list[dict],
+                              model: str | None = None,
+                              temperature: float | None = None,
+                              response_format: dict | None = None
+        ):
+
+        response = await self._create(
+            model=model or self.model,
+            temperature=self.temperature if temperature is None else temperature,
+            messages=messages,
+            response_format=response_format,
+        )
+
+        return response.choices[0].message.content
+
+    # Stream a chat completion, yielding content deltas as they arrive
+    async def chat_completion_stream(self,
+                                     messages: list[dict],
+                                     model: str | None = None,
+                                     temperature: float | None = None,
+                                     response_format: dict | None = None
+        ):
+
+        for attempt in range(self.max_retries + 1):
+            yielded = False
+            try:
+                # The call holds its limiter slot until the stream is fully consumed
+                async with self._admit(messages):
+                    start = time.perf_counter()
+                    stream = await self.client.chat.completions.create(
+                        model=model or self.model,
+                        temperature=self.temperature if temperature is None else temperature,
+                        messages=messages,
+                        response_format=response_format,
+                        stream=True,
+                    )
+                    async for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            yielded = True
+                            yield chunk.choices[0].delta.content
+            except Exception as exc:
+                # Deltas already handed out cannot be taken back, so only a failed start is retried;
+                # without a limiter the SDK has already retried it
+                retry = self.rate_limiter is not None and not yielded and is_retryable_error(exc)
+                if not retry or attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(retry_delay(attempt))
+                continue
+            # Streams carry no usage block unless asked for, so only the latency is recorded
+            usage.record_call(time.perf_counter() - start)
+            return
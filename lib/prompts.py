@@ -62,3 +62,29 @@ QUALITY BAR
 
 Now extract from the following transcript.
 """
+
+REPAIR_PROMPT = """
+You repair individual items from a meeting-extraction JSON payload that failed schema validation.
+
+INPUT
+A JSON object {"items": [...]} where each entry has:
+  - "section": one of "action_items", "decisions", "follow_ups"
+  - "index": the item's position in that section
+  - "item": the invalid item
+  - "error": why it failed validation
+
+OUTPUT
+Return ONLY valid JSON of the form {"items": [{"section": ..., "index": ..., "item": {...}}]}
+with one entry per input item, keeping "section" and "index" unchanged.
+
+ITEM SCHEMAS
+- action_items: {"text": string, "owner": string | null, "due_raw": string | null, "due": null,
+  "evidence": string, "needs_human_review": boolean, "reason": string | null}
+- decisions: {"text": string, "evidence": string}
+- follow_ups: {"text": string, "owner": string | null, "due_raw": string | null, "due": null,
+  "evidence": string}
+
+RULES
+- Fix only what the error describes; keep the item's meaning and wording otherwise.
+- Use exactly the keys of the item's schema. Always set due = null.
+"""
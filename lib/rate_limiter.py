@@ -0,0 +1,243 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+
+class TokenBucket:
+    """
+    Refills continuously at capacity_per_minute / 60 units per second, up to
+    capacity_per_minute. Not thread-safe on its own; RateLimiter guards it.
+    """
+
+    def __init__(self, capacity_per_minute: float):
+        if capacity_per_minute <= 0:
+            raise ValueError("capacity_per_minute must be positive.")
+        self.capacity = float(capacity_per_minute)
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.available = min(self.capacity, self.available + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        self._refill(now)
+        # A request larger than the whole bucket is admitted once the bucket is full
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.available -= min(amount, self.capacity)
+
+    def give_back(self, amount: float, now: float) -> None:
+        # A negative amount charges more; the debt delays later callers until refilled
+        self._refill(now)
+        self.available = min(self.capacity, self.available + amount)
+
+
+class RateLimiter:
+    """
+    Admission control for LLM calls shared by every client in the process.
+
+    Each call is admitted through a requests-per-minute bucket and a
+    tokens-per-minute bucket (either may be None for "unlimited") and a
+    concurrency window. The window grows by one slot after a full window of
+    successful calls and halves whenever the upstream answers with a rate
+    limit (AIMD), so the limiter backs off quickly and recovers slowly.
+    Works from threads (acquire) and from asyncio (aacquire).
+    """
+
+    def __init__(
+        self,
+        rpm: float | None = None,
+        tpm: float | None = None,
+        max_concurrency: int = 32,
+        min_concurrency: int = 1,
+        poll_interval: float = 0.05,
+    ):
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError("Require 1 <= min_concurrency <= max_concurrency.")
+        self._requests = TokenBucket(rpm) if rpm else None
+        self._tokens = TokenBucket(tpm) if tpm else None
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.poll_interval = poll_interval
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._waiting = 0
+        self._lock = threading.Lock()
+        self.admitted = 0
+        self.rate_limited = 0
+        self.total_wait_seconds = 0.0
+        # Sum of (reported - reserved) tokens over reconciled calls
+        self.token_estimate_drift = 0
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter | None":
+        """
+        Limiter from OPENAI_RPM, OPENAI_TPM and OPENAI_MAX_CONCURRENCY, or
+        None when none of them is set.
+        """
+        rpm = os.getenv("OPENAI_RPM")
+        tpm = os.getenv("OPENAI_TPM")
+        concurrency = os.getenv("OPENAI_MAX_CONCURRENCY")
+        if not (rpm or tpm or concurrency):
+            return None
+        return cls(
+            rpm=float(rpm) if rpm else None,
+            tpm=float(tpm) if tpm else None,
+            max_concurrency=int(concurrency) if concurrency else 32,
+        )
+
+    def _try_admit(self, tokens: int) -> float:
+        """
+        Admit the call and return 0.0, or return how long to wait before
+        trying again.
+        """
+        with self._lock:
+            if self._in_flight >= int(self._limit):
+                return self.poll_interval
+            now = time.monotonic()
+            wait = 0.0
+            if self._requests is not None:
+                wait = max(wait, self._requests.wait_time(1, now))
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.wait_time(tokens, now))
+            if wait > 0:
+                return wait
+            if self._requests is not None:
+                self._requests.take(1)
+            if self._tokens is not None:
+                self._tokens.take(tokens)
+            self._in_flight += 1
+            self.admitted += 1
+            return 0.0
+
+    def _enqueue(self) -> float:
+        with self._lock:
+            self._waiting += 1
+        return time.monotonic()
+
+    def _dequeue(self, started: float) -> None:
+        with self._lock:
+            self._waiting -= 1
+            self.total_wait_seconds += time.monotonic() - started
+
+    def acquire(self, tokens: int) -> None:
+        started = self._enqueue()
+        try:
+            while (wait := self._try_admit(tokens)) > 0:
+                time.sleep(min(wait, 1.0))
+        finally:
+            self._dequeue(started)
+
+    async def aacquire(self, tokens: int) -> None:
+        started = self._enqueue()
+        try:
+            while (wait := self._try_admit(tokens)) > 0:
+                await asyncio.sleep(min(wait, 1.0))
+        finally:
+            self._dequeue(started)
+
+    def release(self, rate_limited: bool = False) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if rate_limited:
+                self.rate_limited += 1
+                self._limit = max(float(self.min_concurrency), self._limit / 2)
+            else:
+                self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+
+    @contextmanager
+    def limit(self, tokens: int):
+        self.acquire(tokens)
+        rate_limited = False
+        try:
+            yield
+        except Exception as exc:
+            rate_limited = is_rate_limit_error(exc)
+            raise
+        finally:
+            self.release(rate_limited)
+
+    @asynccontextmanager
+    async def alimit(self, tokens: int):
+        await self.aacquire(tokens)
+        rate_limited = False
+        try:
+            yield
+        except Exception as exc:
+            rate_limited = is_rate_limit_error(exc)
+            raise
+        finally:
+            self.release(rate_limited)
+
+    def reconcile(self, reserved: int, used: int | None) -> None:
+        """
+        Replace the TPM reservation made at admission (prompt estimate plus
+        completion reserve) with the tokens the API reported, so estimation
+        error does not accumulate in the bucket under load.
+        """
+        if used is None or self._tokens is None:
+            return
+        with self._lock:
+            charged = min(reserved, self._tokens.capacity)
+            self._tokens.give_back(charged - used, time.monotonic())
+            self.token_estimate_drift += used - reserved
+
+    def stats(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            if self._requests is not None:
+                self._requests.wait_time(0, now)
+            if self._tokens is not None:
+                self._tokens.wait_time(0, now)
+            return {
+                "requests_available": self._requests.available if self._requests else None,
+                "tokens_available": self._tokens.available if self._tokens else None,
+                "concurrency_limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "queue_depth": self._waiting,
+                "admitted": self.admitted,
+                "rate_limited": self.rate_limited,
+                "total_wait_seconds": self.total_wait_seconds,
+                "mean_wait_seconds": self.total_wait_seconds / self.admitted if self.admitted else 0.0,
+                "token_estimate_drift": self.token_estimate_drift,
+            }
+
+
+def is_rate_limit_error(exc: Exception) -> bool:
+    # openai.RateLimitError and any HTTP-style error carrying a 429 status
+    return type(exc).__name__ == "RateLimitError" or getattr(exc, "status_code", None) == 429
+
+
+# Errors worth another attempt, as the SDK's own retry policy has them
+RETRYABLE_STATUS_CODES = (408, 409, 429)
+RETRYABLE_ERROR_NAMES = ("APIConnectionError", "APITimeoutError")
+
+
+def is_retryable_error(exc: Exception) -> bool:
+    status = getattr(exc, "status_code", None)
+    return (
+        is_rate_limit_error(exc)
+        or type(exc).__name__ in RETRYABLE_ERROR_NAMES
+        or status in RETRYABLE_STATUS_CODES
+        or (isinstance(status, int) and status >= 500)
+    )
+
+
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+
+def retry_delay(attempt: int) -> float:
+    """
+    Jittered exponential backoff before retry number attempt + 1.
+    """
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.75, 1.0)
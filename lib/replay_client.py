@@ -0,0 +1,279 @@
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from lib import usage
+from lib.openai_client import DEFAULT_MODEL, load_env
+
+CASSETTE_MODES = ("replay", "record", "auto")
+
+# Replayed streams are cut into deltas of this many characters
+STREAM_CHUNK_CHARS = 16
+
+
+class CassetteMiss(LookupError):
+    pass
+
+
+def request_key(
+    messages: list[dict],
+    model: str,
+    temperature: float,
+    response_format: dict | None,
+) -> str:
+    """
+    Content hash of everything that determines a completion.
+    """
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "messages": messages,
+            "response_format": response_format,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def latency_sampler(spec: str | None, seed: int | None = None) -> Callable[[float], float]:
+    """
+    Build a function mapping a recorded latency to a simulated one:
+      none              no delay (default)
+      recorded          sleep as long as the original call took
+      fixed:S           always S seconds
+      uniform:A,B       uniformly between A and B seconds
+      lognormal:M,S     log-normal with median M seconds and shape S
+    A seed makes the sampled sequence reproducible.
+    """
+    rng = random.Random(seed)
+    name, _, args = (spec or "none").partition(":")
+    params = [float(p) for p in args.split(",")] if args else []
+    if name == "none":
+        return lambda recorded: 0.0
+    if name == "recorded":
+        return lambda recorded: recorded
+    if name == "fixed" and len(params) == 1:
+        return lambda recorded: params[0]
+    if name == "uniform" and len(params) == 2:
+        return lambda recorded: rng.uniform(params[0], params[1])
+    if name == "lognormal" and len(params) == 2:
+        return lambda recorded: rng.lognormvariate(math.log(params[0]), params[1])
+    raise ValueError(f"Unknown latency spec: {spec!r}")
+
+
+class Cassette:
+    """
+    Append-only JSONL file of recorded completions keyed by request_key().
+    Each line is {"key", "response", "latency_seconds"}; later lines win.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.entries: dict[str, dict] = {}
+        if self.path.exists():
+            with self.path.open() as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.entries[entry["key"]] = entry
+
+    def get(self, key: str) -> dict | None:
+        return self.entries.get(key)
+
+    def add(self, key: str, response: str, latency_seconds: float) -> None:
+        entry = {"key": key, "response": response, "latency_seconds": round(latency_seconds, 4)}
+        with self._lock:
+            self.entries[key] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class _ReplayBase:
+
+    # mode "replay" only serves the cassette, "record" always calls the inner client and
+    # stores the result, and "auto" replays hits and records misses
+    def __init__(self,
+                 cassette: str | Path | Cassette,
+                 inner=None,
+                 mode: str = "replay",
+                 latency: str | None = None,
+                 seed: int | None = None,
+                 model: str | None = None,
+                 temperature: float | None = None,
+        ):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"mode must be one of {CASSETTE_MODES}.")
+        if mode != "replay" and inner is None:
+            raise ValueError(f"mode '{mode}' needs an inner client to record from.")
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        self.inner = inner
+        self.mode = mode
+        self.simulate_latency = latency_sampler(latency, seed)
+        self.model = model or getattr(inner, "model", DEFAULT_MODEL)
+        self.temperature = temperature if temperature is not None else getattr(inner, "temperature", 0.0)
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, messages, model, temperature, response_format) -> str:
+        return request_key(
+            messages,
+            model or self.model,
+            self.temperature if temperature is None else temperature,
+            response_format,
+        )
+
+    def _lookup(self, key: str) -> dict | None:
+        entry = None if self.mode == "record" else self.cassette.get(key)
+        if entry is None and self.mode == "replay":
+            raise CassetteMiss(f"No recorded completion for request {key[:12]} in {self.cassette.path}")
+        if entry is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+
+class ReplayClient(_ReplayBase):
+    """
+    Drop-in for OpenAIClient that serves completions from a cassette, so
+    extraction runs are deterministic, free and work without network access.
+    """
+
+    # Close the inner client's connection pool, if there is one
+    def close(self) -> None:
+        if self.inner is not None:
+            self.inner.close()
+
+    # Method to create a chat completion; same signature as OpenAIClient.chat_completion
+    def chat_completion(self,
+                        messages: list[dict],
+                        model: str | None = None,
+                        temperature: float | None = None,
+                        response_format: dict | None = None
+        ):
+        key = self._key(messages, model, temperature, response_format)
+        entry = self._lookup(key)
+        if entry is not None:
+            delay = self.simulate_latency(entry["latency_seconds"])
+            time.sleep(delay)
+            # Cassettes keep no token usage, so a replayed call only reports its latency
+            usage.record_call(delay)
+            return entry["response"]
+
+        start = time.perf_counter()
+        response = self.inner.chat_completion(
+            messages=messages, model=model, temperature=temperature, response_format=response_format
+        )
+        self.cassette.add(key, response, time.perf_counter() - start)
+        return response
+
+
+class AsyncReplayClient(_ReplayBase):
+    """
+    Drop-in for AsyncOpenAIClient backed by a cassette; simulated latency is
+    awaited, so concurrent replays overlap like real calls.
+    """
+
+    # Close the inner client's connection pool, if there is one
+    async def aclose(self) -> None:
+        if self.inner is not None:
+            await self.inner.aclose()
+
+    # Coroutine counterpart of ReplayClient.chat_completion
+    async def chat_completion(self,
+                              messages: list[dict],
+                              model: str | None = None,
+                              temperature: float | None = None,
+                              response_format: dict | None = None
+        ):
+        key = self._key(messages, model, temperature, response_format)
+        entry = self._lookup(key)
+        if entry is not None:
+            delay = self.simulate_latency(entry["latency_seconds"])
+            await asyncio.sleep(delay)
+            usage.record_call(delay)
+            return entry["response"]
+
+        start = time.perf_counter()
+        response = await self.inner.chat_completion(
+            messages=messages, model=model, temperature=temperature, response_format=response_format
+        )
+        # Appending to the cassette file blocks, so it runs off the event loop
+        await asyncio.to_thread(self.cassette.add, key, response, time.perf_counter() - start)
+        return response
+
+    # Stream a recorded completion in small deltas, spreading the simulated latency across them
+    async def chat_completion_stream(self,
+                                     messages: list[dict],
+                                     model: str | None = None,
+                                     temperature: float | None = None,
+                                     response_format: dict | None = None
+        ):
+        key = self._key(messages, model, temperature, response_format)
+        entry = self._lookup(key)
+        if entry is not None:
+            response = entry["response"]
+            deltas = [response[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(response), STREAM_CHUNK_CHARS)]
+            delay = self.simulate_latency(entry["latency_seconds"]) / max(len(deltas), 1)
+            for delta in deltas:
+                await asyncio.sleep(delay)
+                yield delta
+            usage.record_call(delay * len(deltas))
+            return
+
+        start = time.perf_counter()
+        parts = []
+        async for delta in self.inner.chat_completion_stream(
+            messages=messages, model=model, temperature=temperature, response_format=response_format
+        ):
+            parts.append(delta)
+            yield delta
+        await asyncio.to_thread(self.cassette.add, key, "".join(parts), time.perf_counter() - start)
+
+
+def cassette_settings_from_env() -> dict | None:
+    """
+    Cassette settings from LLM_CASSETTE (path), LLM_CASSETTE_MODE
+    (replay/record/auto, default replay), LLM_CASSETTE_LATENCY and
+    LLM_CASSETTE_SEED, or None when LLM_CASSETTE is unset.
+    """
+    load_env()
+    path = os.getenv("LLM_CASSETTE")
+    if not path:
+        return None
+    seed = os.getenv("LLM_CASSETTE_SEED")
+    return {
+        "cassette": path,
+        "mode": os.getenv("LLM_CASSETTE_MODE", "replay"),
+        "latency": os.getenv("LLM_CASSETTE_LATENCY"),
+        "seed": int(seed) if seed else None,
+    }
+
+
+def replay_client_from_env(inner_factory: Callable | None = None, asynchronous: bool = False):
+    """
+    Cassette-backed client configured by cassette_settings_from_env(), or
+    None when LLM_CASSETTE is unset. inner_factory builds the live client
+    that record and auto modes call through to; replay mode never calls it,
+    so replaying needs no API key.
+    """
+    settings = cassette_settings_from_env()
+    if settings is None:
+        return None
+    inner = inner_factory() if settings["mode"] != "replay" and inner_factory else None
+    cls = AsyncReplayClient if asynchronous else ReplayClient
+    return cls(inner=inner, **settings)
@@ -0,0 +1,23 @@
+# Rough token estimate (~4 characters per token plus per-message overhead) used for
+# budgeting and reporting; it avoids a tokenizer dependency and only needs to be consistent.
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_text_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def estimate_tokens(messages: list[dict]) -> int:
+    return sum(
+        estimate_text_tokens(str(message.get("content", ""))) + MESSAGE_OVERHEAD_TOKENS
+        for message in messages
+    )
+
+
+# Completion budget reserved per extraction call when admitting it against a TPM limit
+COMPLETION_TOKEN_ESTIMATE = 1_000
+
+
+def estimate_request_tokens(messages: list[dict]) -> int:
+    return estimate_tokens(messages) + COMPLETION_TOKEN_ESTIMATE
@@ -0,0 +1,87 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class UsageMeter:
+    """
+    LLM usage of one unit of work, such as an evaluation run: chat calls,
+    seconds spent in them, and the prompt/completion tokens the API reported.
+    Calls without a usage block (streams, cassette replays) are counted in
+    calls_without_usage. Extraction windows and the attempts each needed are
+    recorded by the extractor, so retries = attempts - windows.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.llm_seconds = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.calls_without_usage = 0
+        self.windows = 0
+        self.attempts = 0
+
+    @property
+    def retries(self) -> int:
+        return self.attempts - self.windows
+
+    def record_call(self, latency_seconds: float, usage=None) -> None:
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        completion_tokens = getattr(usage, "completion_tokens", None)
+        with self._lock:
+            self.calls += 1
+            self.llm_seconds += latency_seconds
+            if prompt_tokens is None and completion_tokens is None:
+                self.calls_without_usage += 1
+            self.prompt_tokens += prompt_tokens or 0
+            self.completion_tokens += completion_tokens or 0
+
+    def record_window(self, attempts: int) -> None:
+        with self._lock:
+            self.windows += 1
+            self.attempts += attempts
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "llm_calls": self.calls,
+                "llm_seconds": self.llm_seconds,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "calls_without_usage": self.calls_without_usage,
+                "windows": self.windows,
+                "attempts": self.attempts,
+                "retries": self.attempts - self.windows,
+            }
+
+
+# The meter of the work in progress; asyncio tasks inherit it, worker threads
+# need the caller's context copied in (see LLMExtractor.extract)
+_current_meter: ContextVar[UsageMeter | None] = ContextVar("llm_usage_meter", default=None)
+
+
+@contextmanager
+def metering(meter: UsageMeter | None = None):
+    """
+    Record every LLM call made inside the block, in this thread or in tasks
+    and contexts started from it, on one UsageMeter.
+    """
+    meter = meter or UsageMeter()
+    token = _current_meter.set(meter)
+    try:
+        yield meter
+    finally:
+        _current_meter.reset(token)
+
+
+def record_call(latency_seconds: float, usage=None) -> None:
+    meter = _current_meter.get()
+    if meter is not None:
+        meter.record_call(latency_seconds, usage)
+
+
+def record_window(attempts: int) -> None:
+    meter = _current_meter.get()
+    if meter is not None:
+        meter.record_window(attempts)
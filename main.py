@@ -1,5 +1,13 @@
 #!/usr/bin/env python3
+import argparse
+import asyncio
 import sys
+from lib import jsonio
+from lib.openai_client import AsyncOpenAIClient, load_env, pool_settings_from_env
+from lib.rate_limiter import RateLimiter
+from lib.replay_client import replay_client_from_env
+from src.batch import resolve_transcript_paths, run_batch
+from src.bulk_jobs import ingest_batch_results, write_batch_requests
 from src.llm_extractor import LLMExtractor
 from src.date_normalizer import parse_meeting_date
 
@@ -57,12 +65,7 @@ def format_output(data: dict) -> str:
     return "\n".join(lines)
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python main.py <transcript_file>", file=sys.stderr)
-        sys.exit(1)
-
-    path = sys.argv[1]
+def _run_single(path: str) -> None:
     try:
         with open(path, "r") as f:
             transcript = f.read()
@@ -77,10 +80,113 @@ def main():
     if parse_meeting_date(transcript) is None:
         print("Warning: no 'Date:' header found — relative due dates won't be resolved.", file=sys.stderr)
 
-    extractor = LLMExtractor()
+    extractor = LLMExtractor.from_env()
     data = extractor.extract(transcript)
     print(format_output(data))
 
 
+async def _run_batch(spec: str, concurrency: int, output: str | None) -> None:
+    paths = resolve_transcript_paths(spec)
+    if not paths:
+        print(f"Error: no transcripts matched: {spec}", file=sys.stderr)
+        sys.exit(1)
+
+    # One pooled async client shared by every in-flight extraction; the limiter
+    # holds calls back when the account's RPM/TPM budget runs low
+    load_env()
+    limiter = RateLimiter.from_env()
+
+    def pooled_client() -> AsyncOpenAIClient:
+        return AsyncOpenAIClient(rate_limiter=limiter, **pool_settings_from_env())
+
+    client = replay_client_from_env(pooled_client, asynchronous=True) or pooled_client()
+    extractor = LLMExtractor.from_env(async_client=client)
+    out = open(output, "w") if output else sys.stdout
+    try:
+        summary = await run_batch(paths, extractor, out, concurrency=concurrency)
+    finally:
+        if output:
+            out.close()
+        await client.aclose()
+    print(summary.format(), file=sys.stderr)
+    if limiter is not None:
+        limits = limiter.stats()
+        print(
+            f"Rate limiter: {limits['rate_limited']} rate-limited responses, "
+            f"mean wait {limits['mean_wait_seconds']:.2f}s, final concurrency {limits['concurrency_limit']}",
+            file=sys.stderr,
+        )
+
+
+def _bulk_extractor() -> LLMExtractor:
+    # Configured like live extraction (response and retry mode), but results are never cached
+    return LLMExtractor.from_env(cache=None)
+
+
+def _bulk_prepare(spec: str, output: str) -> None:
+    paths = resolve_transcript_paths(spec)
+    with open(output, "w") as out:
+        count = write_batch_requests(paths, _bulk_extractor(), out)
+    print(f"Wrote {count} batch requests to {output}", file=sys.stderr)
+
+
+def _bulk_ingest(results_path: str, output: str | None) -> None:
+    extractor = _bulk_extractor()
+    out = open(output, "w") if output else sys.stdout
+    ok = failed = 0
+    try:
+        with open(results_path) as results:
+            for record in ingest_batch_results(results, extractor):
+                ok += record["ok"]
+                failed += not record["ok"]
+                out.write(jsonio.dumps_line(record))
+    finally:
+        if output:
+            out.close()
+    print(f"Ingested results for {ok + failed} transcripts ({ok} ok, {failed} failed)", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract action items, decisions, and follow-ups from meeting transcripts."
+    )
+    parser.add_argument("transcript_file", nargs="?", help="Transcript to extract and print as a task list.")
+    parser.add_argument(
+        "--batch",
+        metavar="SPEC",
+        help="Directory, glob, or .json/.jsonl manifest of transcripts; writes one JSONL record per transcript.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum extractions in flight in batch mode. Defaults to 8.",
+    )
+    parser.add_argument("--output", help="Write batch JSONL here instead of stdout.")
+    parser.add_argument(
+        "--bulk-prepare",
+        metavar="REQUESTS_JSONL",
+        help="With --batch, write offline Batch API requests to this file instead of extracting.",
+    )
+    parser.add_argument(
+        "--bulk-ingest",
+        metavar="RESULTS_JSONL",
+        help="Validate and normalize a Batch API results file; writes JSONL records like --batch.",
+    )
+    args = parser.parse_args()
+
+    if args.bulk_ingest:
+        _bulk_ingest(args.bulk_ingest, args.output)
+    elif args.batch and args.bulk_prepare:
+        _bulk_prepare(args.batch, args.bulk_prepare)
+    elif args.batch:
+        asyncio.run(_run_batch(args.batch, args.concurrency, args.output))
+    elif args.transcript_file:
+        _run_single(args.transcript_file)
+    else:
+        parser.print_usage(sys.stderr)
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,109 @@
+import asyncio
+import glob
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, List
+
+from lib import jsonio
+from src.llm_extractor import LLMExtractor
+
+
+MANIFEST_SUFFIXES = (".json", ".jsonl")
+
+
+@dataclass
+class BatchSummary:
+    total: int
+    succeeded: int
+    failed: int
+    wall_seconds: float
+
+    @property
+    def transcripts_per_second(self) -> float:
+        return self.total / self.wall_seconds if self.wall_seconds else 0.0
+
+    def format(self) -> str:
+        return (
+            f"Processed {self.total} transcripts ({self.succeeded} ok, {self.failed} failed) "
+            f"in {self.wall_seconds:.2f}s — {self.transcripts_per_second:.2f} transcripts/s"
+        )
+
+
+def _load_manifest(path: Path) -> List[str]:
+    """
+    A .json manifest is a list of paths; a .jsonl manifest has one entry per
+    line, either a path string or an object with a "path" key. Relative
+    paths are resolved against the manifest's directory.
+    """
+    text = path.read_text()
+    if path.suffix == ".json":
+        entries = jsonio.loads(text)
+    else:
+        entries = [jsonio.loads(line) for line in text.splitlines() if line.strip()]
+    paths = [entry["path"] if isinstance(entry, dict) else entry for entry in entries]
+    return [str(path.parent / p) for p in paths]
+
+
+def resolve_transcript_paths(spec: str) -> List[Path]:
+    """
+    Expand a batch spec into transcript paths: a directory (its *.txt files),
+    a .json/.jsonl manifest, or a glob pattern.
+    """
+    target = Path(spec)
+    if target.is_dir():
+        return sorted(target.glob("*.txt"))
+    if target.is_file() and target.suffix in MANIFEST_SUFFIXES:
+        return [Path(p) for p in _load_manifest(target)]
+    return [Path(p) for p in sorted(glob.glob(spec))]
+
+
+async def _extract_one(path: Path, extractor: LLMExtractor) -> dict:
+    start = time.perf_counter()
+    record = {"path": str(path), "ok": False, "data": None, "error": None}
+    try:
+        transcript = await asyncio.to_thread(path.read_text)
+        if not transcript.strip():
+            raise ValueError("Transcript file is empty.")
+        record["data"] = await extractor.aextract(transcript)
+        record["ok"] = True
+    except Exception as exc:
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    record["elapsed_seconds"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+async def run_batch(
+    paths: List[Path],
+    extractor: LLMExtractor,
+    out: IO[str],
+    concurrency: int = 8,
+) -> BatchSummary:
+    """
+    Extract every transcript with at most `concurrency` in flight, writing
+    one JSONL record per transcript to `out` as soon as it finishes.
+    Failures are recorded in the "error" field instead of stopping the batch.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+
+    async def bounded(path: Path) -> dict:
+        async with semaphore:
+            return await _extract_one(path, extractor)
+
+    succeeded = 0
+    for finished in asyncio.as_completed([bounded(p) for p in paths]):
+        record = await finished
+        succeeded += record["ok"]
+        out.write(jsonio.dumps_line(record))
+        out.flush()
+
+    return BatchSummary(
+        total=len(paths),
+        succeeded=succeeded,
+        failed=len(paths) - succeeded,
+        wall_seconds=time.perf_counter() - start,
+    )
@@ -0,0 +1,145 @@
+import re
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lib import jsonio
+from src.chunking import merge_chunk_results
+from src.llm_extractor import LLMExtractor
+
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# custom_id of one window of a chunked transcript: "<path>#chunk-<index>-of-<count>"
+_CHUNK_ID_RE = re.compile(r"^(?P<path>.*)#chunk-(?P<index>\d+)-of-(?P<count>\d+)$", re.DOTALL)
+
+
+def _chunk_id(path: str, index: int, count: int) -> str:
+    return f"{path}#chunk-{index}-of-{count}"
+
+
+def _parse_custom_id(custom_id: str) -> Tuple[str, Optional[int], Optional[int]]:
+    match = _CHUNK_ID_RE.match(custom_id)
+    if match is None:
+        return custom_id, None, None
+    return match["path"], int(match["index"]), int(match["count"])
+
+
+def write_batch_requests(paths: List[Path], extractor: LLMExtractor, out: IO[str]) -> int:
+    """
+    Phase one of a bulk job: write chat-completion requests in the OpenAI
+    Batch API input format. A transcript that fits in one window gets one
+    request whose custom_id is its path. A transcript longer than
+    extractor.chunk_chars is split into the same windows extract() would use,
+    with one request per window and a "#chunk-<i>-of-<n>" custom_id suffix,
+    and ingest_batch_results merges the windows back together.
+    Returns the number of requests written.
+    """
+    count = 0
+    for path in paths:
+        transcript = Path(path).read_text()
+        if not transcript.strip():
+            continue
+        chunks = extractor.chunks(transcript)
+        for index, chunk in enumerate(chunks):
+            line = {
+                "custom_id": str(path) if len(chunks) == 1 else _chunk_id(str(path), index, len(chunks)),
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": extractor.build_request(chunk),
+            }
+            out.write(jsonio.dumps_line(line))
+            count += 1
+    return count
+
+
+def _completion_content(result: Dict[str, Any]) -> str:
+    if result.get("error"):
+        raise ValueError(f"Batch request failed: {result['error']}")
+    response = result.get("response") or {}
+    if response.get("status_code") != 200:
+        raise ValueError(f"Batch request returned status {response.get('status_code')}.")
+    return response["body"]["choices"][0]["message"]["content"]
+
+
+def _merge_chunks(
+    path: str, results: Dict[int, Dict[str, Any]], count: int, extractor: LLMExtractor
+) -> Dict[str, Any]:
+    chunks = extractor.chunks(Path(path).read_text())
+    if len(chunks) != count:
+        raise ValueError(
+            f"Transcript splits into {len(chunks)} windows but the job has {count}; "
+            "ingest with the chunk settings the requests were prepared with."
+        )
+    windows = [extractor.parse_completion(_completion_content(results[i]), chunks[i]) for i in range(count)]
+    return merge_chunk_results(windows)
+
+
+def ingest_batch_results(lines: Iterable[str], extractor: LLMExtractor) -> Iterator[Dict[str, Any]]:
+    """
+    Phase two of a bulk job: validate and normalize every completion in a
+    Batch API output file. Yields one record per transcript in the same shape
+    as the batch CLI output (path, ok, data, error); failed requests and
+    completions that fail schema validation are reported, not retried.
+    Windows of a chunked transcript are held until all of them have arrived,
+    then validated against their own window and merged as extract() does;
+    the extractor must use the chunk settings the requests were prepared
+    with. Transcripts with windows missing from the file are reported last.
+    """
+    pending: Dict[str, Dict[int, Dict[str, Any]]] = {}
+    counts: Dict[str, int] = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        result = jsonio.loads(line)
+        path, index, count = _parse_custom_id(result.get("custom_id") or "")
+        if index is not None:
+            pending.setdefault(path, {})[index] = result
+            counts[path] = count
+            if len(pending[path]) < count:
+                continue
+        record = {"path": path, "ok": False, "data": None, "error": None}
+        try:
+            if index is None:
+                transcript = Path(path).read_text()
+                record["data"] = extractor.parse_completion(_completion_content(result), transcript)
+            else:
+                record["data"] = _merge_chunks(path, pending.pop(path), count, extractor)
+            record["ok"] = True
+        except Exception as exc:
+            record["error"] = f"{type(exc).__name__}: {exc}"
+        yield record
+
+    for path, results in pending.items():
+        missing = sorted(set(range(counts[path])) - set(results))
+        error = f"ValueError: Missing results for chunks {missing} of {counts[path]}."
+        yield {"path": path, "ok": False, "data": None, "error": error}
+
+
+def complete_batch_requests_locally(lines: Iterable[str], client, out: IO[str]) -> int:
+    """
+    File-based stand-in for the remote batch service: send each request
+    line through `client.chat_completion` and write a Batch API output line.
+    Useful for testing the ingest phase without submitting a real job.
+    """
+    count = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        request = jsonio.loads(line)
+        body = request["body"]
+        content = client.chat_completion(
+            messages=body["messages"],
+            response_format=body["response_format"],
+        )
+        result = {
+            "id": f"local-{count}",
+            "custom_id": request["custom_id"],
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]},
+            },
+            "error": None,
+        }
+        out.write(jsonio.dumps_line(result))
+        count += 1
+    return count
@@ -0,0 +1,190 @@
+import os
+from array import array
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable, Optional, Set
+
+
+DEFAULT_YEARS = (2000, 2060)
+
+# Monday=0 ... Sunday=6
+WEEKEND = (5, 6)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    # n-th given weekday of the month; n=-1 for the last one
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(d: date) -> date:
+    # Fixed-date holidays on a weekend are observed on the nearest weekday
+    if d.weekday() == 5:
+        return d - timedelta(days=1)
+    if d.weekday() == 6:
+        return d + timedelta(days=1)
+    return d
+
+
+def us_federal_holidays(year: int) -> Set[date]:
+    return {
+        _observed(date(year, 1, 1)),
+        _nth_weekday(year, 1, 0, 3),     # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),     # Washington's Birthday
+        _nth_weekday(year, 5, 0, -1),    # Memorial Day
+        _observed(date(year, 6, 19)),
+        _observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),     # Labor Day
+        _nth_weekday(year, 10, 0, 2),    # Columbus Day
+        _observed(date(year, 11, 11)),
+        _nth_weekday(year, 11, 3, 4),    # Thanksgiving
+        _observed(date(year, 12, 25)),
+    }
+
+
+class BusinessCalendar:
+    """
+    Business days over [start_year, end_year] as a one-byte-per-day bitmap
+    plus cumulative counts, so offsets and period ends are a couple of array
+    lookups instead of a day-by-day loop:
+
+      bitmap[i]     1 if day i is a business day
+      cumulative[i] business days strictly before day i
+      positions[k]  day index of the k-th business day
+
+    Days are indexed from January 1 of start_year. Dates outside the range
+    resolve to None.
+    """
+
+    def __init__(
+        self,
+        start_year: int = DEFAULT_YEARS[0],
+        end_year: int = DEFAULT_YEARS[1],
+        holidays: Iterable[date] = (),
+        weekend: Iterable[int] = WEEKEND,
+    ):
+        if end_year < start_year:
+            raise ValueError("end_year must not be before start_year.")
+        self.start_year = start_year
+        self.end_year = end_year
+        self._origin = date(start_year, 1, 1).toordinal()
+        days = date(end_year, 12, 31).toordinal() - self._origin + 1
+
+        weekend = set(weekend)
+        # Jan 1 of start_year falls on weekday w, so day i falls on (w + i) % 7
+        first_weekday = date(start_year, 1, 1).weekday()
+        week = bytes(0 if (first_weekday + i) % 7 in weekend else 1 for i in range(7))
+        self.bitmap = bytearray((week * (days // 7 + 1))[:days])
+        for holiday in holidays:
+            idx = holiday.toordinal() - self._origin
+            if 0 <= idx < days:
+                self.bitmap[idx] = 0
+
+        self.cumulative = array("l", [0]) * (days + 1)
+        self.positions = array("l")
+        count = 0
+        for idx, is_business in enumerate(self.bitmap):
+            if is_business:
+                self.positions.append(idx)
+                count += 1
+            self.cumulative[idx + 1] = count
+
+    def _index(self, d: date) -> Optional[int]:
+        idx = d.toordinal() - self._origin
+        return idx if 0 <= idx < len(self.bitmap) else None
+
+    def _date(self, idx: int) -> date:
+        return date.fromordinal(self._origin + idx)
+
+    def is_business_day(self, d: date) -> bool:
+        idx = self._index(d)
+        return idx is not None and bool(self.bitmap[idx])
+
+    def business_days_between(self, start: date, end: date) -> Optional[int]:
+        """
+        Business days in (start, end]; negative when end is before start.
+        """
+        i, j = self._index(start), self._index(end)
+        if i is None or j is None:
+            return None
+        return self.cumulative[j + 1] - self.cumulative[i + 1]
+
+    def add_business_days(self, d: date, n: int) -> Optional[date]:
+        """
+        The n-th business day strictly after d (d itself for n=0).
+        """
+        if n == 0:
+            return d
+        idx = self._index(d)
+        if idx is None:
+            return None
+        k = self.cumulative[idx + 1] + n - 1
+        return self._date(self.positions[k]) if 0 <= k < len(self.positions) else None
+
+    def next_business_day(self, d: date) -> Optional[date]:
+        return self.add_business_days(d, 1)
+
+    def last_business_day_on_or_before(self, d: date) -> Optional[date]:
+        idx = self._index(d)
+        if idx is None:
+            return None
+        k = self.cumulative[idx + 1] - 1
+        return self._date(self.positions[k]) if k >= 0 else None
+
+    def end_of_quarter(self, d: date, quarter: Optional[int] = None) -> Optional[date]:
+        """
+        Last business day of d's quarter, or of the given quarter (1-4) of
+        d's year.
+        """
+        quarter = quarter or (d.month - 1) // 3 + 1
+        last_month = 3 * quarter
+        first_of_next = date(d.year + last_month // 12, last_month % 12 + 1, 1)
+        return self.last_business_day_on_or_before(first_of_next - timedelta(days=1))
+
+    def end_of_year(self, d: date) -> Optional[date]:
+        return self.last_business_day_on_or_before(date(d.year, 12, 31))
+
+
+def _holidays_from_env(spec: str, start_year: int, end_year: int) -> Set[date]:
+    """
+    EXTRACTION_HOLIDAYS: "none" (weekends only), "us" (US federal holidays),
+    or a path to a file with one ISO date per line.
+    """
+    if spec in ("", "none"):
+        return set()
+    if spec == "us":
+        return {d for year in range(start_year, end_year + 1) for d in us_federal_holidays(year)}
+    lines = Path(spec).read_text().splitlines()
+    return {date.fromisoformat(line.strip()) for line in lines if line.strip() and not line.startswith("#")}
+
+
+_default_calendar: Optional[BusinessCalendar] = None
+
+
+def default_calendar() -> BusinessCalendar:
+    """
+    Process-wide calendar configured from EXTRACTION_HOLIDAYS and
+    EXTRACTION_CALENDAR_YEARS (e.g. "2000-2060"), built on first use.
+    """
+    global _default_calendar
+    if _default_calendar is None:
+        years = os.getenv("EXTRACTION_CALENDAR_YEARS")
+        start_year, end_year = (int(y) for y in years.split("-")) if years else DEFAULT_YEARS
+        holidays = _holidays_from_env(os.getenv("EXTRACTION_HOLIDAYS", "none"), start_year, end_year)
+        _default_calendar = BusinessCalendar(start_year, end_year, holidays)
+    return _default_calendar
+
+
+def set_default_calendar(business_calendar: Optional[BusinessCalendar]) -> None:
+    """
+    Replace the process-wide calendar; None rebuilds it from the environment
+    on next use. Cached due-date resolutions are dropped.
+    """
+    global _default_calendar
+    _default_calendar = business_calendar
+    from src.date_normalizer import clear_normalize_cache
+
+    clear_normalize_cache()
@@ -0,0 +1,93 @@
+import os
+from typing import Any, Dict, List, Optional
+
+from src.date_normalizer import parse_meeting_date
+from src.evaluator import text_sim
+from src.transcript_analysis import analyze_transcript
+
+
+SECTION_NAMES = ("action_items", "decisions", "follow_ups")
+
+DEFAULT_CHUNK_CHARS = 24_000
+DEFAULT_OVERLAP_TURNS = 2
+
+# Two items in overlapping windows are treated as the same item at or above this token-F1
+DEDUPE_THRESHOLD = 0.8
+
+
+def chunk_chars_from_env() -> Optional[int]:
+    """
+    Chunk size for the CLI and API, from EXTRACTION_CHUNK_CHARS (0 disables chunking).
+    """
+    value = int(os.getenv("EXTRACTION_CHUNK_CHARS", DEFAULT_CHUNK_CHARS))
+    return value or None
+
+
+def split_transcript(
+    transcript: str,
+    max_chars: int = DEFAULT_CHUNK_CHARS,
+    overlap_turns: int = DEFAULT_OVERLAP_TURNS,
+) -> List[str]:
+    """
+    Split a transcript into windows of whole speaker turns, each at most
+    max_chars long where possible, repeating the last overlap_turns turns of
+    a window at the start of the next one. Every window starts with the
+    transcript header, and with a "Date:" line when the meeting date is
+    known, so due phrases in any window are normalized against the same date.
+    """
+    if max_chars < 1:
+        raise ValueError("max_chars must be at least 1.")
+    if overlap_turns < 0:
+        raise ValueError("overlap_turns must be non-negative.")
+
+    if len(transcript) <= max_chars:
+        return [transcript]
+
+    index = analyze_transcript(transcript)
+    if not index.turn_starts:
+        return [transcript]
+    preamble, turns = index.preamble, index.turns()
+
+    # Prepend a "Date:" line unless the meeting date header is already in the preamble
+    meeting_date = parse_meeting_date(transcript)
+    if meeting_date and index.date_header.end > index.preamble_end:
+        preamble = f"Date: {meeting_date:%b} {meeting_date.day}, {meeting_date.year}\n" + preamble
+
+    chunks = []
+    start = 0
+    while start < len(turns):
+        end = start
+        size = len(preamble)
+        # Always take at least one turn so an oversized turn still makes progress
+        while end < len(turns) and (end == start or size + len(turns[end]) <= max_chars):
+            size += len(turns[end])
+            end += 1
+        chunks.append(preamble + "".join(turns[start:end]))
+        if end >= len(turns):
+            break
+        start = max(end - overlap_turns, start + 1)
+    return chunks
+
+
+def _is_duplicate(item: Dict[str, Any], kept: List[Dict[str, Any]]) -> bool:
+    evidence = " ".join(str(item.get("evidence", "")).lower().split())
+    for other in kept:
+        if evidence and evidence == " ".join(str(other.get("evidence", "")).lower().split()):
+            return True
+        if text_sim(item.get("text", ""), other.get("text", "")) >= DEDUPE_THRESHOLD:
+            return True
+    return False
+
+
+def merge_chunk_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-window extractions into a single payload, keeping the first
+    occurrence of items that were extracted from more than one window.
+    """
+    merged: Dict[str, Any] = {name: [] for name in SECTION_NAMES}
+    for result in results:
+        for name in SECTION_NAMES:
+            for item in result.get(name, []):
+                if not _is_duplicate(item, merged[name]):
+                    merged[name].append(item)
+    return merged
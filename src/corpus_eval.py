@@ -0,0 +1,381 @@
+import asyncio
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from lib import jsonio
+from src import matching
+from src.eval_runner import SECTION_NAMES, _compute_overall_metrics, _load_json, _load_text, _precision_recall
+from src.evaluator import evaluate
+from src.llm_extractor import LLMExtractor
+from src.similarity import DEFAULT_SIMILARITY
+
+
+OWNER_DUE_SECTIONS = ("action_items", "follow_ups")
+SUMMARY_GROUPS = SECTION_NAMES + ("overall",)
+
+DEFAULT_BOOTSTRAP_SAMPLES = 1000
+DEFAULT_CONFIDENCE = 0.95
+
+
+@dataclass(frozen=True)
+class EvalPair:
+    transcript_path: str
+    gold_path: str
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.transcript_path, self.gold_path
+
+
+def load_pairs(path: str) -> List[EvalPair]:
+    """
+    A .json manifest is a list of {"transcript": ..., "gold": ...} objects; a
+    .jsonl manifest has one such object per line. Relative paths are
+    resolved against the manifest's directory.
+    """
+    manifest = Path(path)
+    if manifest.suffix == ".json":
+        entries = _load_json(path)
+    else:
+        entries = [jsonio.loads(line) for line in manifest.read_text().splitlines() if line.strip()]
+    return [
+        EvalPair(str(manifest.parent / entry["transcript"]), str(manifest.parent / entry["gold"]))
+        for entry in entries
+    ]
+
+
+def score_pair(
+    pred: Dict[str, Any],
+    gold_path: str,
+    text_threshold: float,
+    greedy: bool,
+    similarity: str = DEFAULT_SIMILARITY,
+) -> Dict[str, Any]:
+    """
+    Per-section match counts for one pair. Runs in the scoring pool, so it
+    loads the gold file itself and returns counts rather than matched items.
+    """
+    result = evaluate(
+        pred, _load_json(gold_path), text_threshold=text_threshold, greedy=greedy, similarity=similarity
+    )
+    sections = {}
+    for name in SECTION_NAMES:
+        section = result[name]
+        counts = {
+            "matched": len(section["matched"]),
+            "hallucinations": len(section["hallucinations"]),
+            "missed": len(section["missed"]),
+        }
+        if name in OWNER_DUE_SECTIONS:
+            counts["owner_correct"] = sum(m["pred"].get("owner") == m["gold"].get("owner") for m in section["matched"])
+            counts["due_correct"] = sum(m["pred"].get("due") == m["gold"].get("due") for m in section["matched"])
+        sections[name] = counts
+    overall = _compute_overall_metrics(result)
+    sections["overall"] = {key: overall[key] for key in ("matched", "hallucinations", "missed")}
+    return sections
+
+
+def load_completed(
+    output_path: str,
+    text_threshold: float,
+    greedy: bool,
+    similarity: str = DEFAULT_SIMILARITY,
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Successful records from a previous run's JSONL output, keyed by pair, for
+    resuming. Records scored with another threshold, matching mode or
+    similarity, failed pairs and a line cut off by an interrupted write are
+    left to re-run.
+    """
+    path = Path(output_path)
+    if not path.exists():
+        return {}
+    matching_mode = "greedy" if greedy else "optimal"
+    completed = {}
+    for line in path.read_text().splitlines():
+        try:
+            record = jsonio.loads(line)
+        except jsonio.JSONDecodeError:
+            continue
+        if (
+            record.get("ok")
+            and record.get("text_threshold") == text_threshold
+            and record.get("matching") == matching_mode
+            and record.get("similarity", DEFAULT_SIMILARITY) == similarity
+        ):
+            completed[(record["transcript_path"], record["gold_path"])] = record
+    return completed
+
+
+async def run_corpus(
+    pairs: Sequence[EvalPair],
+    extractor: LLMExtractor,
+    out: IO[str],
+    concurrency: int = 8,
+    workers: int = 0,
+    text_threshold: float = 0.75,
+    greedy: bool = False,
+    similarity: str = DEFAULT_SIMILARITY,
+    completed: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None,
+    progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Extract every pair's transcript with at most `concurrency` in flight and
+    score it in a pool of `workers` processes (0 scores in a worker thread,
+    off the event loop). One JSONL record per pair is written to `out` as
+    soon as it is scored, and progress(done, total, record) is called after
+    each one. Pairs in `completed` are not run again; their records are
+    returned with the rest.
+
+    Pairs flow through a fixed set of extraction workers into a bounded
+    scoring queue, so at most `concurrency` transcripts are read and held
+    at a time, and scoring never stalls extractions in flight.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    completed = completed or {}
+    records = [completed[pair.key] for pair in pairs if pair.key in completed]
+    pending: asyncio.Queue = asyncio.Queue()
+    for pair in pairs:
+        if pair.key not in completed:
+            pending.put_nowait(pair)
+    # Extracted predictions wait here for a scorer; a full queue holds back further extractions
+    to_score: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    matching_mode = "greedy" if greedy else "optimal"
+
+    pool: Optional[Executor] = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    loop = asyncio.get_running_loop()
+
+    def finish(record: Dict[str, Any], start: float) -> None:
+        record["elapsed_seconds"] = round(time.perf_counter() - start, 4)
+        records.append(record)
+        out.write(jsonio.dumps_line(record))
+        out.flush()
+        if progress is not None:
+            progress(len(records), len(pairs), record)
+
+    async def extract_worker() -> None:
+        while not pending.empty():
+            pair = pending.get_nowait()
+            start = time.perf_counter()
+            record = {
+                "transcript_path": pair.transcript_path,
+                "gold_path": pair.gold_path,
+                "ok": False,
+                "error": None,
+                "sections": None,
+                "text_threshold": text_threshold,
+                "matching": matching_mode,
+                "similarity": similarity,
+            }
+            try:
+                transcript = await asyncio.to_thread(_load_text, pair.transcript_path)
+                if not transcript.strip():
+                    raise ValueError("Transcript file is empty.")
+                pred = await extractor.aextract(transcript)
+            except Exception as exc:
+                record["error"] = f"{type(exc).__name__}: {exc}"
+                finish(record, start)
+                continue
+            await to_score.put((record, pred, start))
+
+    async def score_worker() -> None:
+        while (job := await to_score.get()) is not None:
+            record, pred, start = job
+            args = (pred, record["gold_path"], text_threshold, greedy, similarity)
+            try:
+                if pool is None:
+                    record["sections"] = await asyncio.to_thread(score_pair, *args)
+                else:
+                    record["sections"] = await loop.run_in_executor(pool, score_pair, *args)
+                record["ok"] = True
+            except Exception as exc:
+                record["error"] = f"{type(exc).__name__}: {exc}"
+            finish(record, start)
+
+    extract_tasks = [asyncio.create_task(extract_worker()) for _ in range(min(concurrency, pending.qsize()))]
+    score_tasks = [asyncio.create_task(score_worker()) for _ in range(max(workers, 1))]
+
+    async def extract_all() -> None:
+        await asyncio.gather(*extract_tasks)
+        for _ in score_tasks:
+            await to_score.put(None)
+
+    try:
+        # Gathered together, so a failing scorer cannot leave extractors blocked on a full queue
+        await asyncio.gather(extract_all(), *score_tasks)
+    finally:
+        for task in extract_tasks + score_tasks:
+            task.cancel()
+        if pool is not None:
+            pool.shutdown()
+    return records
+
+
+# ── aggregation ─────────────────────────────────────────────────────────────
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator else 0.0
+
+
+def _pair_precision_recall(counts: Dict[str, int]) -> Tuple[float, float]:
+    metrics = _precision_recall(counts["matched"], counts["hallucinations"], counts["missed"])
+    return metrics["precision"], metrics["recall"]
+
+
+def _bootstrap(
+    tp: List[List[int]],
+    fp: List[List[int]],
+    fn: List[List[int]],
+    pair_precision: List[List[float]],
+    pair_recall: List[List[float]],
+    samples: int,
+    confidence: float,
+    seed: int,
+) -> Dict[str, List[Tuple[float, float]]]:
+    """
+    Percentile intervals for micro and macro precision/recall per group,
+    resampling pairs with replacement. Inputs are pair x group tables; each
+    bootstrap sample is a vector of pair weights, so every statistic for all
+    samples comes out of one weights x table product.
+    """
+    n = len(tp)
+    alpha = (1 - confidence) / 2
+    # Follows the evaluator's EVAL_MATRIX_BACKEND switch
+    np = matching.numpy_module()
+
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        # Row b holds how often each pair was drawn in bootstrap sample b
+        weights = rng.multinomial(n, np.full(n, 1 / n), size=samples).astype(np.float64)
+        tp_s, fp_s, fn_s = (weights @ np.asarray(table, dtype=np.float64) for table in (tp, fp, fn))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stats = {
+                "micro_precision": np.where(tp_s + fp_s > 0, tp_s / (tp_s + fp_s), 0.0),
+                "micro_recall": np.where(tp_s + fn_s > 0, tp_s / (tp_s + fn_s), 0.0),
+            }
+        stats["macro_precision"] = weights @ np.asarray(pair_precision, dtype=np.float64) / n
+        stats["macro_recall"] = weights @ np.asarray(pair_recall, dtype=np.float64) / n
+        return {
+            name: [(float(lo), float(hi)) for lo, hi in np.quantile(values, [alpha, 1 - alpha], axis=0).T]
+            for name, values in stats.items()
+        }
+
+    rng = random.Random(seed)
+    groups = len(tp[0])
+    stats = {name: [[] for _ in range(groups)] for name in ("micro_precision", "micro_recall", "macro_precision", "macro_recall")}
+    for _ in range(samples):
+        weights = [0] * n
+        for idx in rng.choices(range(n), k=n):
+            weights[idx] += 1
+        for g in range(groups):
+            tp_s = sum(w * row[g] for w, row in zip(weights, tp))
+            fp_s = sum(w * row[g] for w, row in zip(weights, fp))
+            fn_s = sum(w * row[g] for w, row in zip(weights, fn))
+            stats["micro_precision"][g].append(_ratio(tp_s, tp_s + fp_s))
+            stats["micro_recall"][g].append(_ratio(tp_s, tp_s + fn_s))
+            stats["macro_precision"][g].append(sum(w * row[g] for w, row in zip(weights, pair_precision)) / n)
+            stats["macro_recall"][g].append(sum(w * row[g] for w, row in zip(weights, pair_recall)) / n)
+
+    def interval(values: List[float]) -> Tuple[float, float]:
+        values = sorted(values)
+        # Same linear interpolation between order statistics as numpy.quantile
+        def at(q: float) -> float:
+            pos = q * (len(values) - 1)
+            lo = int(pos)
+            hi = min(lo + 1, len(values) - 1)
+            return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+        return at(alpha), at(1 - alpha)
+
+    return {name: [interval(values) for values in per_group] for name, per_group in stats.items()}
+
+
+def summarize_corpus(
+    records: Sequence[Dict[str, Any]],
+    bootstrap_samples: int = DEFAULT_BOOTSTRAP_SAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Micro metrics (counts summed over pairs) and macro metrics (per-pair
+    precision and recall averaged) for each section and overall, with
+    bootstrap confidence intervals when bootstrap_samples > 0.
+    """
+    ok = [record["sections"] for record in records if record.get("ok")]
+    summary: Dict[str, Any] = {
+        "pairs": len(records),
+        "succeeded": len(ok),
+        "failed": len(records) - len(ok),
+        "confidence": confidence,
+        "bootstrap_samples": bootstrap_samples if ok else 0,
+    }
+
+    tp = [[sections[g]["matched"] for g in SUMMARY_GROUPS] for sections in ok]
+    fp = [[sections[g]["hallucinations"] for g in SUMMARY_GROUPS] for sections in ok]
+    fn = [[sections[g]["missed"] for g in SUMMARY_GROUPS] for sections in ok]
+    pair_metrics = [[_pair_precision_recall(sections[g]) for g in SUMMARY_GROUPS] for sections in ok]
+    pair_precision = [[p for p, _ in row] for row in pair_metrics]
+    pair_recall = [[r for _, r in row] for row in pair_metrics]
+    intervals = (
+        _bootstrap(tp, fp, fn, pair_precision, pair_recall, bootstrap_samples, confidence, seed)
+        if ok and bootstrap_samples > 0
+        else None
+    )
+
+    for g, name in enumerate(SUMMARY_GROUPS):
+        matched = sum(row[g] for row in tp)
+        group = {
+            **_precision_recall(matched, sum(row[g] for row in fp), sum(row[g] for row in fn)),
+            "macro_precision": _ratio(sum(row[g] for row in pair_precision), len(ok)),
+            "macro_recall": _ratio(sum(row[g] for row in pair_recall), len(ok)),
+        }
+        if name in OWNER_DUE_SECTIONS:
+            group["owner_accuracy_on_matched"] = _ratio(sum(s[name]["owner_correct"] for s in ok), matched)
+            group["due_accuracy_on_matched"] = _ratio(sum(s[name]["due_correct"] for s in ok), matched)
+        if intervals is not None:
+            group["ci"] = {stat: list(per_group[g]) for stat, per_group in intervals.items()}
+        summary[name] = group
+    return summary
+
+
+def format_corpus_report(summary: Dict[str, Any]) -> str:
+    lines = [
+        "Corpus Evaluation Report",
+        "========================",
+        f"pairs: {summary['pairs']} ({summary['succeeded']} ok, {summary['failed']} failed)",
+    ]
+    if summary["bootstrap_samples"]:
+        lines.append(
+            f"intervals: {summary['confidence']:.0%} bootstrap over pairs, {summary['bootstrap_samples']} samples"
+        )
+    lines.append("")
+    header = f"{'':<14}{'micro P':>22}{'micro R':>22}{'macro P':>22}{'macro R':>22}"
+    lines.append(header)
+    lines.append("-" * len(header))
+    for name in SUMMARY_GROUPS:
+        group = summary[name]
+        cells = []
+        for stat, value in (
+            ("micro_precision", group["precision"]),
+            ("micro_recall", group["recall"]),
+            ("macro_precision", group["macro_precision"]),
+            ("macro_recall", group["macro_recall"]),
+        ):
+            cell = f"{value:.2f}"
+            if "ci" in group:
+                lo, hi = group["ci"][stat]
+                cell += f" [{lo:.2f}, {hi:.2f}]"
+            cells.append(f"{cell:>22}")
+        lines.append(f"{name:<14}" + "".join(cells))
+    for name in OWNER_DUE_SECTIONS:
+        group = summary[name]
+        lines.append(
+            f"{name}: owner accuracy on matched {group['owner_accuracy_on_matched']:.2f}, "
+            f"due accuracy on matched {group['due_accuracy_on_matched']:.2f}"
+        )
+    return "\n".join(lines)
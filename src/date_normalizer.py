@@ -1,8 +1,13 @@
 from __future__ import annotations
+import calendar
 import re
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from src.business_calendar import default_calendar
+from src.transcript_analysis import analyze_transcript
 
 
 MONTHS = {
@@ -32,13 +37,11 @@ def parse_meeting_date(transcript: str) -> Optional[date]:
     Looks for the header like: Date: Jan 22, 2026
     """
 
-    # Use a regular expression to search for a date in the format "Date: Mon DD, YYYY" within the transcript. The regex captures the month abbreviation, day, and year as separate groups.
-    m = re.search(r"Date:\s*([A-Za-z]{3})\s+(\d{1,2}),\s+(\d{4})", transcript)
-    
-    # If the regex search does not find a match, it returns None. Otherwise, it extracts the month abbreviation, day, and year from the matched groups. It checks if the month abbreviation is valid (i.e., exists in the MONTHS dictionary). If it's not valid, it returns None. If everything is valid, it constructs and returns a date object using the extracted year, month (converted from abbreviation to number), and day.
-    if not m:
+    # The header is located by the shared one-pass transcript scan, so the validator, chunking and the extractor do not each search the text again
+    header = analyze_transcript(transcript).date_header
+    if header is None:
         return None
-    mon, day, year = m.group(1), m.group(2), m.group(3)
+    mon, day, year = header.month, header.day, header.year
 
     # Check if the extracted month abbreviation is valid by looking it up in the MONTHS dictionary. If the month abbreviation is not found in the dictionary, return None to indicate that the date could not be parsed.
     if mon not in MONTHS:
@@ -64,6 +67,121 @@ def _next_weekday_strictly_after(d: date, target_weekday: int) -> date:
     return d + timedelta(days=delta)
 
 
+# Phrases sent to human review when they appear anywhere in the due phrase (expand this list over time)
+AMBIGUOUS_MARKERS = (
+    "early next week",
+    "later this week",
+    "sometime next week",
+    "next week",
+    "soon",
+    "asap",
+    "end of week",
+    "eow",
+)
+_AMBIGUOUS_RE = re.compile("|".join(re.escape(marker) for marker in AMBIGUOUS_MARKERS))
+
+# Leading "by" / "on" / "before" is dropped before parsing
+_PREFIX_RE = re.compile(r"^(by|on|before)\s+")
+
+_WEEKDAY_ALT = "|".join(WEEKDAYS)
+
+# Every supported phrase shape in one pattern; alternatives are tried in the order the
+# rules were historically applied, and the named group that matched picks the rule.
+_PHRASE_RE = re.compile(
+    rf"""^(?:
+        next\s+(?P<next_weekday>{_WEEKDAY_ALT})
+      | (?P<weekday>{_WEEKDAY_ALT})
+      | (?P<today>today)
+      | (?P<tomorrow>tomorrow)
+      | in\s+(?P<in_days>\d+)\s+days?
+      | in\s+(?P<in_weeks>\d+)\s+weeks?
+      | in\s+(?P<in_business_days>\d+)\s+(?:business|working)\s+days?
+      | (?P<next_business_day>next\s+(?:business|working)\s+day)
+      | end\s+of\s+(?:the\s+)?(?P<end_of_quarter>quarter|q[1-4])
+      | end\s+of\s+(?:the\s+)?(?P<end_of_year>year)
+      | end\s+of\s+(?P<end_of_month>month)
+      | end\s+of\s+(?P<end_of_named>[a-z]{{3,9}})
+      | (?P<month>[a-z]{{3,9}})\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?(?:,?\s+(?P<year>\d{{4}}))?
+    )$""",
+    re.VERBOSE,
+)
+
+# Distinct (meeting date, phrase) pairs remembered by _resolve_phrase
+NORMALIZE_CACHE_SIZE = 65_536
+
+
+def _month_number(word: str) -> Optional[int]:
+    # "jan", "january" and anything else starting with a month abbreviation
+    return MONTHS.get(word.capitalize()[:3])
+
+
+def _end_of_month(year: int, month: int) -> date:
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _resolve_date(meeting_date: date, m: re.Match) -> Optional[date]:
+    rule = m.lastgroup
+    if rule == "next_weekday":
+        return _next_weekday_strictly_after(meeting_date, WEEKDAYS[m.group(rule)])
+    if rule == "weekday":
+        # Next-or-same occurrence after the meeting date
+        return _next_or_same_weekday(meeting_date, WEEKDAYS[m.group(rule)])
+    if rule == "today":
+        return meeting_date
+    if rule == "tomorrow":
+        return meeting_date + timedelta(days=1)
+    if rule == "in_days":
+        return meeting_date + timedelta(days=int(m.group(rule)))
+    if rule == "in_weeks":
+        return meeting_date + timedelta(weeks=int(m.group(rule)))
+    if rule == "in_business_days":
+        return default_calendar().add_business_days(meeting_date, int(m.group(rule)))
+    if rule == "next_business_day":
+        return default_calendar().next_business_day(meeting_date)
+    if rule == "end_of_quarter":
+        # Quarter and year ends resolve to the last business day of the period;
+        # month ends below stay calendar days, as they always have
+        quarter = m.group(rule)
+        return default_calendar().end_of_quarter(meeting_date, None if quarter == "quarter" else int(quarter[1]))
+    if rule == "end_of_year":
+        return default_calendar().end_of_year(meeting_date)
+    if rule == "end_of_month":
+        return _end_of_month(meeting_date.year, meeting_date.month)
+    if rule == "end_of_named":
+        month_num = _month_number(m.group(rule))
+        return _end_of_month(meeting_date.year, month_num) if month_num else None
+
+    # Specific dates: "Jan 25", "January 25", "Jan 25th", "January 25, 2026"
+    month_num = _month_number(m.group("month"))
+    if month_num is None:
+        return None
+    year_num = int(m.group("year")) if m.group("year") else meeting_date.year
+    try:
+        return date(year_num, month_num, int(m.group("day")))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _resolve_phrase(meeting_date: date, phrase: str) -> NormalizedDue | str:
+    """
+    The NormalizedDue for a lowercased, stripped phrase, or the review kind
+    ("Ambiguous" / "Unrecognized") when it cannot be resolved. The review
+    reason quotes the caller's original text, so it is built outside the cache.
+    """
+    if _AMBIGUOUS_RE.search(phrase):
+        return "Ambiguous"
+    m = _PHRASE_RE.match(_PREFIX_RE.sub("", phrase).strip())
+    dt = _resolve_date(meeting_date, m) if m else None
+    if dt is None:
+        return "Unrecognized"
+    return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
+
+
+def clear_normalize_cache() -> None:
+    _resolve_phrase.cache_clear()
+
+
 def normalize_due_raw(
     meeting_date: date,
     due_raw: Optional[str],
@@ -74,113 +192,42 @@ def normalize_due_raw(
       - "by next Wednesday"
       - "next Wednesday"
       - "Monday"
-    into an ISO date string using meeting_date as reference.
+      - "in 3 business days" / "next business day"
+      - "end of quarter" / "end of Q3" / "end of year"
+    into an ISO date string using meeting_date as reference. Business-day
+    phrases use the default BusinessCalendar (weekends and configured
+    holidays); quarter and year ends resolve to the period's last business
+    day, while "end of month" / "end of March" stay on the month's last
+    calendar day.
 
     Ambiguous phrases -> due=None and needs_human_review=True
     """
     if not due_raw:
         return NormalizedDue(due=None, needs_human_review=False)
 
-    s = due_raw.strip().lower()
-
-    # Mark ambiguous phrases for review (expand this list over time)
-    ambiguous_markers = [
-        "early next week",
-        "later this week",
-        "sometime next week",
-        "next week",
-        "soon",
-        "asap",
-        "end of week",
-        "eow",
-    ]
-    if any(marker in s for marker in ambiguous_markers):
-        return NormalizedDue(
-            due=None,
-            needs_human_review=True,
-            reason=f"Ambiguous due phrase: '{due_raw}'"
-        )
-
-    # Remove leading "by" / "on" / "before" for parsing
-    s = re.sub(r"^(by|on|before)\s+", "", s).strip()
-
-    # Handle "next <weekday>" explicitly (strictly after meeting date)
-    m_next = re.match(r"^next\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)$", s)
-    if m_next:
-        wd = WEEKDAYS[m_next.group(1)]
-        dt = _next_weekday_strictly_after(meeting_date, wd)
-        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
-
-    # Handle plain weekday (interpret as next-or-same occurrence after meeting date)
-    m_wd = re.match(r"^(monday|tuesday|wednesday|thursday|friday|saturday|sunday)$", s)
-    if m_wd:
-        wd = WEEKDAYS[m_wd.group(1)]
-        dt = _next_or_same_weekday(meeting_date, wd)
-        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
-
-    # Handle "today" / "tomorrow"
-    if s == "today":
-        return NormalizedDue(due=meeting_date.isoformat(), needs_human_review=False)
-    if s == "tomorrow":
-        dt = meeting_date + timedelta(days=1)
-        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
-
-    # Handle "in N days" / "in N weeks"
-    m_in_days = re.match(r"^in\s+(\d+)\s+days?$", s)
-    if m_in_days:
-        dt = meeting_date + timedelta(days=int(m_in_days.group(1)))
-        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
-
-    m_in_weeks = re.match(r"^in\s+(\d+)\s+weeks?$", s)
-    if m_in_weeks:
-        dt = meeting_date + timedelta(weeks=int(m_in_weeks.group(1)))
-        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
-
-    # Handle "end of month" / "end of <month>"
-    m_eom = re.match(r"^end\s+of\s+month$", s)
-    if m_eom:
-        import calendar
-        last_day = calendar.monthrange(meeting_date.year, meeting_date.month)[1]
-        dt = date(meeting_date.year, meeting_date.month, last_day)
-        return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
-
-    m_eom_named = re.match(r"^end\s+of\s+([a-z]{3,9})$", s)
-    if m_eom_named:
-        import calendar
-        mon_str = m_eom_named.group(1).capitalize()[:3]
-        if mon_str in MONTHS:
-            month_num = MONTHS[mon_str]
-            year = meeting_date.year
-            last_day = calendar.monthrange(year, month_num)[1]
-            dt = date(year, month_num, last_day)
-            return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
-
-    # Handle specific dates: "Jan 25", "January 25", "Jan 25th", "January 25, 2026"
-    FULL_MONTHS = {
-        "january": "Jan", "february": "Feb", "march": "Mar", "april": "Apr",
-        "may": "May", "june": "Jun", "july": "Jul", "august": "Aug",
-        "september": "Sep", "october": "Oct", "november": "Nov", "december": "Dec",
-    }
-    m_date = re.match(
-        r"^([a-z]{3,9})\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?$", s
-    )
-    if m_date:
-        raw_mon = m_date.group(1)
-        # Normalize full month name to 3-letter abbreviation
-        mon_key = FULL_MONTHS.get(raw_mon, raw_mon.capitalize()[:3])
-        if mon_key in MONTHS:
-            month_num = MONTHS[mon_key]
-            day_num = int(m_date.group(2))
-            year_num = int(m_date.group(3)) if m_date.group(3) else meeting_date.year
-            try:
-                dt = date(year_num, month_num, day_num)
-                return NormalizedDue(due=dt.isoformat(), needs_human_review=False)
-            except ValueError:
-                pass
-
-    # If we got here, we couldn't parse it confidently
+    resolved = _resolve_phrase(meeting_date, due_raw.strip().lower())
+    if isinstance(resolved, NormalizedDue):
+        return resolved
     return NormalizedDue(
         due=None,
         needs_human_review=True,
-        reason=f"Unrecognized due phrase: '{due_raw}'"
-    )
\ No newline at end of file
+        reason=f"{resolved} due phrase: '{due_raw}'"
+    )
+
+
+def normalize_due_many(
+    meeting_date: date,
+    phrases: Iterable[Optional[str]],
+) -> List[NormalizedDue]:
+    """
+    normalize_due_raw over many phrases against one meeting date, e.g. every
+    item of a transcript; repeated phrases are resolved once.
+    """
+    seen: Dict[Optional[str], NormalizedDue] = {}
+    out = []
+    for phrase in phrases:
+        normalized = seen.get(phrase)
+        if normalized is None:
+            normalized = seen[phrase] = normalize_due_raw(meeting_date, phrase)
+        out.append(normalized)
+    return out
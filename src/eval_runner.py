@@ -1,9 +1,12 @@
-import json
+import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from src.evaluator import evaluate
+from lib import jsonio
+from lib.usage import metering
+from src.evaluator import evaluate, sweep_thresholds
 from src.llm_extractor import LLMExtractor
+from src.similarity import DEFAULT_SIMILARITY
 
 
 SECTION_NAMES = ("action_items", "decisions", "follow_ups")
@@ -14,7 +17,20 @@ def _load_text(path: str) -> str:
 
 
 def _load_json(path: str) -> Dict[str, Any]:
-    return json.loads(Path(path).read_text())
+    return jsonio.loads(Path(path).read_bytes())
+
+
+def _precision_recall(matched: int, hallucinations: int, missed: int) -> Dict[str, float]:
+    precision = matched / (matched + hallucinations) if (matched + hallucinations) else 0.0
+    recall = matched / (matched + missed) if (matched + missed) else 0.0
+
+    return {
+        "matched": matched,
+        "hallucinations": hallucinations,
+        "missed": missed,
+        "precision": precision,
+        "recall": recall,
+    }
 
 
 def _compute_overall_metrics(result: Dict[str, Any]) -> Dict[str, float]:
@@ -28,16 +44,23 @@ def _compute_overall_metrics(result: Dict[str, Any]) -> Dict[str, float]:
         hallucinations += len(section["hallucinations"])
         missed += len(section["missed"])
 
-    precision = matched / (matched + hallucinations) if (matched + hallucinations) else 0.0
-    recall = matched / (matched + missed) if (matched + missed) else 0.0
+    return _precision_recall(matched, hallucinations, missed)
 
-    return {
-        "matched": matched,
-        "hallucinations": hallucinations,
-        "missed": missed,
-        "precision": precision,
-        "recall": recall,
-    }
+
+DEFAULT_SWEEP = "0.5:1.0:0.05"
+
+
+def parse_threshold_grid(spec: str) -> List[float]:
+    """
+    "START:STOP:STEP" (STOP included) or a comma-separated list of thresholds.
+    """
+    if ":" in spec:
+        start, stop, step = (float(part) for part in spec.split(":"))
+        if step <= 0:
+            raise ValueError("Threshold sweep step must be positive.")
+        count = int(round((stop - start) / step, 9)) + 1
+        return [round(start + k * step, 10) for k in range(max(count, 0))]
+    return sorted(float(part) for part in spec.split(",") if part.strip())
 
 
 def run_evaluation(
@@ -45,21 +68,61 @@ def run_evaluation(
     gold_path: str,
     text_threshold: float = 0.75,
     extractor: LLMExtractor | None = None,
+    greedy: bool = False,
+    similarity: str = DEFAULT_SIMILARITY,
 ) -> Dict[str, Any]:
     transcript = _load_text(transcript_path)
     if not transcript.strip():
         raise ValueError("Transcript file is empty.")
 
     gold = _load_json(gold_path)
-    extractor = extractor or LLMExtractor()
-    pred = extractor.extract(transcript)
-    result = evaluate(pred, gold, text_threshold=text_threshold)
+    extractor = extractor or LLMExtractor.from_env()
+    start = time.perf_counter()
+    with metering() as meter:
+        pred = extractor.extract(transcript)
+    extracted = time.perf_counter()
+    result = evaluate(pred, gold, text_threshold=text_threshold, greedy=greedy, similarity=similarity)
+    scored = time.perf_counter()
     result["overall"] = _compute_overall_metrics(result)
     result["transcript_path"] = str(Path(transcript_path))
     result["gold_path"] = str(Path(gold_path))
+    result["performance"] = {
+        "wall_seconds": scored - start,
+        "extract_seconds": extracted - start,
+        "scoring_seconds": scored - extracted,
+        **meter.as_dict(),
+    }
     return result
 
 
+def run_threshold_sweep(
+    transcript_path: str,
+    gold_path: str,
+    thresholds: List[float],
+    extractor: LLMExtractor | None = None,
+    greedy: bool = False,
+    similarity: str = DEFAULT_SIMILARITY,
+) -> Dict[str, Any]:
+    """
+    One extraction scored at every threshold in the grid, for choosing
+    --threshold without further LLM calls.
+    """
+    transcript = _load_text(transcript_path)
+    if not transcript.strip():
+        raise ValueError("Transcript file is empty.")
+
+    gold = _load_json(gold_path)
+    extractor = extractor or LLMExtractor.from_env()
+    pred = extractor.extract(transcript)
+    return {
+        "transcript_path": str(Path(transcript_path)),
+        "gold_path": str(Path(gold_path)),
+        "matching": "greedy" if greedy else "optimal",
+        "similarity": similarity,
+        "points": sweep_thresholds(pred, gold, thresholds, greedy=greedy, similarity=similarity),
+    }
+
+
 def _format_section(section_name: str, metrics: Dict[str, Any]) -> list[str]:
     title = section_name.replace("_", " ").title()
     lines = [
@@ -137,6 +200,8 @@ def format_evaluation_report(result: Dict[str, Any]) -> str:
         f"transcript: {result['transcript_path']}",
         f"gold: {result['gold_path']}",
         f"text threshold: {result['text_threshold']:.2f}",
+        f"matching: {result.get('matching', 'optimal')}",
+        f"similarity: {result.get('similarity', DEFAULT_SIMILARITY)}",
         "",
         "Overall",
         "-------",
@@ -147,8 +212,54 @@ def format_evaluation_report(result: Dict[str, Any]) -> str:
         f"missed: {overall['missed']}",
     ]
 
+    if "performance" in result:
+        lines.append("")
+        lines.extend(_format_performance(result["performance"]))
+
     for section_name in SECTION_NAMES:
         lines.append("")
         lines.extend(_format_section(section_name, result[section_name]))
 
     return "\n".join(lines)
+
+
+def _format_performance(performance: Dict[str, Any]) -> list[str]:
+    lines = [
+        "Performance",
+        "-----------",
+        f"wall time: {performance['wall_seconds']:.3f}s",
+        f"extraction: {performance['extract_seconds']:.3f}s "
+        f"(llm {performance['llm_seconds']:.3f}s over {performance['llm_calls']} calls)",
+        f"scoring: {performance['scoring_seconds']:.3f}s",
+        f"windows: {performance['windows']}, attempts: {performance['attempts']}, retries: {performance['retries']}",
+        f"tokens: {performance['prompt_tokens']} prompt, {performance['completion_tokens']} completion",
+    ]
+    if performance["calls_without_usage"]:
+        lines.append(f"calls without token usage: {performance['calls_without_usage']}")
+    return lines
+
+
+def format_sweep_report(sweep: Dict[str, Any]) -> str:
+    lines = [
+        "Threshold Sweep",
+        "===============",
+        f"transcript: {sweep['transcript_path']}",
+        f"gold: {sweep['gold_path']}",
+        f"matching: {sweep['matching']}",
+        f"similarity: {sweep.get('similarity', DEFAULT_SIMILARITY)}",
+        "",
+    ]
+    header = f"{'threshold':>9}  {'P':>5} {'R':>5}" + "".join(f"  {name + ' P/R':>21}" for name in SECTION_NAMES)
+    header += f"  {'owner acc':>9} {'due acc':>7}"
+    lines.append(header)
+    lines.append("-" * len(header))
+    for point in sweep["points"]:
+        row = f"{point['text_threshold']:>9.2f}  {point['overall']['precision']:>5.2f} {point['overall']['recall']:>5.2f}"
+        for name in SECTION_NAMES:
+            row += f"  {point[name]['precision']:>10.2f}/{point[name]['recall']:<10.2f}"
+        actions = point["action_items"]
+        row += f"  {actions['owner_accuracy_on_matched']:>9.2f} {actions['due_accuracy_on_matched']:>7.2f}"
+        lines.append(row)
+    lines.append("")
+    lines.append("owner/due accuracy are for matched action items")
+    return "\n".join(lines)
@@ -1,12 +1,8 @@
 from typing import Any, Dict, List, Tuple, Optional
 from collections import Counter
-import re
 
-_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
-
-
-def _tokenize(text: str) -> List[str]:
-    return _TOKEN_RE.findall(text.lower())
+from src.matching import SweepScores, greedy_assignment, optimal_assignment
+from src.similarity import DEFAULT_SIMILARITY, similarity_backend, tokenize as _tokenize
 
 
 def _f1_over_tokens(a: str, b: str) -> float:
@@ -33,11 +29,23 @@ def _f1_over_tokens(a: str, b: str) -> float:
     return (2 * precision * recall) / (precision + recall)
 
 
-def text_sim(a: str, b: str) -> float:
+def text_sim(a: str, b: str, similarity: str = DEFAULT_SIMILARITY) -> float:
     """
-    Compute a similarity score between two strings using token-based F1.
+    Compute a similarity score between two strings, using token-based F1
+    unless another backend from src.similarity is named.
     """
-    return _f1_over_tokens(a, b)
+    if similarity == DEFAULT_SIMILARITY:
+        return _f1_over_tokens(a, b)
+    backend = similarity_backend(similarity)
+    (a_vector,), (b_vector,) = backend.vectors([a], [b])
+    return backend.score(a_vector, b_vector)
+
+
+def _section_scores(pred_items, gold_items, threshold: float, similarity: str):
+    # Each text becomes a vector once; the backend decides which pairs are ever scored
+    backend = similarity_backend(similarity)
+    pred_vectors, gold_vectors = backend.vectors([p["text"] for p in pred_items], [g["text"] for g in gold_items])
+    return backend.section_scores(pred_vectors, gold_vectors, threshold)
 
 
 def best_text_match(
@@ -75,23 +83,30 @@ def _score_section(
     gold_items: List[Dict[str, Any]],
     text_threshold: float,
     score_owner_due: bool = False,
+    greedy: bool = False,
+    similarity: str = DEFAULT_SIMILARITY,
 ) -> Dict[str, Any]:
     """
     Generic precision/recall scoring for a list of predicted vs gold items.
     If score_owner_due is True, also tracks owner and due accuracy on matched items.
+    Items are matched by maximum-weight assignment over the similarity scores
+    (token-F1 by default); greedy=True keeps the original first-come
+    best-match order instead.
     """
-    used_gold: set = set()
     matches = []
     hallucinations = []
     owner_correct = 0
     due_correct = 0
 
-    for p in pred_items:
-        gi, score = best_text_match(p["text"], gold_items, used_gold)
-        if gi is None or score < text_threshold:
-            hallucinations.append({"pred": p, "best_score": score})
+    scores = _section_scores(pred_items, gold_items, text_threshold, similarity)
+    assign = greedy_assignment if greedy else optimal_assignment
+    pairs, unmatched = assign(scores)
+
+    for pi, p in enumerate(pred_items):
+        if pi not in pairs:
+            hallucinations.append({"pred": p, "best_score": unmatched[pi]})
             continue
-        used_gold.add(gi)
+        gi, score = pairs[pi]
         g = gold_items[gi]
         matches.append({"pred": p, "gold": g, "text_score": score})
         if score_owner_due:
@@ -100,6 +115,7 @@ def _score_section(
             if p.get("due") == g.get("due"):
                 due_correct += 1
 
+    used_gold = {gi for gi, _ in pairs.values()}
     missed = [g for i, g in enumerate(gold_items) if i not in used_gold]
 
     tp = len(matches)
@@ -122,29 +138,43 @@ def _score_section(
     return result
 
 
-def evaluate(pred: Dict[str, Any], gold: Dict[str, Any], text_threshold: float = 0.75):
+def evaluate(
+    pred: Dict[str, Any],
+    gold: Dict[str, Any],
+    text_threshold: float = 0.75,
+    greedy: bool = False,
+    similarity: str = DEFAULT_SIMILARITY,
+):
     """
     Scores predicted action items, decisions, and follow-ups against gold data
-    using token-F1 text matching. Reports precision, recall, and (for action
-    items and follow-ups) owner/due accuracy on matched items.
+    using token-F1 text matching, or the named similarity backend. Reports
+    precision, recall, and (for action items and follow-ups) owner/due
+    accuracy on matched items. Matching is order-independent unless greedy
+    is set.
     """
     action_items = _score_section(
         pred.get("action_items", []),
         gold.get("action_items", []),
         text_threshold,
         score_owner_due=True,
+        greedy=greedy,
+        similarity=similarity,
     )
     decisions = _score_section(
         pred.get("decisions", []),
         gold.get("decisions", []),
         text_threshold,
         score_owner_due=False,
+        greedy=greedy,
+        similarity=similarity,
     )
     follow_ups = _score_section(
         pred.get("follow_ups", []),
         gold.get("follow_ups", []),
         text_threshold,
         score_owner_due=True,
+        greedy=greedy,
+        similarity=similarity,
     )
 
     return {
@@ -152,4 +182,69 @@ def evaluate(pred: Dict[str, Any], gold: Dict[str, Any], text_threshold: float =
         "decisions": decisions,
         "follow_ups": follow_ups,
         "text_threshold": text_threshold,
-    }
\ No newline at end of file
+        "matching": "greedy" if greedy else "optimal",
+        "similarity": similarity,
+    }
+
+
+# (section, whether owner and due accuracy are tracked) in report order
+_SECTIONS = (("action_items", True), ("decisions", False), ("follow_ups", True))
+
+
+def sweep_thresholds(
+    pred: Dict[str, Any],
+    gold: Dict[str, Any],
+    thresholds: List[float],
+    greedy: bool = False,
+    similarity: str = DEFAULT_SIMILARITY,
+) -> List[Dict[str, Any]]:
+    """
+    Precision, recall and owner/due accuracy at every threshold, as
+    evaluate() would report them, from one vectorization and one candidate
+    scoring per section: candidates are scored once at the lowest threshold
+    and each point re-runs only the assignment on the pairs that clear it.
+    Returns one point per threshold in ascending order, each with per-section
+    metrics and overall precision/recall.
+    """
+    thresholds = sorted(set(thresholds))
+    if not thresholds:
+        return []
+    assign = greedy_assignment if greedy else optimal_assignment
+
+    sections = {}
+    for name, _ in _SECTIONS:
+        pred_items, gold_items = pred.get(name, []), gold.get(name, [])
+        scores = _section_scores(pred_items, gold_items, thresholds[0], similarity)
+        sections[name] = (pred_items, gold_items, SweepScores(scores))
+
+    points = []
+    for threshold in thresholds:
+        point: Dict[str, Any] = {"text_threshold": threshold}
+        total_tp = total_fp = total_fn = 0
+        for name, score_owner_due in _SECTIONS:
+            pred_items, gold_items, candidates = sections[name]
+            pairs, _ = assign(candidates.at(threshold), best_scores=False)
+            tp = len(pairs)
+            fp = len(pred_items) - tp
+            fn = len(gold_items) - tp
+            metrics = {
+                "precision": tp / (tp + fp) if (tp + fp) else 0.0,
+                "recall": tp / (tp + fn) if (tp + fn) else 0.0,
+                "matched": tp,
+                "hallucinations": fp,
+                "missed": fn,
+            }
+            if score_owner_due:
+                matched = [(pred_items[pi], gold_items[gi]) for pi, (gi, _) in pairs.items()]
+                owner_correct = sum(p.get("owner") == g.get("owner") for p, g in matched)
+                due_correct = sum(p.get("due") == g.get("due") for p, g in matched)
+                metrics["owner_accuracy_on_matched"] = owner_correct / tp if tp else 0.0
+                metrics["due_accuracy_on_matched"] = due_correct / tp if tp else 0.0
+            point[name] = metrics
+            total_tp, total_fp, total_fn = total_tp + tp, total_fp + fp, total_fn + fn
+        point["overall"] = {
+            "precision": total_tp / (total_tp + total_fp) if (total_tp + total_fp) else 0.0,
+            "recall": total_tp / (total_tp + total_fn) if (total_tp + total_fn) else 0.0,
+        }
+        points.append(point)
+    return points
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from lib.prompts import SYSTEM_PROMPT
+
+
+DEFAULT_CACHE_PATH = ".cache/extractions.sqlite3"
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(transcript: str, model: str, temperature: float, version: str) -> str:
+    """
+    Content-addressed key for an extraction: any change to the transcript,
+    prompt, model, temperature or extractor version yields a new key.
+    """
+    payload = json.dumps(
+        [transcript, SYSTEM_PROMPT, model, temperature, version],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Two-tier cache of extraction results.
+
+    The first tier is a bounded in-process LRU. The optional second tier is a
+    SQLite file that survives restarts; entries expire after ttl_seconds and
+    the least recently used entries are evicted once the stored payloads
+    exceed max_disk_bytes. Values are stored as JSON text so every get()
+    returns a fresh copy the caller is free to mutate.
+
+    Disk reads do not commit: access times are buffered and written with the
+    next insert, and the stored byte total is kept in process rather than
+    summed on every insert. Calls block, so async callers run them in a
+    worker thread.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        path: Optional[str] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+        # key -> (JSON text, created_at); created_at is kept so the TTL applies to both tiers
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        # key -> accessed_at of disk hits not yet written back
+        self._touched: Dict[str, float] = {}
+        self._disk_bytes = 0
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS extractions ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS extractions_by_age ON extractions (created_at)")
+            self._db.commit()
+            self._disk_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM extractions").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created_at = entry
+                if time.time() - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return json.loads(value)
+                del self._memory[key]
+
+            row = self._disk_get(key)
+            if row is not None:
+                value, created_at = row
+                self._memory_set(key, value, created_at)
+                self.disk_hits += 1
+                return json.loads(value)
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        value = json.dumps(data, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._memory_set(key, value, now)
+            self._disk_set(key, value, now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM extractions")
+                self._db.commit()
+                self._touched.clear()
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            hits = self.memory_hits + self.disk_hits
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": self._disk_count(),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._flush_touched()
+                self._db.commit()
+                self._db.close()
+                self._db = None
+
+    def _memory_set(self, key: str, value: str, created_at: float) -> None:
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str) -> Optional[Tuple[str, float]]:
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT value, created_at, size FROM extractions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[1] > self.ttl_seconds:
+            self._db.execute("DELETE FROM extractions WHERE key = ?", (key,))
+            self._db.commit()
+            self._touched.pop(key, None)
+            self._disk_bytes -= row[2]
+            return None
+        self._touched[key] = now
+        return row[0], row[1]
+
+    def _disk_set(self, key: str, value: str, now: float) -> None:
+        if self._db is None:
+            return
+        self._flush_touched()
+        old = self._db.execute("SELECT size FROM extractions WHERE key = ?", (key,)).fetchone()
+        self._disk_bytes += len(value) - (old[0] if old else 0)
+        self._db.execute(
+            "INSERT OR REPLACE INTO extractions (key, value, size, created_at, accessed_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (key, value, len(value), now, now),
+        )
+        self._evict(now)
+        self._db.commit()
+
+    def _flush_touched(self) -> None:
+        if self._touched:
+            self._db.executemany(
+                "UPDATE extractions SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self, now: float) -> None:
+        # Indexed on created_at, so this only reads the expired rows
+        cutoff = now - self.ttl_seconds
+        expired = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM extractions WHERE created_at < ?", (cutoff,)
+        ).fetchone()[0]
+        if expired:
+            self._db.execute("DELETE FROM extractions WHERE created_at < ?", (cutoff,))
+            self._disk_bytes -= expired
+        if self._disk_bytes <= self.max_disk_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT key, size FROM extractions ORDER BY accessed_at ASC, rowid ASC"
+        ).fetchall()
+        for key, size in rows:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            self._db.execute("DELETE FROM extractions WHERE key = ?", (key,))
+            self._disk_bytes -= size
+
+    def _disk_count(self) -> int:
+        if self._db is None:
+            return 0
+        return self._db.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+
+
+_default_cache: Optional[ExtractionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_cache() -> Optional[ExtractionCache]:
+    """
+    Process-wide cache configured from the environment:
+      EXTRACTION_CACHE=off            disables caching entirely
+      EXTRACTION_CACHE_PATH=<file>    SQLite tier location ("" for memory only)
+      EXTRACTION_CACHE_TTL=<seconds>  on-disk entry lifetime
+    """
+    global _default_cache
+    if os.getenv("EXTRACTION_CACHE", "on").lower() in ("off", "0", "false"):
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ExtractionCache(
+                path=os.getenv("EXTRACTION_CACHE_PATH", DEFAULT_CACHE_PATH) or None,
+                ttl_seconds=float(os.getenv("EXTRACTION_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+            )
+        return _default_cache
+
+
+def close_default_cache() -> None:
+    """
+    Close the process-wide cache's SQLite file; the next default_cache()
+    opens a fresh one.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is not None:
+            _default_cache.close()
+            _default_cache = None
@@ -1,15 +1,152 @@
+import asyncio
+import hashlib
 import json
-from lib.openai_client import OpenAIClient
-from lib.prompts import SYSTEM_PROMPT
-from src.date_normalizer import normalize_due_raw, parse_meeting_date
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from pydantic_core import ValidationError
+from lib import usage
+from lib.openai_client import DEFAULT_MODEL, AsyncOpenAIClient, OpenAIClient, load_env
+from lib.prompts import REPAIR_PROMPT, SYSTEM_PROMPT
+from lib.replay_client import replay_client_from_env
+from lib.tokens import estimate_tokens
+from src.date_normalizer import normalize_due_many, normalize_due_raw, parse_meeting_date
+from src.chunking import (
+    DEFAULT_OVERLAP_TURNS,
+    chunk_chars_from_env,
+    merge_chunk_results,
+    split_transcript,
+)
+from src.extraction_cache import ExtractionCache, cache_key, default_cache
+from src.output_schema import ITEM_CONTRACT, OUTPUT_VALIDATOR, RESPONSE_MODES, response_format_for
+from src.stream_parser import IncrementalItemParser
+
+# Bump whenever post-processing of model output changes so cached results are not reused
+EXTRACTOR_VERSION = "2"
+
+RETRY_MODES = ("replay", "repair")
+
+
+class RetryStats:
+    """
+    Running totals of validation retries. prompt_tokens is the estimated
+    input sent by each retry; replay_prompt_tokens is what replaying the
+    whole conversation would have cost, so tokens_saved compares the two
+    strategies. The most recent retries are kept in `recent`.
+    by_response_mode counts, per response mode, how many windows were
+    extracted and how many of them needed at least one retry.
+    """
+
+    def __init__(self, history: int = 100):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.replay_prompt_tokens = 0
+        self.recent: deque = deque(maxlen=history)
+        self.by_response_mode: dict = {}
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.replay_prompt_tokens - self.prompt_tokens
+
+    def record(self, strategy: str, prompt_tokens: int, replay_prompt_tokens: int) -> None:
+        with self._lock:
+            self.retries += 1
+            self.prompt_tokens += prompt_tokens
+            self.replay_prompt_tokens += replay_prompt_tokens
+            self.recent.append(
+                {
+                    "strategy": strategy,
+                    "prompt_tokens": prompt_tokens,
+                    "replay_prompt_tokens": replay_prompt_tokens,
+                    "tokens_saved": replay_prompt_tokens - prompt_tokens,
+                }
+            )
+
+    def record_extraction(self, response_mode: str, attempts: int) -> None:
+        with self._lock:
+            counts = self.by_response_mode.setdefault(
+                response_mode, {"extractions": 0, "retried": 0, "attempts": 0}
+            )
+            counts["extractions"] += 1
+            counts["retried"] += attempts > 1
+            counts["attempts"] += attempts
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "prompt_tokens": self.prompt_tokens,
+                "replay_prompt_tokens": self.replay_prompt_tokens,
+                "tokens_saved": self.tokens_saved,
+                "by_response_mode": {
+                    mode: {
+                        **counts,
+                        "retry_rate": counts["retried"] / counts["extractions"],
+                    }
+                    for mode, counts in self.by_response_mode.items()
+                },
+            }
+
 
 class LLMExtractor:
     # Initialize the OpenAI Client
-    def __init__(self, client: OpenAIClient | None = None, max_attempts: int = 3):
-        self.client = client or OpenAIClient()
+    def __init__(
+        self,
+        client: OpenAIClient | None = None,
+        max_attempts: int = 3,
+        async_client: AsyncOpenAIClient | None = None,
+        cache: ExtractionCache | None = None,
+        chunk_chars: int | None = None,
+        chunk_overlap_turns: int = DEFAULT_OVERLAP_TURNS,
+        max_concurrency: int = 4,
+        retry_mode: str = "replay",
+        response_mode: str = "json_object",
+    ):
+        # Missing clients are created on first use, so offline paths such as bulk ingest need no API key
+        self.client = client
+        self.async_client = async_client
         if max_attempts < 1:
             raise ValueError("max_attempts must be at least 1.")
         self.max_attempts = max_attempts
+        self.cache = cache
+        # Transcripts longer than chunk_chars are split on speaker turns and extracted window by window
+        self.chunk_chars = chunk_chars
+        self.chunk_overlap_turns = chunk_overlap_turns
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.max_concurrency = max_concurrency
+        # "replay" resends the conversation on invalid output; "repair" resends only the invalid items
+        if retry_mode not in RETRY_MODES:
+            raise ValueError(f"retry_mode must be one of {RETRY_MODES}.")
+        self.retry_mode = retry_mode
+        # "json_schema" sends the output contract as a strict schema so invalid shapes cannot be generated
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"response_mode must be one of {RESPONSE_MODES}.")
+        self.response_mode = response_mode
+        self.response_format = response_format_for(response_mode)
+        self.retry_stats = RetryStats()
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "LLMExtractor":
+        """
+        Extractor configured like the CLI and API: shared cache, chunking,
+        retry mode (EXTRACTION_RETRY_MODE) and response mode
+        (EXTRACTION_RESPONSE_MODE) come from the environment. When
+        LLM_CASSETTE is set, clients not passed in are cassette-backed.
+        """
+        load_env()
+        if "client" not in kwargs:
+            kwargs["client"] = replay_client_from_env(OpenAIClient)
+        if "async_client" not in kwargs:
+            kwargs["async_client"] = replay_client_from_env(AsyncOpenAIClient, asynchronous=True)
+        kwargs.setdefault("cache", default_cache())
+        kwargs.setdefault("chunk_chars", chunk_chars_from_env())
+        kwargs.setdefault("retry_mode", os.getenv("EXTRACTION_RETRY_MODE", "replay"))
+        kwargs.setdefault("response_mode", os.getenv("EXTRACTION_RESPONSE_MODE", "json_object"))
+        return cls(**kwargs)
 
     @staticmethod
     def _validate_required_keys(data: dict, required: set[str], obj_name: str) -> None:
@@ -32,7 +169,7 @@ class LLMExtractor:
             null_msg = " or null" if allow_null else ""
             raise ValueError(f"Field '{field_name}' must be a string{null_msg}.")
 
-    def _validate_schema(self, data: dict) -> None:
+    def _validate_top_level(self, data: dict) -> None:
         if not isinstance(data, dict):
             raise ValueError("Top-level response must be a JSON object.")
 
@@ -46,117 +183,410 @@ class LLMExtractor:
             if not isinstance(data.get(array_name), list):
                 raise ValueError(f"Field '{array_name}' must be an array.")
 
-        for idx, item in enumerate(data["action_items"]):
-            if not isinstance(item, dict):
-                raise ValueError(f"action_items[{idx}] must be an object.")
-            self._validate_required_keys(
-                item,
-                {"text", "owner", "due_raw", "due", "evidence", "needs_human_review", "reason"},
-                f"action_items[{idx}]",
-            )
-            self._validate_string(item["text"], f"action_items[{idx}].text")
-            self._validate_string(item["owner"], f"action_items[{idx}].owner", allow_null=True)
-            self._validate_string(item["due_raw"], f"action_items[{idx}].due_raw", allow_null=True)
-            if item["due"] is not None:
-                raise ValueError(f"Field 'action_items[{idx}].due' must be null before normalization.")
-            self._validate_string(item["evidence"], f"action_items[{idx}].evidence")
-            if not isinstance(item["needs_human_review"], bool):
-                raise ValueError(f"Field 'action_items[{idx}].needs_human_review' must be a boolean.")
-            self._validate_string(item["reason"], f"action_items[{idx}].reason", allow_null=True)
-
-        for idx, item in enumerate(data["decisions"]):
-            if not isinstance(item, dict):
-                raise ValueError(f"decisions[{idx}] must be an object.")
-            self._validate_required_keys(item, {"text", "evidence"}, f"decisions[{idx}]")
-            self._validate_string(item["text"], f"decisions[{idx}].text")
-            self._validate_string(item["evidence"], f"decisions[{idx}].evidence")
-
-        for idx, item in enumerate(data["follow_ups"]):
-            if not isinstance(item, dict):
-                raise ValueError(f"follow_ups[{idx}] must be an object.")
-            self._validate_required_keys(
-                item,
-                {"text", "owner", "due_raw", "due", "evidence"},
-                f"follow_ups[{idx}]",
-            )
-            self._validate_string(item["text"], f"follow_ups[{idx}].text")
-            self._validate_string(item["owner"], f"follow_ups[{idx}].owner", allow_null=True)
-            self._validate_string(item["due_raw"], f"follow_ups[{idx}].due_raw", allow_null=True)
-            if item["due"] is not None:
-                raise ValueError(f"Field 'follow_ups[{idx}].due' must be null before normalization.")
-            self._validate_string(item["evidence"], f"follow_ups[{idx}].evidence")
+    def _validate_item(self, section: str, idx: int, item) -> None:
+        # Field rules come from ITEM_CONTRACT, the same table the strict JSON Schema is built from
+        name = f"{section}[{idx}]"
+        if not isinstance(item, dict):
+            raise ValueError(f"{name} must be an object.")
+        contract = ITEM_CONTRACT[section]
+        self._validate_required_keys(item, set(contract), name)
+        for field, kind in contract.items():
+            value = item[field]
+            if kind == "string":
+                self._validate_string(value, f"{name}.{field}")
+            elif kind == "nullable_string":
+                self._validate_string(value, f"{name}.{field}", allow_null=True)
+            elif kind == "null" and value is not None:
+                raise ValueError(f"Field '{name}.{field}' must be null before normalization.")
+            elif kind == "boolean" and not isinstance(value, bool):
+                raise ValueError(f"Field '{name}.{field}' must be a boolean.")
 
-    # Method to extract structured information from unstructured text
-    def extract(self, transcript: str):
-        messages = [
+    def _validate_action_item(self, idx: int, item) -> None:
+        self._validate_item("action_items", idx, item)
+
+    def _validate_decision(self, idx: int, item) -> None:
+        self._validate_item("decisions", idx, item)
+
+    def _validate_follow_up(self, idx: int, item) -> None:
+        self._validate_item("follow_ups", idx, item)
+
+    def _item_validators(self) -> dict:
+        return {
+            "action_items": self._validate_action_item,
+            "decisions": self._validate_decision,
+            "follow_ups": self._validate_follow_up,
+        }
+
+    def _validate_schema(self, data: dict) -> None:
+        self._validate_top_level(data)
+        for section, validate_item in self._item_validators().items():
+            for idx, item in enumerate(data[section]):
+                validate_item(idx, item)
+
+    def _item_errors(self, data: dict) -> list[tuple[str, int, str]]:
+        """
+        Every (section, index, error) in a payload whose top level is valid.
+        """
+        errors = []
+        for section, validate_item in self._item_validators().items():
+            for idx, item in enumerate(data[section]):
+                try:
+                    validate_item(idx, item)
+                except (TypeError, ValueError) as exc:
+                    errors.append((section, idx, str(exc)))
+        return errors
+
+    @staticmethod
+    def _build_messages(transcript: str) -> list[dict]:
+        return [
             {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": transcript}
         ]
+
+    def _parse_output(self, raw) -> dict:
+        # Valid output is parsed and checked in a single compiled pass; only rejected output goes
+        # through json.loads and _validate_schema, whose messages feed the retry prompt
+        if isinstance(raw, (str, bytes)):
+            try:
+                return OUTPUT_VALIDATOR.validate_json(raw)
+            except ValidationError:
+                pass
+        data = json.loads(raw)
+        self._validate_schema(data)
+        return data
+
+    @staticmethod
+    def _retry_messages(raw, exc: Exception) -> list[dict]:
+        return [
+            {"role": "assistant", "content": str(raw)},
+            {
+                "role": "user",
+                "content": (
+                    "Your previous response was invalid. "
+                    f"{exc} "
+                    "Return only valid JSON that exactly matches the required schema."
+                ),
+            },
+        ]
+
+    @staticmethod
+    def _repair_messages(pending: dict, errors: list[tuple[str, int, str]]) -> list[dict]:
+        fragments = [
+            {"section": section, "index": idx, "item": pending[section][idx], "error": error}
+            for section, idx, error in errors
+        ]
+        return [
+            {"role": "system", "content": REPAIR_PROMPT},
+            {"role": "user", "content": json.dumps({"items": fragments}, ensure_ascii=False)},
+        ]
+
+    def _accept(self, raw, pending: dict | None) -> dict:
+        """
+        Parse and validate a response. A response to a repair request only
+        carries the repaired fragments, which are spliced back into pending.
+        """
+        if pending is None:
+            return self._parse_output(raw)
+
+        repaired = json.loads(raw)
+        if not isinstance(repaired, dict) or not isinstance(repaired.get("items"), list):
+            raise ValueError("Repair response must be an object with an 'items' array.")
+        for fragment in repaired["items"]:
+            if not isinstance(fragment, dict):
+                continue
+            section, idx = fragment.get("section"), fragment.get("index")
+            if section in pending and isinstance(idx, int) and 0 <= idx < len(pending[section]):
+                pending[section][idx] = fragment.get("item")
+        self._validate_schema(pending)
+        return pending
+
+    def _next_request(
+        self,
+        messages: list[dict],
+        raw,
+        exc: Exception,
+        pending: dict | None,
+    ) -> tuple[list[dict], dict | None]:
+        """
+        Build the request for the next attempt. Replay mode resends the whole
+        conversation plus a correction; repair mode sends only the invalid
+        items when the rest of the payload is usable.
+        """
+        replay = messages + self._retry_messages(raw, exc)
+        replay_tokens = estimate_tokens(replay)
+
+        if self.retry_mode == "repair":
+            candidate = pending
+            if candidate is None:
+                try:
+                    candidate = json.loads(raw)
+                    self._validate_top_level(candidate)
+                except (json.JSONDecodeError, TypeError, ValueError):
+                    candidate = None
+            errors = self._item_errors(candidate) if candidate is not None else []
+            if errors:
+                request = self._repair_messages(candidate, errors)
+                self.retry_stats.record("repair", estimate_tokens(request), replay_tokens)
+                return request, candidate
+
+        messages.extend(self._retry_messages(raw, exc))
+        self.retry_stats.record("replay", replay_tokens, replay_tokens)
+        return messages, None
+
+    def _request_format(self, pending: dict | None) -> dict:
+        # Repair requests answer REPAIR_PROMPT's fragment shape, not the extraction schema
+        return self.response_format if pending is None else {"type": "json_object"}
+
+    def _exhausted(self, last_error: Exception | None) -> ValueError:
+        return ValueError(
+            f"Model output failed validation after {self.max_attempts} attempts: {last_error}"
+        )
+
+    def _version(self) -> str:
+        # The response mode changes what the model is asked for, so it keys cache entries and snapshots
+        version = f"{EXTRACTOR_VERSION}:{self.response_mode}"
+        if self.chunk_chars:
+            version += f":chunks={self.chunk_chars}/{self.chunk_overlap_turns}"
+        return version
+
+    def _cache_key(self, transcript: str, client) -> str | None:
+        if self.cache is None:
+            return None
+        return cache_key(
+            transcript,
+            model=getattr(client, "model", DEFAULT_MODEL),
+            temperature=getattr(client, "temperature", 0.0),
+            version=self._version(),
+        )
+
+    @property
+    def model(self) -> str:
+        return getattr(self.client or self.async_client, "model", DEFAULT_MODEL)
+
+    def prompt_version(self) -> str:
+        """
+        Everything besides the model that shapes this extractor's output:
+        extractor version, response mode, chunking and a digest of the
+        system prompt.
+        """
+        digest = hashlib.sha256(SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:12]
+        return f"{self._version()}:{digest}"
+
+    def chunks(self, transcript: str) -> list[str]:
+        """
+        The windows extract() sends for a transcript: the whole transcript,
+        or its chunk_chars-sized windows when it is longer than that.
+        """
+        if not self.chunk_chars:
+            return [transcript]
+        return split_transcript(transcript, self.chunk_chars, self.chunk_overlap_turns)
+
+    def build_request(self, transcript: str) -> dict:
+        """
+        The chat-completion request body extract() sends for a transcript,
+        for submitting the work through an offline bulk job instead.
+        """
+        client = self.client or self.async_client
+        return {
+            "model": getattr(client, "model", DEFAULT_MODEL),
+            "temperature": getattr(client, "temperature", 0.0),
+            "messages": self._build_messages(transcript),
+            "response_format": self.response_format,
+        }
+
+    def parse_completion(self, raw, transcript: str) -> dict:
+        """
+        Validate a completion produced elsewhere and normalize its due dates,
+        yielding the same output extract() returns for an accepted response.
+        """
+        data = self._parse_output(raw)
+        self._normalize_due_dates(data, transcript)
+        return data
+
+    # Method to extract structured information from unstructured text
+    def extract(self, transcript: str):
+        if self.client is None:
+            self.client = OpenAIClient()
+
+        key = self._cache_key(transcript, self.client)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        chunks = self.chunks(transcript)
+        if len(chunks) == 1:
+            data = self._extract_window(transcript)
+        else:
+            # Map each window concurrently, then reduce into one payload
+            # Each window runs in a copy of this context, so it reports to the caller's usage meter
+            contexts = [copy_context() for _ in chunks]
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as pool:
+                windows = pool.map(lambda context, chunk: context.run(self._extract_window, chunk), contexts, chunks)
+                data = merge_chunk_results(list(windows))
+
+        if key is not None:
+            self.cache.set(key, data)
+        return data
+
+    def _extract_window(self, transcript: str) -> dict:
+        messages = self._build_messages(transcript)
+        request, pending = messages, None
         last_error = None
 
-        for _ in range(self.max_attempts):
+        for attempt in range(1, self.max_attempts + 1):
             raw = self.client.chat_completion(
-                messages=messages,
-                response_format={"type": "json_object"}
+                messages=request,
+                response_format=self._request_format(pending),
             )
             try:
-                data = json.loads(raw)
-                self._validate_schema(data)
+                data = self._accept(raw, pending)
                 break
             except (json.JSONDecodeError, TypeError, ValueError) as exc:
                 last_error = exc
-                messages.extend(
-                    [
-                        {"role": "assistant", "content": str(raw)},
-                        {
-                            "role": "user",
-                            "content": (
-                                "Your previous response was invalid. "
-                                f"{exc} "
-                                "Return only valid JSON that exactly matches the required schema."
-                            ),
-                        },
-                    ]
-                )
+                request, pending = self._next_request(messages, raw, exc, pending)
         else:
-            raise ValueError(
-                f"Model output failed validation after {self.max_attempts} attempts: {last_error}"
-            )
+            self.retry_stats.record_extraction(self.response_mode, self.max_attempts)
+            usage.record_window(self.max_attempts)
+            raise self._exhausted(last_error)
 
-        # Parse the meeting date from the transcript to use as a reference for normalizing due dates. This will allow the extractor to convert relative due phrases into absolute dates based on the meeting date.
-        meeting_date = parse_meeting_date(transcript)
+        self.retry_stats.record_extraction(self.response_mode, attempt)
+        usage.record_window(attempt)
 
-        # If a meeting date was found, add it to the data dictionary
-        if meeting_date:
-            # Add the meeting date to the data dictionary so that it can be used for normalizing due dates in the action items and follow-ups. This will allow the extractor to have a reference point for converting relative due phrases into absolute dates.
-            for item in data.get("action_items", []):
+        self._normalize_due_dates(data, transcript)
+        return data
+
+    # Coroutine counterpart of extract(); same retry and validation semantics, but the LLM call is awaited
+    async def aextract(self, transcript: str):
+        if self.async_client is None:
+            self.async_client = AsyncOpenAIClient()
+
+        # Cache lookups can hit SQLite, so they run off the event loop
+        key = self._cache_key(transcript, self.async_client)
+        if key is not None:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return cached
 
-                # Get the raw due date phrase from the item dictionary, which is expected to be set by the LLM based on the system prompt. This will allow the extractor to have access to the original due date phrase from the transcript for normalization.
-                due_raw = item.get("due_raw")
-                normalized = normalize_due_raw(meeting_date, due_raw)
+        chunks = self.chunks(transcript)
+        if len(chunks) == 1:
+            data = await self._aextract_window(transcript)
+        else:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def bounded(chunk: str) -> dict:
+                async with semaphore:
+                    return await self._aextract_window(chunk)
 
-                # Set the normalized due date in the item dictionary. This will allow the extractor to have a standardized date format for the due dates, which can be used for further processing or evaluation.
-                item["due"] = normalized.due
+            data = merge_chunk_results(await asyncio.gather(*(bounded(c) for c in chunks)))
 
-                # Check if the normalized due date needs human review. If it does, set the needs_human_review flag in the item dictionary and provide a reason if one is not already set. This will allow the extractor to flag any due dates that are ambiguous or cannot be confidently normalized, and provide an explanation for why they need human review.
-                if normalized.needs_human_review:
-                    item["needs_human_review"] = True
-                    if not item.get("reason"):
-                        item["reason"] = normalized.reason
-            
-            # Repeat the same normalization process for the follow-up items in the data dictionary, using the meeting date as a reference for normalizing due dates. This will ensure that all due dates in both action items and follow-ups are normalized consistently based on the meeting date.
-            for item in data.get("follow_ups", []):
+        if key is not None:
+            await asyncio.to_thread(self.cache.set, key, data)
+        return data
 
-                # Get the raw due date phrase from the follow-up item dictionary, which is expected to be set by the LLM based on the system prompt. This will allow the extractor to have access to the original due date phrase from the transcript for normalization.
-                due_raw = item.get("due_raw")
-                normalized = normalize_due_raw(meeting_date, due_raw)
+    async def _aextract_window(self, transcript: str) -> dict:
+        messages = self._build_messages(transcript)
+        request, pending = messages, None
+        last_error = None
 
-                # Set the normalized due date in the follow-up item dictionary. This will allow the extractor to have a standardized date format for the due dates in follow-ups as well, which can be used for further processing or evaluation.
-                item["due"] = normalized.due
+        for attempt in range(1, self.max_attempts + 1):
+            raw = await self.async_client.chat_completion(
+                messages=request,
+                response_format=self._request_format(pending),
+            )
+            try:
+                data = self._accept(raw, pending)
+                break
+            except (json.JSONDecodeError, TypeError, ValueError) as exc:
+                last_error = exc
+                request, pending = self._next_request(messages, raw, exc, pending)
+        else:
+            self.retry_stats.record_extraction(self.response_mode, self.max_attempts)
+            usage.record_window(self.max_attempts)
+            raise self._exhausted(last_error)
 
-                if normalized.needs_human_review:
-                    item["needs_human_review"] = True
-                    if not item.get("reason"):
-                        item["reason"] = normalized.reason
+        self.retry_stats.record_extraction(self.response_mode, attempt)
+        usage.record_window(attempt)
 
+        self._normalize_due_dates(data, transcript)
         return data
+
+    # Stream validated, date-normalized items as soon as each one is complete in the model output
+    async def astream(self, transcript: str):
+        """
+        Async generator of item events for one transcript:
+          {"event": "item", "section": ..., "index": ..., "item": {...}}
+          {"event": "invalid_item", "section": ..., "index": ..., "error": ...}
+        Each streamed item is checked with the same per-item rules as
+        _validate_schema. There are no retries, because emitted items cannot
+        be taken back. Output that is not a valid payload once the stream ends
+        raises ValueError. Cached results and chunked transcripts are emitted
+        in one burst once extraction finishes.
+        """
+        if self.async_client is None:
+            self.async_client = AsyncOpenAIClient()
+
+        key = self._cache_key(transcript, self.async_client)
+        data = await asyncio.to_thread(self.cache.get, key) if key is not None else None
+        if data is None and len(self.chunks(transcript)) > 1:
+            data = await self.aextract(transcript)
+        if data is not None:
+            for section in ("action_items", "decisions", "follow_ups"):
+                for idx, item in enumerate(data[section]):
+                    yield {"event": "item", "section": section, "index": idx, "item": item}
+            return
+
+        meeting_date = parse_meeting_date(transcript)
+        validators = self._item_validators()
+        parser = IncrementalItemParser()
+        all_valid = True
+
+        async for delta in self.async_client.chat_completion_stream(
+            messages=self._build_messages(transcript),
+            response_format=self.response_format,
+        ):
+            for section, idx, item in parser.feed(delta):
+                try:
+                    validators[section](idx, item)
+                except (TypeError, ValueError) as exc:
+                    all_valid = False
+                    yield {"event": "invalid_item", "section": section, "index": idx, "error": str(exc)}
+                    continue
+                if meeting_date and section != "decisions":
+                    self._normalize_item(item, meeting_date)
+                yield {"event": "item", "section": section, "index": idx, "item": item}
+
+        data = json.loads(parser.buffer)
+        self._validate_top_level(data)
+        if all_valid and key is not None:
+            self._normalize_due_dates(data, transcript)
+            await asyncio.to_thread(self.cache.set, key, data)
+
+    @staticmethod
+    def _normalize_item(item: dict, meeting_date) -> None:
+        # Get the raw due date phrase from the item dictionary, which is expected to be set by the LLM based on the system prompt. This will allow the extractor to have access to the original due date phrase from the transcript for normalization.
+        due_raw = item.get("due_raw")
+        LLMExtractor._apply_normalized_due(item, normalize_due_raw(meeting_date, due_raw))
+
+    @staticmethod
+    def _apply_normalized_due(item: dict, normalized) -> None:
+        # Set the normalized due date in the item dictionary. This will allow the extractor to have a standardized date format for the due dates, which can be used for further processing or evaluation.
+        item["due"] = normalized.due
+
+        # Check if the normalized due date needs human review. If it does, set the needs_human_review flag in the item dictionary and provide a reason if one is not already set. This will allow the extractor to flag any due dates that are ambiguous or cannot be confidently normalized, and provide an explanation for why they need human review.
+        if normalized.needs_human_review:
+            item["needs_human_review"] = True
+            if not item.get("reason"):
+                item["reason"] = normalized.reason
+
+    @classmethod
+    def _normalize_due_dates(cls, data: dict, transcript: str) -> None:
+        # Parse the meeting date from the transcript to use as a reference for normalizing due dates. This will allow the extractor to convert relative due phrases into absolute dates based on the meeting date.
+        meeting_date = parse_meeting_date(transcript)
+
+        # If a meeting date was found, normalize the due dates of action items and follow-ups against it in one batch. Decisions have no due dates.
+        if meeting_date:
+            items = data.get("action_items", []) + data.get("follow_ups", [])
+            normalized = normalize_due_many(meeting_date, [item.get("due_raw") for item in items])
+            for item, due in zip(items, normalized):
+                cls._apply_normalized_due(item, due)
@@ -0,0 +1,409 @@
+import importlib.util
+import os
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+# Similarity matrices are built with NumPy when it is installed:
+#   EVAL_MATRIX_BACKEND=auto    numpy when installed, pure Python otherwise (default)
+#   EVAL_MATRIX_BACKEND=numpy   require numpy
+#   EVAL_MATRIX_BACKEND=python  always use the pure-Python path
+# Both backends produce bit-identical scores.
+MATRIX_BACKENDS = ("auto", "numpy", "python")
+
+# Rows of the prediction-by-vocabulary count matrix built at once, bounding
+# the memory of the NumPy path on large sections
+NUMPY_ROW_BLOCK = 1024
+
+# Sections with at most this many prediction x gold pairs are scored as a
+# dense NumPy matrix; larger ones (or any without NumPy) use the inverted index
+DENSE_MAX_CELLS = 250_000
+
+# Allowance on the length-ratio bound, far above float rounding in the F1 formula
+LENGTH_BOUND_EPSILON = 1e-9
+
+def _select_backend(name: str) -> str:
+    if name not in MATRIX_BACKENDS:
+        raise ValueError(f"EVAL_MATRIX_BACKEND must be one of {MATRIX_BACKENDS}.")
+    if name == "python":
+        return "python"
+    # Only checked for here; numpy itself is imported on first use, keeping it out of CLI startup
+    if importlib.util.find_spec("numpy") is None:
+        if name == "numpy":
+            raise ImportError("EVAL_MATRIX_BACKEND=numpy but numpy is not installed.")
+        return "python"
+    return "numpy"
+
+
+def numpy_module():
+    """
+    The numpy module when the numpy backend is selected, None otherwise.
+    """
+    if BACKEND != "numpy":
+        return None
+    import numpy
+
+    return numpy
+
+
+def set_backend(name: str) -> str:
+    """
+    Switch backends at runtime (tests and benchmarks); returns the backend in use.
+    """
+    global BACKEND
+    BACKEND = _select_backend(name)
+    return BACKEND
+
+
+BACKEND = _select_backend(os.getenv("EVAL_MATRIX_BACKEND", "auto"))
+
+
+def f1_from_counts(overlap: int, a_len: int, b_len: int) -> float:
+    """
+    Token F1 from the size of the bag overlap and of each bag, with the same
+    arithmetic as evaluator._f1_over_tokens so scores compare exactly.
+    """
+    if not a_len and not b_len:
+        return 1.0
+    if not a_len or not b_len or overlap == 0:
+        return 0.0
+    precision = overlap / a_len
+    recall = overlap / b_len
+    return (2 * precision * recall) / (precision + recall)
+
+
+def f1_matrix(pred_tokens: Sequence[List[str]], gold_tokens: Sequence[List[str]]) -> List[List[float]]:
+    """
+    Token-F1 of every prediction against every gold item, with each side
+    counted once. Row i holds prediction i's scores against all gold items.
+    """
+    if not pred_tokens or not gold_tokens:
+        return [[] for _ in pred_tokens]
+    if numpy_module() is not None:
+        return _f1_matrix_numpy(pred_tokens, gold_tokens).tolist()
+
+    gold_counts = [Counter(tokens) for tokens in gold_tokens]
+    gold_lens = [len(tokens) for tokens in gold_tokens]
+    rows = []
+    for tokens in pred_tokens:
+        counts = Counter(tokens)
+        rows.append([
+            f1_from_counts(sum((counts & other).values()), len(tokens), other_len)
+            for other, other_len in zip(gold_counts, gold_lens)
+        ])
+    return rows
+
+
+def _count_matrix(token_lists: Sequence[List[str]], vocab: Dict[str, int]):
+    np = numpy_module()
+    counts = np.zeros((len(token_lists), len(vocab)), dtype=np.int32)
+    rows, cols = [], []
+    for i, tokens in enumerate(token_lists):
+        for token in tokens:
+            col = vocab.get(token)
+            if col is not None:
+                rows.append(i)
+                cols.append(col)
+    np.add.at(counts, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), 1)
+    return counts
+
+
+def _f1_matrix_numpy(pred_tokens: Sequence[List[str]], gold_tokens: Sequence[List[str]]):
+    np = numpy_module()
+    # Only tokens present on both sides can overlap
+    shared = set().union(*map(set, pred_tokens)) & set().union(*map(set, gold_tokens))
+    vocab = {token: i for i, token in enumerate(sorted(shared))}
+    pred_lens = np.array([len(t) for t in pred_tokens], dtype=np.float64)
+    gold_lens = np.array([len(t) for t in gold_tokens], dtype=np.float64)
+
+    # Bag overlap is sum(min(a, b)) over tokens; min(a, b) = #{k >= 1 : a >= k and b >= k},
+    # so the overlap matrix is a sum of 0/1 matrix products, one per repeat level
+    overlap = np.zeros((len(pred_tokens), len(gold_tokens)), dtype=np.float64)
+    if vocab:
+        gold_counts = _count_matrix(gold_tokens, vocab)
+        for start in range(0, len(pred_tokens), NUMPY_ROW_BLOCK):
+            pred_counts = _count_matrix(pred_tokens[start:start + NUMPY_ROW_BLOCK], vocab)
+            for k in range(1, int(min(pred_counts.max(), gold_counts.max())) + 1):
+                overlap[start:start + len(pred_counts)] += (
+                    (pred_counts >= k).astype(np.float64) @ (gold_counts >= k).astype(np.float64).T
+                )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = overlap / pred_lens[:, None]
+        recall = overlap / gold_lens[None, :]
+        scores = (2 * precision * recall) / (precision + recall)
+    scores[overlap == 0] = 0.0
+    scores[np.outer(pred_lens == 0, gold_lens == 0)] = 1.0
+    return scores
+
+
+class DenseScores:
+    """
+    Scores read off a full token-F1 matrix (list rows or a NumPy array).
+    Small sections are cheapest this way when NumPy does the arithmetic.
+    """
+
+    def __init__(self, matrix, threshold: float):
+        self.matrix = matrix
+        self.threshold = threshold
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    def candidates(self, i: int) -> Dict[int, float]:
+        """
+        Gold items that prediction i matches at or above threshold.
+        """
+        row = self.matrix[i]
+        np = numpy_module()
+        if np is not None and isinstance(row, np.ndarray):
+            cols = np.flatnonzero((row > 0) & (row >= self.threshold))
+            return dict(zip(cols.tolist(), row[cols].tolist()))
+        return {j: score for j, score in enumerate(row) if score > 0 and score >= self.threshold}
+
+    def best_score(self, i: int, excluded: set) -> float:
+        """
+        Prediction i's best score against gold items outside excluded.
+        """
+        row = self.matrix[i]
+        np = numpy_module()
+        if np is not None and isinstance(row, np.ndarray):
+            if not len(row):
+                return 0.0
+            if excluded:
+                row = row.copy()
+                row[list(excluded)] = 0.0
+            return float(row.max())
+        return max((score for j, score in enumerate(row) if j not in excluded), default=0.0)
+
+
+class IndexedScores:
+    """
+    Scores computed on demand from a token -> gold item inverted index, so
+    cost follows the pairs that share a token rather than P x G. Postings are
+    sorted by gold length: token-F1 is at most 2·min(a, b) / (a + b), so a
+    gold item whose length is too far from the prediction's cannot reach
+    threshold and is never scored. Scores are exactly those of f1_matrix.
+    """
+
+    def __init__(self, pred_tokens: Sequence[List[str]], gold_tokens: Sequence[List[str]], threshold: float):
+        self.threshold = threshold
+        self.pred_counts = [Counter(tokens) for tokens in pred_tokens]
+        self.pred_lens = [len(tokens) for tokens in pred_tokens]
+        self.gold_lens = [len(tokens) for tokens in gold_tokens]
+        self.empty_gold = [j for j, n in enumerate(self.gold_lens) if n == 0]
+
+        postings: Dict[str, List[Tuple[int, int, int]]] = {}
+        for j, tokens in enumerate(gold_tokens):
+            for token, count in Counter(tokens).items():
+                postings.setdefault(token, []).append((len(tokens), j, count))
+        # token -> (sorted gold lengths, [(gold index, count)]) for bisecting on length
+        self.postings = {}
+        for token, entries in postings.items():
+            entries.sort()
+            self.postings[token] = ([n for n, _, _ in entries], [(j, count) for _, j, count in entries])
+
+    def __len__(self) -> int:
+        return len(self.pred_counts)
+
+    def _length_window(self, length: int) -> Tuple[float, float]:
+        # The bound is compared with a small allowance so rounding in the
+        # F1 formula can never prune a pair that scores exactly threshold
+        t = self.threshold - LENGTH_BOUND_EPSILON
+        if t <= 0:
+            return 0, float("inf")
+        if t > 1:
+            return float("inf"), float("-inf")
+        return length * t / (2 - t), length * (2 - t) / t
+
+    def _scores(self, i: int, lo: float, hi: float) -> Dict[int, float]:
+        length = self.pred_lens[i]
+        if length == 0:
+            return {j: 1.0 for j in self.empty_gold}
+        overlap: Dict[int, int] = {}
+        for token, count in self.pred_counts[i].items():
+            entry = self.postings.get(token)
+            if entry is None:
+                continue
+            lens, golds = entry
+            for j, gold_count in golds[bisect_left(lens, lo):bisect_right(lens, hi)]:
+                overlap[j] = overlap.get(j, 0) + min(count, gold_count)
+        gold_lens = self.gold_lens
+        return {j: f1_from_counts(o, length, gold_lens[j]) for j, o in overlap.items()}
+
+    def candidates(self, i: int) -> Dict[int, float]:
+        lo, hi = self._length_window(self.pred_lens[i])
+        threshold = self.threshold
+        return {j: score for j, score in self._scores(i, lo, hi).items() if score > 0 and score >= threshold}
+
+    def best_score(self, i: int, excluded: set) -> float:
+        # Only reached for unmatched predictions, so every token-sharing gold item is scored
+        scores = self._scores(i, 0, float("inf"))
+        return max((score for j, score in scores.items() if j not in excluded), default=0.0)
+
+
+def section_scores(pred_tokens: Sequence[List[str]], gold_tokens: Sequence[List[str]], threshold: float):
+    """
+    DenseScores from a NumPy matrix for sections up to DENSE_MAX_CELLS pairs,
+    IndexedScores otherwise. Both give identical matches and scores.
+    """
+    if numpy_module() is not None and len(pred_tokens) * len(gold_tokens) <= DENSE_MAX_CELLS:
+        if not pred_tokens or not gold_tokens:
+            return DenseScores([[] for _ in pred_tokens], threshold)
+        return DenseScores(_f1_matrix_numpy(pred_tokens, gold_tokens), threshold)
+    return IndexedScores(pred_tokens, gold_tokens, threshold)
+
+
+class SweepScores:
+    """
+    Candidates of a scorer built at the lowest threshold of a sweep, kept so
+    every higher threshold is a filter over them rather than a rescoring.
+    Pass at(threshold) to an assignment with best_scores=False.
+    """
+
+    def __init__(self, scores):
+        self.threshold = scores.threshold
+        self.rows = [scores.candidates(i) for i in range(len(scores))]
+
+    def at(self, threshold: float) -> "SweepScores":
+        if threshold < self.threshold:
+            raise ValueError(f"Sweep candidates were built for thresholds from {self.threshold}.")
+        view = SweepScores.__new__(SweepScores)
+        view.threshold = threshold
+        view.rows = [{j: score for j, score in row.items() if score >= threshold} for row in self.rows]
+        return view
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def candidates(self, i: int) -> Dict[int, float]:
+        return self.rows[i]
+
+
+def greedy_assignment(scores, best_scores: bool = True) -> Tuple[Dict[int, Tuple[int, float]], Dict[int, float]]:
+    """
+    The evaluator's original matching: each prediction in order takes the
+    best-scoring gold item not yet taken (the first one on ties) if it reaches
+    threshold. Returns ({pred: (gold, score)}, {unmatched pred: best score at
+    its turn}); the second map is left empty when best_scores is False.
+    """
+    taken: set = set()
+    pairs: Dict[int, Tuple[int, float]] = {}
+    unmatched: Dict[int, float] = {}
+    for i in range(len(scores)):
+        best = min(((-score, j) for j, score in scores.candidates(i).items() if j not in taken), default=None)
+        if best is None:
+            if best_scores:
+                unmatched[i] = scores.best_score(i, taken)
+            continue
+        taken.add(best[1])
+        pairs[i] = (best[1], -best[0])
+    return pairs, unmatched
+
+
+def optimal_assignment(scores, best_scores: bool = True) -> Tuple[Dict[int, Tuple[int, float]], Dict[int, float]]:
+    """
+    Maximum-weight one-to-one matching over the pairs scoring at least
+    threshold (and above zero), so the result does not depend on prediction
+    order. The bipartite graph is split into connected components and each
+    one is solved on its own, which keeps the assignment problems small.
+    Returns ({pred: (gold, score)}, {unmatched pred: best score against gold
+    items left unmatched}); the second map is left empty when best_scores is
+    False.
+    """
+    edges = [(i, j, score) for i in range(len(scores)) for j, score in sorted(scores.candidates(i).items())]
+
+    parent: Dict[Tuple[str, int], Tuple[str, int]] = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j, _ in edges:
+        parent[find(("pred", i))] = find(("gold", j))
+
+    components: Dict[Tuple[str, int], List[Tuple[int, int, float]]] = {}
+    for edge in edges:
+        components.setdefault(find(("pred", edge[0])), []).append(edge)
+
+    pairs: Dict[int, Tuple[int, float]] = {}
+    for component in components.values():
+        if len(component) == 1:
+            i, j, score = component[0]
+            pairs[i] = (j, score)
+            continue
+        rows = sorted({i for i, _, _ in component})
+        cols = sorted({j for _, j, _ in component})
+        weights = [[0.0] * len(cols) for _ in rows]
+        row_pos = {i: r for r, i in enumerate(rows)}
+        col_pos = {j: c for c, j in enumerate(cols)}
+        for i, j, score in component:
+            weights[row_pos[i]][col_pos[j]] = score
+        for r, c in max_weight_matching(weights):
+            if weights[r][c] > 0:
+                pairs[rows[r]] = (cols[c], weights[r][c])
+
+    if not best_scores:
+        return pairs, {}
+    matched_gold = {j for j, _ in pairs.values()}
+    unmatched = {i: scores.best_score(i, matched_gold) for i in range(len(scores)) if i not in pairs}
+    return pairs, unmatched
+
+
+def max_weight_matching(weights: List[List[float]]) -> List[Tuple[int, int]]:
+    """
+    Hungarian algorithm (shortest augmenting paths with potentials, O(n²m))
+    on a dense weight matrix. Returns (row, col) pairs covering every row
+    when there are at most as many rows as columns, every column otherwise.
+    """
+    if not weights or not weights[0]:
+        return []
+    transpose = len(weights) > len(weights[0])
+    if transpose:
+        weights = [list(col) for col in zip(*weights)]
+    n, m = len(weights), len(weights[0])
+    inf = float("inf")
+
+    # 1-based arrays; column 0 is a virtual column holding the row being inserted
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    owner = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for row in range(1, n + 1):
+        owner[0] = row
+        j0 = 0
+        min_to = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            cost_row = weights[i0 - 1]
+            delta, j1 = inf, 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    # Costs are negated weights: maximizing weight minimizes cost
+                    reduced = -cost_row[j - 1] - u[i0] - v[j]
+                    if reduced < min_to[j]:
+                        min_to[j] = reduced
+                        way[j] = j0
+                    if min_to[j] < delta:
+                        delta, j1 = min_to[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[owner[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_to[j] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+
+    pairs = [(owner[j] - 1, j - 1) for j in range(1, m + 1) if owner[j]]
+    return [(c, r) for r, c in pairs] if transpose else pairs
@@ -0,0 +1,124 @@
+from typing import Any, Dict
+
+from pydantic_core import SchemaValidator, core_schema
+
+
+SECTION_NAMES = ("action_items", "decisions", "follow_ups")
+
+# Field kinds of the model-output contract, before due-date normalization:
+#   "string"           a JSON string
+#   "nullable_string"  a JSON string or null
+#   "null"             always null (filled in by the extractor afterwards)
+#   "boolean"          a JSON boolean
+# LLMExtractor validates responses against this table and the strict JSON
+# Schema below is generated from it, so the two can never disagree.
+ITEM_CONTRACT: Dict[str, Dict[str, str]] = {
+    "action_items": {
+        "text": "string",
+        "owner": "nullable_string",
+        "due_raw": "nullable_string",
+        "due": "null",
+        "evidence": "string",
+        "needs_human_review": "boolean",
+        "reason": "nullable_string",
+    },
+    "decisions": {
+        "text": "string",
+        "evidence": "string",
+    },
+    "follow_ups": {
+        "text": "string",
+        "owner": "nullable_string",
+        "due_raw": "nullable_string",
+        "due": "null",
+        "evidence": "string",
+    },
+}
+
+_KIND_SCHEMAS = {
+    "string": {"type": "string"},
+    "nullable_string": {"type": ["string", "null"]},
+    "null": {"type": "null"},
+    "boolean": {"type": "boolean"},
+}
+
+_KIND_CORE_SCHEMAS = {
+    "string": core_schema.str_schema(strict=True),
+    "nullable_string": core_schema.nullable_schema(core_schema.str_schema(strict=True)),
+    "null": core_schema.none_schema(),
+    "boolean": core_schema.bool_schema(strict=True),
+}
+
+# "json_object" only guarantees syntactically valid JSON; "json_schema" asks the
+# API to constrain decoding to the contract so shape errors cannot occur
+RESPONSE_MODES = ("json_object", "json_schema")
+
+SCHEMA_NAME = "meeting_extraction"
+
+
+def _object_schema(properties: Dict[str, Any]) -> Dict[str, Any]:
+    # Strict mode requires every property to be listed as required and no extras
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def item_json_schema(section: str) -> Dict[str, Any]:
+    return _object_schema(
+        {field: dict(_KIND_SCHEMAS[kind]) for field, kind in ITEM_CONTRACT[section].items()}
+    )
+
+
+def extraction_json_schema() -> Dict[str, Any]:
+    """
+    JSON Schema for a whole extraction response, in the subset accepted by
+    structured outputs with strict=True.
+    """
+    return _object_schema(
+        {
+            section: {"type": "array", "items": item_json_schema(section)}
+            for section in SECTION_NAMES
+        }
+    )
+
+
+def response_format_for(mode: str) -> Dict[str, Any]:
+    if mode == "json_object":
+        return {"type": "json_object"}
+    if mode == "json_schema":
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": SCHEMA_NAME,
+                "strict": True,
+                "schema": extraction_json_schema(),
+            },
+        }
+    raise ValueError(f"response_mode must be one of {RESPONSE_MODES}.")
+
+
+def _compile_output_validator() -> SchemaValidator:
+    def item(section: str):
+        fields = {
+            field: core_schema.typed_dict_field(_KIND_CORE_SCHEMAS[kind])
+            for field, kind in ITEM_CONTRACT[section].items()
+        }
+        return core_schema.typed_dict_schema(fields, extra_behavior="forbid")
+
+    return SchemaValidator(
+        core_schema.typed_dict_schema(
+            {
+                section: core_schema.typed_dict_field(core_schema.list_schema(item(section), strict=True))
+                for section in SECTION_NAMES
+            },
+            extra_behavior="forbid",
+        )
+    )
+
+
+# Parses and checks a raw response against ITEM_CONTRACT in one pass, returning plain dicts;
+# raises pydantic_core.ValidationError on anything the hand-written validators would reject
+OUTPUT_VALIDATOR = _compile_output_validator()
@@ -0,0 +1,268 @@
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from lib import jsonio
+from src.eval_runner import SECTION_NAMES
+
+
+DEFAULT_HISTORY_PATH = ".cache/eval_history.sqlite3"
+
+# A run regresses when a metric grows by more than this fraction of the baseline
+LATENCY_TOLERANCE = 0.20
+COST_TOLERANCE = 0.10
+# Timing differences below this are noise, whatever the ratio
+LATENCY_FLOOR_SECONDS = 0.05
+
+LATENCY_METRICS = ("wall_seconds", "extract_seconds", "llm_seconds", "scoring_seconds")
+COST_METRICS = ("llm_calls", "retries", "prompt_tokens", "completion_tokens", "total_tokens")
+TOKEN_METRICS = ("prompt_tokens", "completion_tokens", "total_tokens")
+
+_COLUMNS = (
+    ("created_at", "REAL NOT NULL"),
+    ("transcript_path", "TEXT NOT NULL"),
+    ("gold_path", "TEXT NOT NULL"),
+    ("source", "TEXT NOT NULL"),
+    ("model", "TEXT"),
+    ("prompt_version", "TEXT"),
+    ("text_threshold", "REAL NOT NULL"),
+    ("matching", "TEXT NOT NULL"),
+    ("similarity", "TEXT NOT NULL"),
+    ("precision", "REAL NOT NULL"),
+    ("recall", "REAL NOT NULL"),
+    ("matched", "INTEGER NOT NULL"),
+    ("hallucinations", "INTEGER NOT NULL"),
+    ("missed", "INTEGER NOT NULL"),
+    ("sections", "TEXT NOT NULL"),
+)
+# Copied from the "performance" block of a run_evaluation result
+_PERFORMANCE_COLUMNS = (
+    ("wall_seconds", "REAL NOT NULL"),
+    ("extract_seconds", "REAL NOT NULL"),
+    ("llm_seconds", "REAL NOT NULL"),
+    ("scoring_seconds", "REAL NOT NULL"),
+    ("llm_calls", "INTEGER NOT NULL"),
+    ("calls_without_usage", "INTEGER NOT NULL"),
+    ("windows", "INTEGER NOT NULL"),
+    ("attempts", "INTEGER NOT NULL"),
+    ("retries", "INTEGER NOT NULL"),
+    ("prompt_tokens", "INTEGER NOT NULL"),
+    ("completion_tokens", "INTEGER NOT NULL"),
+)
+
+
+def _row(cursor: sqlite3.Cursor, values: tuple) -> Dict[str, Any]:
+    run = {column[0]: value for column, value in zip(cursor.description, values)}
+    run["sections"] = jsonio.loads(run["sections"])
+    run["total_tokens"] = run["prompt_tokens"] + run["completion_tokens"]
+    return run
+
+
+class RunHistory:
+    """
+    Evaluation runs kept in a SQLite file: scoring settings, precision and
+    recall, and where the time and tokens went (wall, extraction, LLM and
+    scoring seconds; calls, windows, attempts, prompt/completion tokens).
+    Runs of the same transcript/gold pair can then be compared over time.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = _row
+        columns = ", ".join(f"{name} {kind}" for name, kind in _COLUMNS + _PERFORMANCE_COLUMNS)
+        self._db.execute(f"CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY AUTOINCREMENT, {columns})")
+        self._db.execute("CREATE INDEX IF NOT EXISTS runs_by_pair ON runs (transcript_path, gold_path, source)")
+        self._db.commit()
+
+    def record(
+        self,
+        result: Dict[str, Any],
+        model: Optional[str] = None,
+        prompt_version: Optional[str] = None,
+        source: str = "model",
+    ) -> Dict[str, Any]:
+        """
+        Store a run_evaluation result; source is "model" for a fresh
+        extraction and "snapshot" for a re-scored snapshot.
+        """
+        overall, performance = result["overall"], result["performance"]
+        sections = {
+            name: {"precision": result[name]["precision"], "recall": result[name]["recall"]} for name in SECTION_NAMES
+        }
+        values = {
+            "created_at": time.time(),
+            "transcript_path": result["transcript_path"],
+            "gold_path": result["gold_path"],
+            "source": source,
+            "model": model,
+            "prompt_version": prompt_version,
+            "text_threshold": result["text_threshold"],
+            "matching": result.get("matching", "optimal"),
+            "similarity": result["similarity"],
+            "precision": overall["precision"],
+            "recall": overall["recall"],
+            "matched": overall["matched"],
+            "hallucinations": overall["hallucinations"],
+            "missed": overall["missed"],
+            "sections": jsonio.dumps(sections),
+            **{name: performance[name] for name, _ in _PERFORMANCE_COLUMNS},
+        }
+        placeholders = ", ".join("?" for _ in values)
+        with self._lock:
+            cursor = self._db.execute(
+                f"INSERT INTO runs ({', '.join(values)}) VALUES ({placeholders})", tuple(values.values())
+            )
+            self._db.commit()
+            run_id = cursor.lastrowid
+        return self.get(run_id)
+
+    def get(self, run_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._db.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+
+    def previous(self, run: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        The latest earlier run of the same transcript/gold pair from the same
+        source, the natural baseline for run.
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT * FROM runs WHERE transcript_path = ? AND gold_path = ? AND source = ? AND id < ?"
+                " ORDER BY id DESC LIMIT 1",
+                (run["transcript_path"], run["gold_path"], run["source"], run["id"]),
+            ).fetchone()
+
+    def runs(self, transcript_path: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Recent runs, newest first, optionally of one transcript only.
+        """
+        query, params = "SELECT * FROM runs", ()
+        if transcript_path is not None:
+            query, params = query + " WHERE transcript_path = ?", (transcript_path,)
+        with self._lock:
+            return self._db.execute(query + " ORDER BY id DESC LIMIT ?", params + (limit,)).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def history_path_from_env() -> Optional[str]:
+    """
+    EVAL_HISTORY_PATH, or None when it is unset or "": runs are only
+    recorded when asked for.
+    """
+    return os.getenv("EVAL_HISTORY_PATH") or None
+
+
+def _regressed(metric: str, baseline: float, candidate: float, tolerance: float) -> bool:
+    if candidate <= baseline * (1 + tolerance):
+        return False
+    return metric not in LATENCY_METRICS or candidate - baseline > LATENCY_FLOOR_SECONDS
+
+
+def compare_runs(
+    baseline: Dict[str, Any],
+    candidate: Dict[str, Any],
+    latency_tolerance: float = LATENCY_TOLERANCE,
+    cost_tolerance: float = COST_TOLERANCE,
+) -> Dict[str, Any]:
+    """
+    Per-metric deltas from baseline to candidate. Latency and cost metrics
+    that grew past their tolerance are listed in "regressions"; precision
+    and recall deltas are reported as they are. Token counts are only
+    judged when every call of both runs reported its usage.
+    """
+    tokens_known = not (baseline["calls_without_usage"] or candidate["calls_without_usage"])
+    metrics = []
+
+    def add(name: str, before: float, after: float, kind: str, tolerance: Optional[float] = None) -> None:
+        metrics.append(
+            {
+                "name": name,
+                "kind": kind,
+                "baseline": before,
+                "candidate": after,
+                "delta": after - before,
+                "regression": tolerance is not None and _regressed(name, before, after, tolerance),
+            }
+        )
+
+    add("precision", baseline["precision"], candidate["precision"], "quality")
+    add("recall", baseline["recall"], candidate["recall"], "quality")
+    for section in SECTION_NAMES:
+        for measure in ("precision", "recall"):
+            before = baseline["sections"][section][measure]
+            after = candidate["sections"][section][measure]
+            add(f"{section}.{measure}", before, after, "quality")
+    for name in LATENCY_METRICS:
+        add(name, baseline[name], candidate[name], "latency", latency_tolerance)
+    for name in COST_METRICS:
+        judged = tokens_known or name not in TOKEN_METRICS
+        add(name, baseline[name], candidate[name], "cost", cost_tolerance if judged else None)
+
+    return {
+        "baseline": baseline,
+        "candidate": candidate,
+        "tokens_known": tokens_known,
+        "metrics": metrics,
+        "regressions": [m["name"] for m in metrics if m["regression"]],
+    }
+
+
+def _describe_run(run: Dict[str, Any]) -> str:
+    created = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run["created_at"]))
+    return (
+        f"#{run['id']} {created} {run['source']} model={run['model']} prompt={run['prompt_version']} "
+        f"threshold={run['text_threshold']:.2f} {run['matching']}/{run['similarity']}"
+    )
+
+
+def _format_value(kind: str, value: float) -> str:
+    if kind == "quality":
+        return f"{value:.3f}"
+    if isinstance(value, float):
+        return f"{value:.3f}s"
+    return str(value)
+
+
+def _format_delta(metric: Dict[str, Any]) -> str:
+    delta, before = metric["delta"], metric["baseline"]
+    if metric["kind"] == "quality":
+        return f"{delta:+.3f}"
+    text = f"{delta:+.3f}s" if isinstance(delta, float) else f"{delta:+d}"
+    if before:
+        text += f" ({delta / before:+.0%})"
+    return text
+
+
+def format_comparison(comparison: Dict[str, Any]) -> str:
+    lines = [
+        "Run Comparison",
+        "==============",
+        f"baseline:  {_describe_run(comparison['baseline'])}",
+        f"candidate: {_describe_run(comparison['candidate'])}",
+        "",
+        f"{'metric':<26} {'baseline':>12} {'candidate':>12} {'delta':>18}",
+    ]
+    lines.append("-" * len(lines[-1]))
+    for metric in comparison["metrics"]:
+        row = (
+            f"{metric['name']:<26} {_format_value(metric['kind'], metric['baseline']):>12} "
+            f"{_format_value(metric['kind'], metric['candidate']):>12} {_format_delta(metric):>18}"
+        )
+        if metric["regression"]:
+            row += f"  REGRESSION ({metric['kind']})"
+        lines.append(row)
+    lines.append("")
+    if not comparison["tokens_known"]:
+        lines.append("token counts not judged: some calls reported no usage (streams or cassette replays)")
+    regressions = comparison["regressions"]
+    lines.append(f"regressions: {', '.join(regressions)}" if regressions else "regressions: none")
+    return "\n".join(lines)
@@ -0,0 +1,326 @@
+import math
+import random
+import re
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+from src import matching
+
+# Text similarity used to pair predicted and gold items:
+#   token_f1      bag-of-words token F1 (default); exact
+#   char_jaccard  Jaccard similarity of character trigram sets; exact,
+#                 tolerant of inflections and typos
+#   minhash       MinHash estimate of char_jaccard with LSH candidate
+#                 generation; approximate, for very large sections
+# Every backend turns each text into a vector once, then scores a whole
+# section through an object with the matching.IndexedScores interface.
+SIMILARITIES = ("token_f1", "char_jaccard", "minhash")
+DEFAULT_SIMILARITY = "token_f1"
+
+CHAR_NGRAM = 3
+
+# 64 hashes in 16 bands of 4: pairs at Jaccard 0.5 share a band about 64% of
+# the time, pairs at 0.75 more than 99% of the time
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+
+# Gram slots per NumPy block: an items x grams x MINHASH_PERMUTATIONS int64 array
+MINHASH_BLOCK_GRAMS = 1 << 16
+
+# Mersenne prime for the universal hashes (a*x + b) mod p; with x < 2**32 every
+# intermediate fits in int64, so the NumPy and pure-Python signatures agree
+_MINHASH_PRIME = (1 << 31) - 1
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+
+_rng = random.Random(0x5EED)
+_MINHASH_PARAMS = [
+    (_rng.randrange(1, _MINHASH_PRIME), _rng.randrange(0, _MINHASH_PRIME)) for _ in range(MINHASH_PERMUTATIONS)
+]
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def char_ngrams(text: str, n: int = CHAR_NGRAM) -> set:
+    """
+    Character n-grams of the lowercased tokens joined by single spaces and
+    padded with one space on each side; empty for text without tokens.
+    """
+    tokens = tokenize(text)
+    if not tokens:
+        return set()
+    padded = f" {' '.join(tokens)} "
+    return {padded[k:k + n] for k in range(max(len(padded) - n + 1, 1))}
+
+
+class TokenF1:
+    """
+    The evaluator's token-F1. Tokens are interned to integers shared by both
+    sides of a section, and sections are scored by matching.section_scores
+    (dense NumPy matrix or inverted index).
+    """
+
+    name = "token_f1"
+
+    def vectors(self, pred_texts: Sequence[str], gold_texts: Sequence[str]) -> Tuple[List[array], List[array]]:
+        ids: Dict[str, int] = {}
+
+        def intern(text: str) -> array:
+            return array("l", [ids.setdefault(token, len(ids)) for token in tokenize(text)])
+
+        return [intern(t) for t in pred_texts], [intern(t) for t in gold_texts]
+
+    def score(self, a: array, b: array) -> float:
+        return matching.f1_from_counts(sum((Counter(a) & Counter(b)).values()), len(a), len(b))
+
+    def section_scores(self, pred_vectors, gold_vectors, threshold: float):
+        return matching.section_scores(pred_vectors, gold_vectors, threshold)
+
+
+class SetScores:
+    """
+    Exact Jaccard scores for the pairs that can reach threshold, found with
+    the prefix and positional filters of all-pairs set similarity joins.
+    With grams in one global order (rarest first), two sets at Jaccard >= t
+    share a gram among the first n - ceil(t·n) + 1 of each set of size n, so
+    only gold prefixes are indexed. While probing, a pair whose overlap so
+    far plus the grams left on the shorter side cannot reach t·(a + b) / (1 + t)
+    is dropped, and Jaccard <= min(a, b) / max(a, b) bounds the gold sizes
+    probed. Surviving candidates are scored exactly.
+    """
+
+    def __init__(self, pred_sets: Sequence[frozenset], gold_sets: Sequence[frozenset], threshold: float):
+        self.threshold = threshold
+        self.pred_sets = pred_sets
+        self.gold_sets = gold_sets
+        self.gold_sizes = [len(grams) for grams in gold_sets]
+        self.empty_gold = [j for j, n in enumerate(self.gold_sizes) if n == 0]
+        frequency = Counter(gram for grams in gold_sets for gram in grams)
+        self._rank = lambda gram: (frequency.get(gram, 0), gram)
+
+        postings: Dict[int, List[Tuple[int, int, int]]] = {}
+        for j, grams in enumerate(gold_sets):
+            for position, gram in enumerate(self._prefix(grams)):
+                postings.setdefault(gram, []).append((len(grams), j, position))
+        # gram -> (sorted gold sizes, [(gold index, position in its prefix)]) for bisecting on size
+        self.postings = {}
+        for gram, entries in postings.items():
+            entries.sort()
+            self.postings[gram] = ([n for n, _, _ in entries], [(j, position) for _, j, position in entries])
+
+    def __len__(self) -> int:
+        return len(self.pred_sets)
+
+    def _prefix(self, grams: frozenset) -> List[int]:
+        # The bound uses the same allowance as matching's length window, and
+        # a longer prefix only adds candidates, so no qualifying pair is lost
+        t = self.threshold - matching.LENGTH_BOUND_EPSILON
+        if t <= 0:
+            return list(grams)
+        return sorted(grams, key=self._rank)[:max(len(grams) - math.ceil(t * len(grams)) + 1, 0)]
+
+    def _size_window(self, size: int) -> Tuple[float, float]:
+        t = self.threshold - matching.LENGTH_BOUND_EPSILON
+        if t <= 0:
+            return 0, float("inf")
+        if t > 1:
+            return float("inf"), float("-inf")
+        return size * t, size / t
+
+    def _jaccard(self, i: int, j: int) -> float:
+        a, b = self.pred_sets[i], self.gold_sets[j]
+        shared = len(a & b)
+        return shared / (len(a) + len(b) - shared)
+
+    def candidates(self, i: int) -> Dict[int, float]:
+        grams = self.pred_sets[i]
+        if not grams:
+            return {j: 1.0 for j in self.empty_gold}
+        size = len(grams)
+        lo, hi = self._size_window(size)
+        t = self.threshold - matching.LENGTH_BOUND_EPSILON
+        ratio = t / (1 + t) if t > 0 else 0.0
+        gold_sizes = self.gold_sizes
+        overlap: Dict[int, int] = {}
+        pruned = set()
+        for position, gram in enumerate(self._prefix(grams)):
+            entry = self.postings.get(gram)
+            if entry is None:
+                continue
+            sizes, golds = entry
+            left = size - position - 1
+            for j, gold_position in golds[bisect_left(sizes, lo):bisect_right(sizes, hi)]:
+                if j in pruned:
+                    continue
+                count = overlap.get(j, 0) + 1
+                bound = count + min(left, gold_sizes[j] - gold_position - 1)
+                if bound >= math.ceil(ratio * (size + gold_sizes[j])):
+                    overlap[j] = count
+                else:
+                    pruned.add(j)
+                    overlap.pop(j, None)
+        threshold = self.threshold
+        scores = {j: self._jaccard(i, j) for j in overlap}
+        return {j: score for j, score in scores.items() if score > 0 and score >= threshold}
+
+    def best_score(self, i: int, excluded: set) -> float:
+        # Only reached for unmatched predictions, so every gold item is scored
+        grams = self.pred_sets[i]
+        if not grams:
+            return 1.0 if any(j not in excluded for j in self.empty_gold) else 0.0
+        return max((self._jaccard(i, j) for j in range(len(self.gold_sets)) if j not in excluded), default=0.0)
+
+
+class CharJaccard:
+    """
+    Jaccard similarity of character trigram sets, with grams interned to
+    integers shared by both sides of a section.
+    """
+
+    name = "char_jaccard"
+
+    def vectors(self, pred_texts: Sequence[str], gold_texts: Sequence[str]) -> Tuple[List[frozenset], List[frozenset]]:
+        ids: Dict[str, int] = {}
+
+        def intern(text: str) -> frozenset:
+            return frozenset(ids.setdefault(gram, len(ids)) for gram in char_ngrams(text))
+
+        return [intern(t) for t in pred_texts], [intern(t) for t in gold_texts]
+
+    def score(self, a: frozenset, b: frozenset) -> float:
+        if not a and not b:
+            return 1.0
+        shared = len(a & b)
+        return shared / (len(a) + len(b) - shared)
+
+    def section_scores(self, pred_vectors, gold_vectors, threshold: float):
+        return SetScores(pred_vectors, gold_vectors, threshold)
+
+
+def minhash_signatures(gram_sets: Sequence[set]) -> List[Tuple[int, ...]]:
+    """
+    MINHASH_PERMUTATIONS minimum hash values of each gram set. Equal
+    positions of two signatures estimate their Jaccard similarity; an empty
+    set gets the all-prime signature, so two empty texts still score 1.0.
+    The hash values of each distinct gram are computed once, and each
+    signature is the element-wise minimum over its grams' rows (with NumPy,
+    in padded blocks of about MINHASH_BLOCK_GRAMS grams).
+    """
+    ids: Dict[str, int] = {}
+    items = [[ids.setdefault(gram, len(ids)) for gram in grams] for grams in gram_sets]
+    hashes = [zlib.crc32(gram.encode("utf-8")) for gram in ids]
+    empty = (_MINHASH_PRIME,) * MINHASH_PERMUTATIONS
+
+    np = matching.numpy_module()
+    if np is None:
+        table = [tuple((a * x + b) % _MINHASH_PRIME for a, b in _MINHASH_PARAMS) for x in hashes]
+        return [tuple(map(min, zip(*(table[g] for g in item)))) if item else empty for item in items]
+
+    # One row per gram plus an all-prime padding row; items of similar size
+    # are reduced together as a padded items x grams x hashes block
+    a = np.array([p[0] for p in _MINHASH_PARAMS], dtype=np.int64)[None, :]
+    b = np.array([p[1] for p in _MINHASH_PARAMS], dtype=np.int64)[None, :]
+    table = np.vstack([
+        (np.array(hashes, dtype=np.int64)[:, None] * a + b) % _MINHASH_PRIME,
+        np.full((1, MINHASH_PERMUTATIONS), _MINHASH_PRIME, dtype=np.int64),
+    ])
+    padding = len(hashes)
+    signatures = [empty] * len(items)
+    order = sorted((i for i, item in enumerate(items) if item), key=lambda i: len(items[i]))
+    start = 0
+    while start < len(order):
+        end = start + 1
+        while end < len(order) and (end - start + 1) * len(items[order[end]]) <= MINHASH_BLOCK_GRAMS:
+            end += 1
+        block = order[start:end]
+        width = len(items[block[-1]])
+        rows = np.full((len(block), width), padding, dtype=np.intp)
+        for r, k in enumerate(block):
+            rows[r, :len(items[k])] = items[k]
+        for k, signature in zip(block, table[rows].min(axis=1).tolist()):
+            signatures[k] = tuple(signature)
+        start = end
+    return signatures
+
+
+def minhash_signature(grams: set) -> Tuple[int, ...]:
+    return minhash_signatures([grams])[0]
+
+
+def _signature_agreement(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    return sum(x == y for x, y in zip(a, b)) / MINHASH_PERMUTATIONS
+
+
+class LSHScores:
+    """
+    MinHash scores over LSH candidates: signatures are cut into LSH_BANDS
+    bands and only gold items sharing a whole band with the prediction are
+    scored. Pairs below the LSH curve can be missed, and best_score only
+    considers candidates, so results are approximate.
+    """
+
+    def __init__(self, pred_signatures, gold_signatures, threshold: float):
+        self.threshold = threshold
+        self.pred_signatures = pred_signatures
+        self.gold_signatures = gold_signatures
+        self.rows = MINHASH_PERMUTATIONS // LSH_BANDS
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        for j, signature in enumerate(gold_signatures):
+            for key in self._band_keys(signature):
+                self.buckets.setdefault(key, []).append(j)
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        rows = self.rows
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(LSH_BANDS)]
+
+    def __len__(self) -> int:
+        return len(self.pred_signatures)
+
+    def _scores(self, i: int) -> Dict[int, float]:
+        signature = self.pred_signatures[i]
+        golds = set()
+        for key in self._band_keys(signature):
+            golds.update(self.buckets.get(key, ()))
+        gold_signatures = self.gold_signatures
+        return {j: _signature_agreement(signature, gold_signatures[j]) for j in golds}
+
+    def candidates(self, i: int) -> Dict[int, float]:
+        threshold = self.threshold
+        return {j: score for j, score in self._scores(i).items() if score > 0 and score >= threshold}
+
+    def best_score(self, i: int, excluded: set) -> float:
+        return max((score for j, score in self._scores(i).items() if j not in excluded), default=0.0)
+
+
+class MinHash:
+    """
+    MinHash/LSH approximation of char_jaccard for sections too large to
+    score exactly. Signatures are computed once per item (with NumPy when the
+    matrix backend has it) and compared only within shared LSH bands.
+    """
+
+    name = "minhash"
+
+    def vectors(self, pred_texts: Sequence[str], gold_texts: Sequence[str]):
+        signatures = minhash_signatures([char_ngrams(t) for t in list(pred_texts) + list(gold_texts)])
+        return signatures[:len(pred_texts)], signatures[len(pred_texts):]
+
+    def score(self, a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+        return _signature_agreement(a, b)
+
+    def section_scores(self, pred_vectors, gold_vectors, threshold: float):
+        return LSHScores(pred_vectors, gold_vectors, threshold)
+
+
+_BACKENDS = {backend.name: backend for backend in (TokenF1(), CharJaccard(), MinHash())}
+
+
+def similarity_backend(name: str):
+    if name not in _BACKENDS:
+        raise ValueError(f"similarity must be one of {SIMILARITIES}.")
+    return _BACKENDS[name]
@@ -0,0 +1,205 @@
+import asyncio
+import gzip
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from lib import jsonio
+
+
+SNAPSHOT_MODES = ("record", "replay")
+
+DEFAULT_SNAPSHOT_DIR = ".cache/snapshots"
+
+INDEX_FILE = "index.jsonl"
+DATA_FILE = "predictions.jsonl.gz"
+
+
+class SnapshotMiss(LookupError):
+    pass
+
+
+def transcript_hash(transcript: str) -> str:
+    return hashlib.sha256(transcript.encode("utf-8")).hexdigest()
+
+
+def snapshot_key(transcript_sha256: str, prompt_version: str, model: str) -> str:
+    payload = jsonio.dumps([transcript_sha256, prompt_version, model])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SnapshotStore:
+    """
+    Extraction outputs kept on disk so evaluations can be re-scored without
+    calling the model. A directory holds two append-only files:
+
+      predictions.jsonl.gz  one gzip member per snapshot; concatenated
+                            members are still a valid gzip stream
+      index.jsonl           one line per snapshot: key, transcript_sha256,
+                            prompt_version, model, created_at and the byte
+                            offset and length of its member
+
+    A snapshot is read by decompressing only its own member. Later index
+    lines win, and lines appended by other processes are picked up on a miss.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.index_path = self.directory / INDEX_FILE
+        self.data_path = self.directory / DATA_FILE
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._index_offset = 0
+        self._refresh()
+
+    def _refresh(self) -> None:
+        if not self.index_path.exists():
+            return
+        with self.index_path.open("rb") as f:
+            f.seek(self._index_offset)
+            for line in f:
+                # A line still being written by another process is read next time
+                if not line.endswith(b"\n"):
+                    break
+                self._index_offset += len(line)
+                if line.strip():
+                    entry = jsonio.loads(line)
+                    self.entries[entry["key"]] = entry
+
+    def lookup(self, transcript: str, prompt_version: str, model: str) -> Optional[Dict[str, Any]]:
+        key = snapshot_key(transcript_hash(transcript), prompt_version, model)
+        with self._lock:
+            if key not in self.entries:
+                self._refresh()
+            return self.entries.get(key)
+
+    def _read(self, entry: Dict[str, Any]) -> bytes:
+        with self.data_path.open("rb") as f:
+            f.seek(entry["offset"])
+            return f.read(entry["length"])
+
+    def load(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        return jsonio.loads(gzip.decompress(self._read(entry)))
+
+    def get(self, transcript: str, prompt_version: str, model: str) -> Optional[Dict[str, Any]]:
+        entry = self.lookup(transcript, prompt_version, model)
+        return self.load(entry) if entry is not None else None
+
+    def put(self, transcript: str, prompt_version: str, model: str, prediction: Dict[str, Any]) -> Dict[str, Any]:
+        sha = transcript_hash(transcript)
+        member = gzip.compress(jsonio.dumps_line(prediction).encode("utf-8"), mtime=0)
+        key = snapshot_key(sha, prompt_version, model)
+        with self._lock:
+            # Members are deterministic (mtime=0), so an unchanged prediction is not stored twice
+            existing = self.entries.get(key)
+            if existing is not None and existing["length"] == len(member) and self._read(existing) == member:
+                return existing
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Data before index, so an index line never points past the end of the data file
+            with self.data_path.open("ab") as f:
+                offset = f.tell()
+                f.write(member)
+            entry = {
+                "key": key,
+                "transcript_sha256": sha,
+                "prompt_version": prompt_version,
+                "model": model,
+                "created_at": round(time.time(), 3),
+                "offset": offset,
+                "length": len(member),
+            }
+            with self.index_path.open("ab") as f:
+                f.write(jsonio.dumps_line(entry).encode("utf-8"))
+            self._refresh()
+            self.entries[key] = entry
+        return entry
+
+    def versions(self, transcript: str) -> List[Dict[str, Any]]:
+        """
+        Index entries for any prompt version or model of this transcript,
+        newest first.
+        """
+        sha = transcript_hash(transcript)
+        with self._lock:
+            self._refresh()
+            found = [e for e in self.entries.values() if e["transcript_sha256"] == sha]
+        return sorted(found, key=lambda e: e["created_at"], reverse=True)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class SnapshotExtractor:
+    """
+    Extractor wrapper backed by a SnapshotStore. Mode "record" extracts with
+    the inner extractor and stores the result; "replay" only serves stored
+    snapshots for the inner extractor's prompt version and model, and raises
+    SnapshotMiss instead of calling the model.
+    """
+
+    def __init__(self, store: SnapshotStore, extractor, mode: str = "record"):
+        if mode not in SNAPSHOT_MODES:
+            raise ValueError(f"mode must be one of {SNAPSHOT_MODES}.")
+        self.store = store
+        self.extractor = extractor
+        self.mode = mode
+        self.last_entry: Optional[Dict[str, Any]] = None
+
+    @property
+    def model(self) -> str:
+        return self.extractor.model
+
+    def prompt_version(self) -> str:
+        return self.extractor.prompt_version()
+
+    def _replay(self, transcript: str) -> Dict[str, Any]:
+        prompt_version, model = self.extractor.prompt_version(), self.extractor.model
+        entry = self.store.lookup(transcript, prompt_version, model)
+        if entry is None:
+            others = self.store.versions(transcript)
+            detail = f"; snapshots exist for {len(others)} other prompt version/model pairs" if others else ""
+            raise SnapshotMiss(
+                f"No prediction snapshot for this transcript at prompt version "
+                f"{prompt_version} and model {model}{detail}."
+            )
+        self.last_entry = entry
+        return self.store.load(entry)
+
+    def _record(self, transcript: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        self.last_entry = self.store.put(transcript, self.extractor.prompt_version(), self.extractor.model, data)
+        return data
+
+    def extract(self, transcript: str) -> Dict[str, Any]:
+        if self.mode == "replay":
+            return self._replay(transcript)
+        return self._record(transcript, self.extractor.extract(transcript))
+
+    async def aextract(self, transcript: str) -> Dict[str, Any]:
+        # Store reads and appends are blocking file I/O under a lock, so they run off the event loop
+        if self.mode == "replay":
+            return await asyncio.to_thread(self._replay, transcript)
+        data = await self.extractor.aextract(transcript)
+        return await asyncio.to_thread(self._record, transcript, data)
+
+
+def snapshot_dir_from_env() -> Optional[str]:
+    """
+    EVAL_SNAPSHOT_DIR, or None when it is unset or "": snapshots are only
+    recorded when asked for, since the store grows with every extraction.
+    """
+    return os.getenv("EVAL_SNAPSHOT_DIR") or None
+
+
+def with_snapshots(extractor, snapshot_dir: Optional[str], from_snapshot: bool = False):
+    """
+    extractor with its predictions recorded under snapshot_dir or, with
+    from_snapshot, served from there; unchanged when snapshot_dir is empty.
+    """
+    if not snapshot_dir:
+        if from_snapshot:
+            raise ValueError("Scoring from a snapshot needs a snapshot directory.")
+        return extractor
+    return SnapshotExtractor(SnapshotStore(snapshot_dir), extractor, mode="replay" if from_snapshot else "record")
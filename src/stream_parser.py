@@ -0,0 +1,89 @@
+import json
+from typing import Any, List, Tuple
+
+
+SECTION_NAMES = ("action_items", "decisions", "follow_ups")
+
+
+class IncrementalItemParser:
+    """
+    Incrementally scans a streamed extraction payload of the form
+    {"action_items": [...], "decisions": [...], "follow_ups": [...]} and
+    returns each array element as soon as it is complete: objects and arrays
+    at their closing bracket, strings at their closing quote, and numbers,
+    true/false/null at the delimiter after them.
+
+    The scanner only tracks nesting depth and string/escape state, so each
+    character is looked at once regardless of how the stream is chunked.
+    Elements are decoded with json.loads; validating them, including
+    rejecting elements that are not objects, is up to the caller.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_key: str | None = None
+        self._section: str | None = None
+        self._item_start: int | None = None
+        self._scalar_start: int | None = None
+        self._counts = {name: 0 for name in SECTION_NAMES}
+
+    def feed(self, text: str) -> List[Tuple[str, int, Any]]:
+        """
+        Consume the next chunk of model output and return the completed
+        (section, index, item) triples it closed.
+        """
+        self.buffer += text
+        completed = []
+        buf = self.buffer
+        for pos in range(self._pos, len(buf)):
+            ch = buf[pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = json.loads(buf[self._string_start:pos + 1])
+                    elif self._depth == 2 and self._section in self._counts:
+                        completed.append(self._element(json.loads(buf[self._string_start:pos + 1])))
+                continue
+
+            in_section = self._depth == 2 and self._section in self._counts
+            if self._scalar_start is not None and (ch in ",]" or ch.isspace()):
+                completed.append(self._element(json.loads(buf[self._scalar_start:pos])))
+                self._scalar_start = None
+            elif in_section and self._scalar_start is None and ch not in '",[]{}' and not ch.isspace():
+                # A number, true, false or null; it ends at the next delimiter
+                self._scalar_start = pos
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 2 and ch == "[":
+                    self._section = self._last_key
+                elif self._depth == 3 and self._section in self._counts:
+                    self._item_start = pos
+            elif ch in "}]":
+                if self._depth == 3 and self._item_start is not None:
+                    completed.append(self._element(json.loads(buf[self._item_start:pos + 1])))
+                    self._item_start = None
+                elif self._depth == 2:
+                    self._section = None
+                self._depth -= 1
+        self._pos = len(buf)
+        return completed
+
+    def _element(self, item: Any) -> Tuple[str, int, Any]:
+        index = self._counts[self._section]
+        self._counts[self._section] += 1
+        return self._section, index, item
@@ -0,0 +1,120 @@
+import re
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import List, NamedTuple, Optional
+
+
+# Header fields look like speaker turns but belong to the preamble
+HEADER_LABELS = {"meeting", "date", "attendees", "duration", "time", "location", "title", "agenda"}
+
+# Recent transcripts are kept so the validator, the extractor and chunking
+# share one scan per request
+ANALYSIS_CACHE_SIZE = 16
+
+# Start of a "Label: text" line. Uploads can be adversarial, so the pattern
+# stays linear in the length of the text:
+#   - the indent and label classes exclude "\n", so a label never leaves its
+#     own line; only the whitespace after the colon may, so the text can
+#     start on the next line ("Alex:\nLet's start.")
+#   - the label is captured in a lookahead and consumed by backreference,
+#     the stdlib spelling of an atomic group, so a line without a colon is
+#     given up after one pass instead of being retried at every split
+#   - each class is disjoint from the one after it, so no other quantifier
+#     has more than one way to match
+# A failed attempt therefore costs O(line length plus the whitespace after
+# its colon), and attempts only start at line starts. Labels are at least two
+# characters long, as the validator has always required.
+_LINE_LABEL_RE = re.compile(
+    r"^[ \t]*(?=(?P<label>[A-Za-z][A-Za-z \t\-']+))(?P=label):\s+\S",
+    re.MULTILINE,
+)
+_DATE_HEADER_RE = re.compile(r"Date:\s*([A-Za-z]{3})\s+(\d{1,2}),\s+(\d{4})")
+_MEETING_HEADER_RE = re.compile(r"Meeting:", re.IGNORECASE)
+
+
+class DateHeader(NamedTuple):
+    start: int
+    end: int
+    month: str
+    day: str
+    year: str
+
+
+@dataclass(frozen=True)
+class TranscriptIndex:
+    """
+    Everything the request path needs to know about a transcript's shape:
+
+      speaker_lines  "Label: text" lines, header lines included
+      turn_starts    offsets of speaker turns (header labels excluded); turn i
+                     runs up to turn i+1, the last one to the end of the text
+      date_header    first "Date: Mon DD, YYYY" match, if any
+    """
+
+    text: str = field(repr=False)
+    speaker_lines: int
+    turn_starts: array
+    date_header: Optional[DateHeader]
+    has_meeting_header: bool
+    word_count: int
+
+    @property
+    def preamble_end(self) -> int:
+        return self.turn_starts[0] if self.turn_starts else len(self.text)
+
+    @property
+    def preamble(self) -> str:
+        return self.text[:self.preamble_end]
+
+    def turns(self) -> List[str]:
+        bounds = list(self.turn_starts) + [len(self.text)]
+        return [self.text[bounds[i]:bounds[i + 1]] for i in range(len(self.turn_starts))]
+
+
+def count_speaker_lines(text: str, limit: Optional[int] = None) -> int:
+    """
+    "Label: text" lines in text, stopping once limit have been found.
+    """
+    return sum(1 for _ in islice(_LINE_LABEL_RE.finditer(text), limit))
+
+
+def _match_date_header(text: str, pos: Optional[int] = None) -> Optional[DateHeader]:
+    m = _DATE_HEADER_RE.search(text) if pos is None else _DATE_HEADER_RE.match(text, pos)
+    return DateHeader(m.start(), m.end(), *m.groups()) if m else None
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def analyze_transcript(text: str) -> TranscriptIndex:
+    speaker_lines = 0
+    turn_starts = array("l")
+    date_header = None
+    has_meeting_header = False
+
+    # Headers are read off their own lines as the scan passes them
+    for m in _LINE_LABEL_RE.finditer(text):
+        speaker_lines += 1
+        label = m.group("label").strip().lower()
+        if label not in HEADER_LABELS:
+            turn_starts.append(m.start())
+        elif label == "meeting":
+            has_meeting_header = True
+        elif label == "date" and date_header is None:
+            date_header = _match_date_header(text, m.start("label"))
+
+    # A "Date:" or "Meeting:" that is not its own line's label ("Team Meeting: Sprint review",
+    # a bare "Meeting:") is still honoured, at the cost of a literal search
+    if date_header is None:
+        date_header = _match_date_header(text)
+    if not has_meeting_header:
+        has_meeting_header = _MEETING_HEADER_RE.search(text) is not None
+
+    return TranscriptIndex(
+        text=text,
+        speaker_lines=speaker_lines,
+        turn_starts=turn_starts,
+        date_header=date_header,
+        has_meeting_header=has_meeting_header,
+        word_count=len(text.split()),
+    )
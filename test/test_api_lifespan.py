@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from api.main import create_app, lifespan
+from src import extraction_cache
+
+
+def test_lifespan_shares_one_pooled_client_and_closes_it(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("OPENAI_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("EXTRACTION_CACHE", "off")
+    monkeypatch.delenv("EVAL_SNAPSHOT_DIR", raising=False)
+    app = create_app()
+
+    async def run():
+        async with lifespan(app):
+            extractor = app.state.extractor
+            http_client = extractor.async_client.client
+            assert extractor.cache is None
+            assert app.state.snapshots is None
+            assert not http_client.is_closed()
+        return http_client
+
+    http_client = asyncio.run(run())
+    assert http_client.is_closed()
+
+
+def test_lifespan_rejects_missing_api_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "")
+    app = create_app()
+
+    async def run():
+        async with lifespan(app):
+            pass
+
+    with pytest.raises(RuntimeError, match="OPENAI_API_KEY"):
+        asyncio.run(run())
+
+
+def test_lifespan_closes_the_shared_extraction_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("EXTRACTION_CACHE", "on")
+    monkeypatch.setenv("EXTRACTION_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.delenv("EVAL_SNAPSHOT_DIR", raising=False)
+    app = create_app()
+
+    async def run():
+        async with lifespan(app):
+            cache = app.state.extractor.cache
+            assert cache._db is not None
+        return cache
+
+    cache = asyncio.run(run())
+    assert cache._db is None
+    assert extraction_cache._default_cache is None
@@ -0,0 +1,138 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from api.models.extraction import ExtractionResponse
+from api.routes.evaluate import evaluate_endpoint
+from api.routes.extract import extract, extract_stream
+from src.llm_extractor import LLMExtractor
+from src.snapshots import SnapshotStore
+
+
+TRANSCRIPT = """Meeting: Planning
+Date: Mar 3, 2026
+
+Alex: I'll send the notes by Friday.
+Sam: Sounds good.
+"""
+
+OUTPUT = {
+    "action_items": [
+        {
+            "text": "Send the notes",
+            "owner": "Alex",
+            "due_raw": "by Friday",
+            "due": None,
+            "evidence": "Alex: I'll send the notes by Friday.",
+            "needs_human_review": False,
+            "reason": None,
+        }
+    ],
+    "decisions": [],
+    "follow_ups": [
+        {
+            "text": "Check in with Sam",
+            "owner": None,
+            "due_raw": None,
+            "due": None,
+            "evidence": "Sam: Sounds good.",
+        }
+    ],
+}
+
+
+class AsyncStubClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def chat_completion(self, messages, response_format):
+        self.calls += 1
+        return json.dumps(OUTPUT)
+
+    async def chat_completion_stream(self, messages, response_format):
+        self.calls += 1
+        text = json.dumps(OUTPUT)
+        for i in range(0, len(text), 7):
+            yield text[i:i + 7]
+
+
+class Upload:
+    def __init__(self, text):
+        self.text = text
+
+    async def read(self):
+        return self.text.encode("utf-8")
+
+
+def test_extract_route_returns_normalized_payload_matching_response_model():
+    extractor = LLMExtractor(async_client=AsyncStubClient())
+
+    response = asyncio.run(extract(file=Upload(TRANSCRIPT), extractor=extractor))
+
+    body = json.loads(response.body)
+    assert response.status_code == 200
+    assert body["action_items"][0]["due"] == "2026-03-06"
+    assert body["follow_ups"][0]["reason"] is None
+    assert body["validation"]["valid"] is True
+    ExtractionResponse.model_validate(body)
+
+
+def test_stream_route_items_match_extract_route_items():
+    async def stream_items():
+        response = await extract_stream(file=Upload(TRANSCRIPT), extractor=LLMExtractor(async_client=AsyncStubClient()))
+        lines = [json.loads(line) async for line in response.body_iterator]
+        return [line for line in lines if line["event"] == "item"]
+
+    streamed = asyncio.run(stream_items())
+    response = asyncio.run(extract(file=Upload(TRANSCRIPT), extractor=LLMExtractor(async_client=AsyncStubClient())))
+    body = json.loads(response.body)
+
+    assert [event["item"] for event in streamed] == body["action_items"] + body["follow_ups"]
+    assert {"needs_human_review", "reason"} <= set(streamed[-1]["item"])
+
+
+def test_evaluate_route_scores_recorded_snapshot_without_model_call(tmp_path):
+    client = AsyncStubClient()
+    extractor = LLMExtractor(async_client=client)
+    snapshots = SnapshotStore(tmp_path)
+    gold = Upload(json.dumps(OUTPUT))
+
+    def run(from_snapshot):
+        return asyncio.run(
+            evaluate_endpoint(
+                transcript=Upload(TRANSCRIPT),
+                gold=gold,
+                threshold=0.75,
+                greedy=False,
+                similarity="token_f1",
+                from_snapshot=from_snapshot,
+                extractor=extractor,
+                snapshots=snapshots,
+            )
+        )
+
+    recorded = run(from_snapshot=False)
+    replayed = run(from_snapshot=True)
+
+    assert client.calls == 1
+    assert replayed.snapshot == recorded.snapshot is not None
+    assert replayed.action_items.precision == pytest.approx(1.0)
+
+
+def test_evaluate_route_returns_404_for_missing_snapshot(tmp_path):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(
+            evaluate_endpoint(
+                transcript=Upload(TRANSCRIPT),
+                gold=Upload(json.dumps(OUTPUT)),
+                threshold=0.75,
+                greedy=False,
+                similarity="token_f1",
+                from_snapshot=True,
+                extractor=LLMExtractor(async_client=AsyncStubClient()),
+                snapshots=SnapshotStore(tmp_path),
+            )
+        )
+    assert exc_info.value.status_code == 404
@@ -0,0 +1,93 @@
+import asyncio
+import io
+import json
+import threading
+from pathlib import Path
+
+from src.batch import resolve_transcript_paths, run_batch
+from src.llm_extractor import LLMExtractor
+
+
+VALID = {"action_items": [], "decisions": [], "follow_ups": []}
+
+
+class SlowAsyncClient:
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def chat_completion(self, messages, response_format):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return json.dumps(VALID)
+
+
+def _write_transcripts(tmp_path, n):
+    for i in range(n):
+        (tmp_path / f"meeting_{i}.txt").write_text(f"Alex: Item {i}.\nSam: Noted.")
+
+
+def test_resolve_directory_glob_and_manifest(tmp_path):
+    _write_transcripts(tmp_path, 3)
+    (tmp_path / "notes.md").write_text("ignored")
+    (tmp_path / "manifest.jsonl").write_text('"meeting_2.txt"\n{"path": "meeting_0.txt"}\n')
+    (tmp_path / "manifest.json").write_text('["meeting_1.txt"]')
+
+    assert [p.name for p in resolve_transcript_paths(str(tmp_path))] == [
+        "meeting_0.txt",
+        "meeting_1.txt",
+        "meeting_2.txt",
+    ]
+    assert len(resolve_transcript_paths(str(tmp_path / "meeting_*.txt"))) == 3
+    assert [p.name for p in resolve_transcript_paths(str(tmp_path / "manifest.jsonl"))] == [
+        "meeting_2.txt",
+        "meeting_0.txt",
+    ]
+    assert [p.name for p in resolve_transcript_paths(str(tmp_path / "manifest.json"))] == ["meeting_1.txt"]
+
+
+def test_run_batch_bounds_concurrency_and_writes_one_line_per_transcript(tmp_path):
+    _write_transcripts(tmp_path, 6)
+    (tmp_path / "empty.txt").write_text("  ")
+    client = SlowAsyncClient()
+    extractor = LLMExtractor(async_client=client, max_attempts=1)
+    out = io.StringIO()
+
+    summary = asyncio.run(run_batch(resolve_transcript_paths(str(tmp_path)), extractor, out, concurrency=3))
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(records) == 7
+    assert client.max_in_flight == 3
+    assert summary.total == 7
+    assert summary.succeeded == 6
+    assert summary.failed == 1
+    failed = [r for r in records if not r["ok"]]
+    assert failed[0]["path"].endswith("empty.txt")
+    assert "empty" in failed[0]["error"]
+    assert all(r["elapsed_seconds"] >= 0 for r in records)
+    assert "transcripts/s" in summary.format()
+
+
+def test_run_batch_reads_transcripts_off_the_event_loop(tmp_path, monkeypatch):
+    _write_transcripts(tmp_path, 2)
+    read_threads = []
+    read_text = Path.read_text
+
+    def recording_read_text(self, *args, **kwargs):
+        read_threads.append(threading.get_ident())
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", recording_read_text)
+    extractor = LLMExtractor(async_client=SlowAsyncClient(delay=0), max_attempts=1)
+
+    async def run():
+        loop_thread = threading.get_ident()
+        summary = await run_batch(resolve_transcript_paths(str(tmp_path)), extractor, io.StringIO())
+        return loop_thread, summary
+
+    loop_thread, summary = asyncio.run(run())
+    assert summary.succeeded == 2
+    assert len(read_threads) == 2 and loop_thread not in read_threads
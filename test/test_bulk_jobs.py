@@ -0,0 +1,143 @@
+import io
+import json
+
+import main
+from lib.prompts import SYSTEM_PROMPT
+from src.bulk_jobs import complete_batch_requests_locally, ingest_batch_results, write_batch_requests
+from src.llm_extractor import LLMExtractor
+
+
+def _action(due_raw):
+    return {
+        "text": "Update the deck",
+        "owner": "Alex",
+        "due_raw": due_raw,
+        "due": None,
+        "evidence": "Alex: I'll update the deck by Friday.",
+        "needs_human_review": False,
+        "reason": None,
+    }
+
+
+class StubClient:
+    def __init__(self, response):
+        self.response = response
+
+    def chat_completion(self, messages, response_format):
+        return self.response
+
+
+def test_prepare_writes_one_batch_request_per_transcript(tmp_path):
+    (tmp_path / "a.txt").write_text("Date: Jan 22, 2026\nAlex: Hi.\nSam: Hello.")
+    (tmp_path / "empty.txt").write_text("")
+    out = io.StringIO()
+
+    count = write_batch_requests(sorted(tmp_path.glob("*.txt")), LLMExtractor(), out)
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert count == 1
+    assert lines[0]["custom_id"].endswith("a.txt")
+    assert lines[0]["url"] == "/v1/chat/completions"
+    body = lines[0]["body"]
+    assert body["messages"][0] == {"role": "system", "content": SYSTEM_PROMPT}
+    assert body["messages"][1]["content"].startswith("Date: Jan 22, 2026")
+    assert body["response_format"] == {"type": "json_object"}
+
+
+def test_ingest_matches_extract_output(tmp_path):
+    transcript = "Date: Jan 22, 2026\nAlex: I'll update the deck by Friday.\nSam: Thanks."
+    (tmp_path / "a.txt").write_text(transcript)
+    response = json.dumps({"action_items": [_action("by Friday")], "decisions": [], "follow_ups": []})
+
+    requests = io.StringIO()
+    write_batch_requests([tmp_path / "a.txt"], LLMExtractor(), requests)
+    results = io.StringIO()
+    complete_batch_requests_locally(requests.getvalue().splitlines(), StubClient(response), results)
+
+    records = list(ingest_batch_results(results.getvalue().splitlines(), LLMExtractor()))
+    expected = LLMExtractor(client=StubClient(response)).extract(transcript)
+
+    assert records[0]["ok"] is True
+    assert records[0]["data"] == expected
+    assert records[0]["data"]["action_items"][0]["due"] == "2026-01-23"
+
+
+def test_ingest_reports_failed_and_invalid_results(tmp_path):
+    (tmp_path / "a.txt").write_text("Alex: Hi.\nSam: Hello.")
+    invalid = {"action_items": []}
+    lines = [
+        json.dumps({"custom_id": str(tmp_path / "a.txt"), "response": None, "error": {"code": "server_error"}}),
+        json.dumps(
+            {
+                "custom_id": str(tmp_path / "a.txt"),
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": json.dumps(invalid)}}]},
+                },
+                "error": None,
+            }
+        ),
+    ]
+
+    records = list(ingest_batch_results(lines, LLMExtractor()))
+
+    assert [r["ok"] for r in records] == [False, False]
+    assert "server_error" in records[0]["error"]
+    assert "invalid keys" in records[1]["error"]
+
+
+def test_bulk_prepare_uses_configured_response_mode(tmp_path, monkeypatch):
+    monkeypatch.setenv("EXTRACTION_RESPONSE_MODE", "json_schema")
+    monkeypatch.delenv("LLM_CASSETTE", raising=False)
+    (tmp_path / "a.txt").write_text("Date: Jan 22, 2026\nAlex: Hi.\nSam: Hello.")
+    output = tmp_path / "requests.jsonl"
+
+    main._bulk_prepare(str(tmp_path / "a.txt"), str(output))
+
+    body = json.loads(output.read_text().splitlines()[0])["body"]
+    assert body["response_format"]["type"] == "json_schema"
+    assert body == LLMExtractor.from_env(cache=None).build_request("Date: Jan 22, 2026\nAlex: Hi.\nSam: Hello.")
+
+
+def test_long_transcripts_are_prepared_per_window_and_merged_on_ingest(tmp_path):
+    transcript = "Date: Jan 22, 2026\n" + "".join(f"Alex: I'll update the deck by Friday, item {i}.\n" for i in range(12))
+    (tmp_path / "long.txt").write_text(transcript)
+    (tmp_path / "short.txt").write_text("Date: Jan 22, 2026\nAlex: Hi.\nSam: Hello.")
+    response = json.dumps({"action_items": [_action("by Friday")], "decisions": [], "follow_ups": []})
+    extractor = LLMExtractor(chunk_chars=200)
+
+    requests = io.StringIO()
+    count = write_batch_requests([tmp_path / "long.txt", tmp_path / "short.txt"], extractor, requests)
+    lines = requests.getvalue().splitlines()
+    windows = extractor.chunks(transcript)
+    assert len(windows) > 1 and count == len(windows) + 1
+    assert [json.loads(line)["custom_id"] for line in lines[:2]] == [
+        f"{tmp_path / 'long.txt'}#chunk-0-of-{len(windows)}",
+        f"{tmp_path / 'long.txt'}#chunk-1-of-{len(windows)}",
+    ]
+
+    results = io.StringIO()
+    complete_batch_requests_locally(reversed(lines), StubClient(response), results)
+    records = list(ingest_batch_results(results.getvalue().splitlines(), extractor))
+
+    expected = LLMExtractor(client=StubClient(response), chunk_chars=200).extract(transcript)
+    assert [r["path"] for r in records] == [str(tmp_path / "short.txt"), str(tmp_path / "long.txt")]
+    assert records[1]["ok"] is True
+    assert records[1]["data"] == expected
+
+
+def test_ingest_reports_chunked_transcripts_with_missing_windows(tmp_path):
+    transcript = "".join(f"Alex: Item {i} needs doing soon.\n" for i in range(12))
+    (tmp_path / "long.txt").write_text(transcript)
+    extractor = LLMExtractor(chunk_chars=120)
+    requests = io.StringIO()
+    write_batch_requests([tmp_path / "long.txt"], extractor, requests)
+    results = io.StringIO()
+    empty = json.dumps({"action_items": [], "decisions": [], "follow_ups": []})
+    complete_batch_requests_locally(requests.getvalue().splitlines()[1:], StubClient(empty), results)
+
+    records = list(ingest_batch_results(results.getvalue().splitlines(), extractor))
+
+    assert len(records) == 1
+    assert records[0]["ok"] is False
+    assert "Missing results for chunks [0]" in records[0]["error"]
@@ -0,0 +1,76 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from src.business_calendar import BusinessCalendar, set_default_calendar, us_federal_holidays
+from src.date_normalizer import normalize_due_raw
+
+
+def _add_business_days_by_loop(cal, d, n):
+    while n > 0:
+        d += timedelta(days=1)
+        n -= cal.is_business_day(d)
+    return d
+
+
+@pytest.fixture
+def reset_default_calendar():
+    yield
+    set_default_calendar(None)
+
+
+def test_weekends_are_not_business_days():
+    cal = BusinessCalendar(2026, 2026)
+    assert cal.is_business_day(date(2026, 1, 23))       # Friday
+    assert not cal.is_business_day(date(2026, 1, 24))   # Saturday
+    assert not cal.is_business_day(date(2026, 1, 25))   # Sunday
+
+
+def test_add_business_days_matches_day_by_day_loop():
+    holidays = us_federal_holidays(2025) | us_federal_holidays(2026)
+    cal = BusinessCalendar(2025, 2027, holidays)
+    rng = random.Random(0)
+    for _ in range(500):
+        start = date(2025, 1, 1) + timedelta(days=rng.randint(0, 700))
+        n = rng.randint(1, 40)
+        assert cal.add_business_days(start, n) == _add_business_days_by_loop(cal, start, n)
+
+
+def test_business_days_between_uses_cumulative_counts():
+    cal = BusinessCalendar(2026, 2026)
+    assert cal.business_days_between(date(2026, 1, 22), date(2026, 1, 29)) == 5
+    assert cal.business_days_between(date(2026, 1, 29), date(2026, 1, 22)) == -5
+
+
+def test_period_ends_are_last_business_days():
+    cal = BusinessCalendar(2026, 2026)
+    assert cal.end_of_quarter(date(2026, 2, 10)) == date(2026, 3, 31)
+    assert cal.end_of_quarter(date(2026, 2, 10), quarter=2) == date(2026, 6, 30)
+    assert cal.end_of_quarter(date(2026, 8, 1)) == date(2026, 9, 30)
+    # Dec 31, 2026 is a Thursday; Oct 31 would be a Saturday
+    assert cal.end_of_year(date(2026, 5, 1)) == date(2026, 12, 31)
+    assert cal.last_business_day_on_or_before(date(2026, 10, 31)) == date(2026, 10, 30)
+
+
+def test_us_federal_holidays_2026():
+    holidays = us_federal_holidays(2026)
+    assert date(2026, 1, 19) in holidays    # MLK Day
+    assert date(2026, 7, 3) in holidays     # July 4 falls on a Saturday
+    assert date(2026, 11, 26) in holidays   # Thanksgiving
+    assert len(holidays) == 11
+
+
+def test_out_of_range_dates_resolve_to_none():
+    cal = BusinessCalendar(2026, 2026)
+    assert cal.add_business_days(date(2030, 1, 1), 1) is None
+    assert cal.add_business_days(date(2026, 12, 30), 5) is None
+
+
+def test_normalizer_uses_configured_holidays(reset_default_calendar):
+    meeting = date(2026, 11, 25)  # Wednesday before Thanksgiving
+    assert normalize_due_raw(meeting, "next business day").due == "2026-11-26"
+
+    set_default_calendar(BusinessCalendar(2026, 2026, us_federal_holidays(2026)))
+    assert normalize_due_raw(meeting, "next business day").due == "2026-11-27"
+    assert normalize_due_raw(meeting, "in 2 business days").due == "2026-11-30"
@@ -0,0 +1,133 @@
+import json
+import threading
+import time
+
+from src.chunking import merge_chunk_results, split_transcript
+from src.llm_extractor import LLMExtractor
+
+
+HEADER = "Meeting: Planning\nDate: Jan 22, 2026\n\n"
+
+
+def _transcript(n_turns):
+    turns = [f"Speaker{chr(65 + i % 26)}: This is turn number {i} of the meeting.\n" for i in range(n_turns)]
+    return HEADER + "".join(turns)
+
+
+def _action(text, due_raw=None, evidence=None):
+    return {
+        "text": text,
+        "owner": "Alex",
+        "due_raw": due_raw,
+        "due": None,
+        "evidence": evidence or f"Alex: {text}",
+        "needs_human_review": False,
+        "reason": None,
+    }
+
+
+def test_short_transcript_is_a_single_chunk():
+    transcript = _transcript(3)
+    assert split_transcript(transcript, max_chars=10_000) == [transcript]
+
+
+def test_chunks_split_on_turns_and_carry_header():
+    transcript = _transcript(40)
+    chunks = split_transcript(transcript, max_chars=400, overlap_turns=1)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.startswith(HEADER)
+        body = chunk[len(HEADER):]
+        assert body.startswith("Speaker")
+        assert body.endswith("meeting.\n")
+
+
+def test_chunks_overlap_by_requested_turns():
+    transcript = _transcript(40)
+    chunks = split_transcript(transcript, max_chars=400, overlap_turns=2)
+
+    for prev, nxt in zip(chunks, chunks[1:]):
+        prev_turns = prev[len(HEADER):].splitlines(keepends=True)
+        next_turns = nxt[len(HEADER):].splitlines(keepends=True)
+        assert next_turns[:2] == prev_turns[-2:]
+
+
+def test_chunks_cover_every_turn():
+    transcript = _transcript(40)
+    chunks = split_transcript(transcript, max_chars=400, overlap_turns=2)
+    seen = set()
+    for chunk in chunks:
+        seen.update(chunk[len(HEADER):].splitlines())
+    assert seen == set(transcript[len(HEADER):].splitlines())
+
+
+def test_date_is_added_when_header_follows_first_turn():
+    transcript = "Alex: Kicking off.\nDate: Jan 22, 2026\n" + "".join(
+        f"Sam: Point {i} for the record.\n" for i in range(30)
+    )
+    chunks = split_transcript(transcript, max_chars=200, overlap_turns=0)
+    assert all(chunk.startswith("Date: Jan 22, 2026\n") for chunk in chunks)
+
+
+def test_merge_dedupes_items_seen_in_overlapping_windows():
+    first = {
+        "action_items": [_action("Update the onboarding screens")],
+        "decisions": [{"text": "Park the dashboard work", "evidence": "Alex: Park it."}],
+        "follow_ups": [],
+    }
+    second = {
+        "action_items": [_action("Update onboarding screens"), _action("Book the offsite venue")],
+        "decisions": [{"text": "Park dashboard work for now", "evidence": "Alex: Park it."}],
+        "follow_ups": [],
+    }
+
+    merged = merge_chunk_results([first, second])
+
+    assert [i["text"] for i in merged["action_items"]] == [
+        "Update the onboarding screens",
+        "Book the offsite venue",
+    ]
+    assert len(merged["decisions"]) == 1
+
+
+class WindowClient:
+    """Answers each window with one action item naming the window's first turn."""
+
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def chat_completion(self, messages, response_format):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        first_turn = messages[1]["content"][len(HEADER):].splitlines()[0]
+        turn_number = first_turn.split()[5]
+        with self.lock:
+            self.in_flight -= 1
+        return json.dumps(
+            {
+                "action_items": [_action(f"Handle item {turn_number}", due_raw="by Friday", evidence=first_turn)],
+                "decisions": [],
+                "follow_ups": [],
+            }
+        )
+
+
+def test_extractor_maps_windows_concurrently_and_normalizes_each():
+    client = WindowClient()
+    extractor = LLMExtractor(client=client, max_attempts=1, chunk_chars=400, max_concurrency=4)
+    transcript = _transcript(40)
+
+    out = extractor.extract(transcript)
+
+    n_chunks = len(split_transcript(transcript, max_chars=400))
+    assert client.calls == n_chunks
+    assert client.max_in_flight > 1
+    assert len(out["action_items"]) == n_chunks
+    assert all(item["due"] == "2026-01-23" for item in out["action_items"])
@@ -0,0 +1,211 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from src import matching
+from src.corpus_eval import (
+    EvalPair,
+    format_corpus_report,
+    load_completed,
+    load_pairs,
+    run_corpus,
+    summarize_corpus,
+)
+
+
+class StubAsyncExtractor:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    async def aextract(self, transcript):
+        self.calls.append(transcript)
+        await asyncio.sleep(0)
+        return self.responses[transcript]
+
+
+def _payload(action_items=(), decisions=()):
+    return {
+        "action_items": [{"text": t, "owner": "Alex", "due": None} for t in action_items],
+        "decisions": [{"text": t} for t in decisions],
+        "follow_ups": [],
+    }
+
+
+def _corpus(tmp_path):
+    # Pair a: 1 of 2 actions found, decision found; pair b: 1 hallucinated action
+    golds = {
+        "a": _payload(["fix the login bug", "update the dashboard"], ["use the new auth flow"]),
+        "b": _payload([], []),
+    }
+    preds = {
+        "a": _payload(["fix the login bug"], ["use the new auth flow"]),
+        "b": _payload(["invent a brand new product"], []),
+    }
+    pairs = []
+    for name in golds:
+        (tmp_path / f"{name}.txt").write_text(f"Alex: transcript {name}")
+        (tmp_path / f"{name}.gold.json").write_text(json.dumps(golds[name]))
+        pairs.append(EvalPair(str(tmp_path / f"{name}.txt"), str(tmp_path / f"{name}.gold.json")))
+    extractor = StubAsyncExtractor({f"Alex: transcript {name}": preds[name] for name in preds})
+    return pairs, extractor
+
+
+def test_load_pairs_resolves_against_manifest(tmp_path):
+    (tmp_path / "m.jsonl").write_text('{"transcript": "a.txt", "gold": "a.gold.json"}\n\n')
+    (tmp_path / "m.json").write_text('[{"transcript": "b.txt", "gold": "b.gold.json"}]')
+
+    assert load_pairs(str(tmp_path / "m.jsonl")) == [EvalPair(str(tmp_path / "a.txt"), str(tmp_path / "a.gold.json"))]
+    assert load_pairs(str(tmp_path / "m.json")) == [EvalPair(str(tmp_path / "b.txt"), str(tmp_path / "b.gold.json"))]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_run_corpus_streams_records_and_aggregates(tmp_path, workers):
+    pairs, extractor = _corpus(tmp_path)
+    out = io.StringIO()
+    seen = []
+
+    records = asyncio.run(
+        run_corpus(pairs, extractor, out, workers=workers, progress=lambda done, total, r: seen.append((done, total)))
+    )
+
+    assert sorted(seen) == [(1, 2), (2, 2)]
+    assert [json.loads(line)["ok"] for line in out.getvalue().splitlines()] == [True, True]
+    summary = summarize_corpus(records, bootstrap_samples=0)
+
+    actions = summary["action_items"]
+    # micro: 1 matched, 1 hallucinated, 1 missed over both pairs
+    assert actions["precision"] == pytest.approx(0.5)
+    assert actions["recall"] == pytest.approx(0.5)
+    # macro: pair a has P=1, R=0.5; pair b has P=0, R=0
+    assert actions["macro_precision"] == pytest.approx(0.5)
+    assert actions["macro_recall"] == pytest.approx(0.25)
+    assert actions["owner_accuracy_on_matched"] == pytest.approx(1.0)
+    assert summary["overall"]["matched"] == 2
+    assert summary["overall"]["precision"] == pytest.approx(2 / 3)
+    assert "ci" not in actions
+
+
+def test_run_corpus_reads_only_the_transcripts_it_is_extracting(tmp_path, monkeypatch):
+    from src import corpus_eval
+
+    gold = tmp_path / "gold.json"
+    gold.write_text(json.dumps(_payload()))
+    pairs = []
+    for i in range(10):
+        (tmp_path / f"{i}.txt").write_text(f"Alex: transcript {i}")
+        pairs.append(EvalPair(str(tmp_path / f"{i}.txt"), str(gold)))
+    reads = []
+    monkeypatch.setattr(corpus_eval, "_load_text", lambda path: reads.append(path) or open(path).read())
+
+    class GatedExtractor:
+        def __init__(self):
+            self.gate = asyncio.Event()
+
+        async def aextract(self, transcript):
+            await self.gate.wait()
+            return _payload()
+
+    async def run():
+        extractor = GatedExtractor()
+        task = asyncio.create_task(run_corpus(pairs, extractor, io.StringIO(), concurrency=3))
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+        reads_while_blocked = len(reads)
+        extractor.gate.set()
+        return reads_while_blocked, await task
+
+    reads_while_blocked, records = asyncio.run(run())
+
+    assert reads_while_blocked == 3
+    assert len(records) == 10 and all(r["ok"] for r in records)
+
+
+def test_failed_pairs_are_recorded_and_excluded(tmp_path):
+    pairs, extractor = _corpus(tmp_path)
+    pairs.append(EvalPair(str(tmp_path / "missing.txt"), str(tmp_path / "a.gold.json")))
+
+    records = asyncio.run(run_corpus(pairs, extractor, io.StringIO()))
+    summary = summarize_corpus(records, bootstrap_samples=0)
+
+    assert summary["pairs"] == 3 and summary["failed"] == 1
+    assert [r["error"].split(":")[0] for r in records if not r["ok"]] == ["FileNotFoundError"]
+    assert summary["action_items"]["precision"] == pytest.approx(0.5)
+
+
+def test_resume_skips_scored_pairs(tmp_path):
+    pairs, extractor = _corpus(tmp_path)
+    output = tmp_path / "results.jsonl"
+    with open(output, "w") as out:
+        asyncio.run(run_corpus(pairs[:1], extractor, out))
+    # An interrupted write leaves a partial last line
+    with open(output, "a") as out:
+        out.write('{"transcript_path": "')
+
+    completed = load_completed(str(output), 0.75, greedy=False)
+    assert list(completed) == [pairs[0].key]
+    assert load_completed(str(output), 0.8, greedy=False) == {}
+
+    extractor.calls.clear()
+    with open(output, "a") as out:
+        records = asyncio.run(run_corpus(pairs, extractor, out, completed=completed))
+
+    assert extractor.calls == ["Alex: transcript b"]
+    assert {r["transcript_path"] for r in records} == {p.transcript_path for p in pairs}
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_bootstrap_intervals(backend):
+    previous = matching.BACKEND
+    try:
+        matching.set_backend(backend)
+    except ImportError:
+        pytest.skip("numpy is not installed")
+    try:
+        records = [
+            {"ok": True, "sections": _sections(matched, hallucinations, missed)}
+            for matched, hallucinations, missed in [(3, 1, 0), (1, 1, 2), (4, 0, 1), (0, 2, 2), (2, 2, 0)]
+        ]
+        summary = summarize_corpus(records, bootstrap_samples=500, seed=7)
+        again = summarize_corpus(records, bootstrap_samples=500, seed=7)
+
+        for name in ("action_items", "overall"):
+            group = summary[name]
+            for stat, value in (
+                ("micro_precision", group["precision"]),
+                ("micro_recall", group["recall"]),
+                ("macro_precision", group["macro_precision"]),
+                ("macro_recall", group["macro_recall"]),
+            ):
+                lo, hi = group["ci"][stat]
+                assert 0.0 <= lo <= value <= hi <= 1.0
+                assert lo < hi
+        assert summary == again
+
+        single = summarize_corpus(records[:1], bootstrap_samples=50)
+        assert single["action_items"]["ci"]["micro_precision"] == [0.75, 0.75]
+    finally:
+        matching.set_backend(previous)
+
+
+def _sections(matched, hallucinations, missed):
+    counts = {"matched": matched, "hallucinations": hallucinations, "missed": missed}
+    empty = {"matched": 0, "hallucinations": 0, "missed": 0}
+    return {
+        "action_items": {**counts, "owner_correct": matched, "due_correct": 0},
+        "decisions": empty,
+        "follow_ups": {**empty, "owner_correct": 0, "due_correct": 0},
+        "overall": counts,
+    }
+
+
+def test_format_corpus_report():
+    records = [{"ok": True, "sections": _sections(3, 1, 0)}, {"ok": False, "sections": None}]
+    report = format_corpus_report(summarize_corpus(records, bootstrap_samples=20))
+
+    assert "pairs: 2 (1 ok, 1 failed)" in report
+    assert "95% bootstrap over pairs, 20 samples" in report
+    for name in ("action_items", "decisions", "follow_ups", "overall"):
+        assert name in report
@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from src.date_normalizer import normalize_due_raw, parse_meeting_date
+from src.date_normalizer import normalize_due_many, normalize_due_raw, parse_meeting_date
 
 # ── existing tests ───────────────────────────────────────────────────────────
 
@@ -85,4 +85,72 @@ def test_parse_meeting_date_missing_header():
 
 def test_parse_meeting_date_invalid_month():
     transcript = "Date: Xyz 22, 2026"
-    assert parse_meeting_date(transcript) is None
\ No newline at end of file
+    assert parse_meeting_date(transcript) is None
+
+
+# ── other phrase shapes ──────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("phrase,expected", [
+    ("today", "2026-01-22"),
+    ("tomorrow", "2026-01-23"),
+    ("in 3 days", "2026-01-25"),
+    ("in 1 day", "2026-01-23"),
+    ("in 2 weeks", "2026-02-05"),
+    ("by end of month", "2026-01-31"),
+    ("end of February", "2026-02-28"),
+    ("Jan 25", "2026-01-25"),
+    ("January 25th", "2026-01-25"),
+    ("before March 3, 2027", "2027-03-03"),
+])
+def test_other_phrase_shapes(phrase, expected):
+    out = normalize_due_raw(date(2026, 1, 22), phrase)
+    assert out.due == expected
+    assert out.needs_human_review is False
+
+@pytest.mark.parametrize("phrase,reason", [
+    ("sometime next week", "Ambiguous due phrase: 'sometime next week'"),
+    ("Feb 30", "Unrecognized due phrase: 'Feb 30'"),
+    ("end of Smarch", "Unrecognized due phrase: 'end of Smarch'"),
+    ("when it's done", "Unrecognized due phrase: 'when it's done'"),
+])
+def test_review_reasons_quote_original_phrase(phrase, reason):
+    out = normalize_due_raw(date(2026, 1, 22), phrase)
+    assert out.due is None
+    assert out.needs_human_review is True
+    assert out.reason == reason
+
+# ── memoization and batch API ────────────────────────────────────────────────
+
+def test_cached_results_keep_each_callers_original_text():
+    meeting = date(2026, 1, 22)
+    first = normalize_due_raw(meeting, "Soon")
+    second = normalize_due_raw(meeting, "  soon ")
+    assert first.reason == "Ambiguous due phrase: 'Soon'"
+    assert second.reason == "Ambiguous due phrase: '  soon '"
+
+def test_normalize_due_many_matches_single_calls():
+    meeting = date(2026, 1, 22)
+    phrases = ["by Friday", None, "asap", "by Friday", "Feb 30", "", "next Thursday"]
+    assert normalize_due_many(meeting, phrases) == [normalize_due_raw(meeting, p) for p in phrases]
+
+# ── business-day and period phrases ──────────────────────────────────────────
+
+@pytest.mark.parametrize("phrase,expected", [
+    ("in 3 business days", "2026-01-27"),    # skips the weekend
+    ("in 1 working day", "2026-01-23"),
+    ("by next business day", "2026-01-23"),
+    ("end of quarter", "2026-03-31"),
+    ("by end of the quarter", "2026-03-31"),
+    ("end of Q3", "2026-09-30"),
+    ("end of year", "2026-12-31"),
+])
+def test_business_day_phrases(phrase, expected):
+    out = normalize_due_raw(date(2026, 1, 22), phrase)
+    assert out.due == expected
+    assert out.needs_human_review is False
+
+def test_month_ends_are_calendar_days_and_quarter_ends_business_days():
+    # Mar 31, 2024 is a Sunday
+    meeting = date(2024, 1, 22)
+    assert normalize_due_raw(meeting, "end of March").due == "2024-03-31"
+    assert normalize_due_raw(meeting, "end of Q1").due == "2024-03-29"
@@ -2,7 +2,13 @@ import json
 
 import pytest
 
-from src.eval_runner import format_evaluation_report, run_evaluation
+from src.eval_runner import (
+    format_evaluation_report,
+    format_sweep_report,
+    parse_threshold_grid,
+    run_evaluation,
+    run_threshold_sweep,
+)
 
 
 class StubExtractor:
@@ -119,3 +125,58 @@ def test_format_evaluation_report_includes_sections():
     assert "best_score=0.25" in report
     assert "missed gold items:" in report
     assert "Schedule a status check" in report
+
+
+def test_parse_threshold_grid():
+    assert parse_threshold_grid("0.5:1.0:0.1") == [0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+    assert parse_threshold_grid("0.8, 0.6") == [0.6, 0.8]
+    with pytest.raises(ValueError):
+        parse_threshold_grid("0.5:1.0:0")
+
+
+def test_run_threshold_sweep_extracts_once(tmp_path):
+    transcript_path = tmp_path / "meeting.txt"
+    gold_path = tmp_path / "meeting.gold.json"
+
+    transcript_path.write_text("Alex: Fix the login bug by Friday.")
+    gold = {
+        "action_items": [{"text": "Fix the login bug", "owner": "Alex", "due": None}],
+        "decisions": [],
+        "follow_ups": [],
+    }
+    pred = {
+        "action_items": [{"text": "Fix the login bug today", "owner": "Alex", "due": None}],
+        "decisions": [],
+        "follow_ups": [],
+    }
+    gold_path.write_text(json.dumps(gold))
+
+    extractor = StubExtractor(pred)
+    sweep = run_threshold_sweep(str(transcript_path), str(gold_path), [0.9, 0.5], extractor=extractor)
+
+    assert extractor.calls == 1
+    assert sweep["matching"] == "optimal"
+    assert [p["text_threshold"] for p in sweep["points"]] == [0.5, 0.9]
+    assert [p["overall"]["recall"] for p in sweep["points"]] == [1.0, 0.0]
+    assert sweep["points"][0]["action_items"]["owner_accuracy_on_matched"] == pytest.approx(1.0)
+
+    report = format_sweep_report(sweep)
+    assert "Threshold Sweep" in report
+    assert "0.50" in report and "0.90" in report
+
+
+def test_run_evaluation_reports_stage_timings_and_usage(tmp_path):
+    transcript_path = tmp_path / "meeting.txt"
+    gold_path = tmp_path / "meeting.gold.json"
+    transcript_path.write_text("Alex: Fix the login bug.")
+    empty = {"action_items": [], "decisions": [], "follow_ups": []}
+    gold_path.write_text(json.dumps(empty))
+
+    result = run_evaluation(str(transcript_path), str(gold_path), extractor=StubExtractor(empty))
+
+    performance = result["performance"]
+    assert performance["wall_seconds"] >= performance["extract_seconds"] + performance["scoring_seconds"] - 1e-9
+    assert performance["llm_calls"] == 0
+    report = format_evaluation_report(result)
+    assert "Performance" in report
+    assert "tokens: 0 prompt, 0 completion" in report
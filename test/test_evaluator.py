@@ -1,5 +1,7 @@
+import random
+
 import pytest
-from src.evaluator import evaluate, best_text_match
+from src.evaluator import evaluate, best_text_match, sweep_thresholds
 
 
 def _action(text, owner=None, due=None):
@@ -140,3 +142,55 @@ def test_evaluate_result_has_all_sections():
     assert "decisions" in result
     assert "follow_ups" in result
     assert result["text_threshold"] == pytest.approx(0.75)
+
+
+# ── sweep_thresholds ─────────────────────────────────────────────────────────
+
+def _random_items(rng, words, n, with_owner):
+    items = []
+    for _ in range(n):
+        item = {"text": " ".join(rng.choices(words, k=rng.randint(2, 6)))}
+        if with_owner:
+            item["owner"] = rng.choice(["Alex", "Sam", None])
+            item["due"] = rng.choice(["2026-01-30", None])
+        items.append(item)
+    return items
+
+
+@pytest.mark.parametrize("greedy", [False, True])
+def test_sweep_thresholds_matches_evaluate_at_every_point(greedy):
+    rng = random.Random(7)
+    words = ["fix", "the", "login", "bug", "ship", "release", "notes", "review"]
+    thresholds = [0.3, 0.5, 0.6, 2 / 3, 0.75, 0.8, 1.0]
+    for _ in range(30):
+        pred, gold = {}, {}
+        for name in ("action_items", "decisions", "follow_ups"):
+            with_owner = name != "decisions"
+            pred[name] = _random_items(rng, words, rng.randint(0, 6), with_owner)
+            gold[name] = _random_items(rng, words, rng.randint(0, 6), with_owner)
+
+        points = sweep_thresholds(pred, gold, list(reversed(thresholds)), greedy=greedy)
+
+        assert [p["text_threshold"] for p in points] == thresholds
+        for point in points:
+            result = evaluate(pred, gold, text_threshold=point["text_threshold"], greedy=greedy)
+            tp = fp = fn = 0
+            for name in ("action_items", "decisions", "follow_ups"):
+                section, expected = point[name], result[name]
+                assert section["precision"] == pytest.approx(expected["precision"])
+                assert section["recall"] == pytest.approx(expected["recall"])
+                assert section["matched"] == len(expected["matched"])
+                assert section["hallucinations"] == len(expected["hallucinations"])
+                assert section["missed"] == len(expected["missed"])
+                for key in ("owner_accuracy_on_matched", "due_accuracy_on_matched"):
+                    if key in expected:
+                        assert section[key] == pytest.approx(expected[key])
+                tp += section["matched"]
+                fp += section["hallucinations"]
+                fn += section["missed"]
+            assert point["overall"]["precision"] == pytest.approx(tp / (tp + fp) if tp + fp else 0.0)
+            assert point["overall"]["recall"] == pytest.approx(tp / (tp + fn) if tp + fn else 0.0)
+
+
+def test_sweep_thresholds_empty_grid():
+    assert sweep_thresholds({}, {}, []) == []
@@ -0,0 +1,191 @@
+import asyncio
+import json
+
+from src.extraction_cache import ExtractionCache, cache_key
+from src.llm_extractor import LLMExtractor
+
+
+VALID = {"action_items": [], "decisions": [], "follow_ups": []}
+
+
+class StubClient:
+    def __init__(self, responses, model="gpt-4o-mini"):
+        self.responses = responses
+        self.model = model
+        self.temperature = 0.0
+        self.calls = 0
+
+    def chat_completion(self, messages, response_format):
+        response = self.responses[self.calls]
+        self.calls += 1
+        return response
+
+
+class AsyncStubClient(StubClient):
+    async def chat_completion(self, messages, response_format):
+        return super().chat_completion(messages, response_format)
+
+
+def test_cache_key_changes_with_inputs():
+    base = cache_key("transcript", model="gpt-4o-mini", temperature=0.0, version="1")
+    assert base == cache_key("transcript", model="gpt-4o-mini", temperature=0.0, version="1")
+    assert base != cache_key("transcript!", model="gpt-4o-mini", temperature=0.0, version="1")
+    assert base != cache_key("transcript", model="gpt-4o", temperature=0.0, version="1")
+    assert base != cache_key("transcript", model="gpt-4o-mini", temperature=0.5, version="1")
+    assert base != cache_key("transcript", model="gpt-4o-mini", temperature=0.0, version="2")
+
+
+def test_memory_lru_evicts_least_recently_used():
+    cache = ExtractionCache(max_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.get("c") == {"v": 3}
+
+
+def test_get_returns_independent_copies():
+    cache = ExtractionCache()
+    cache.set("a", {"items": [1]})
+    cache.get("a")["items"].append(2)
+    assert cache.get("a") == {"items": [1]}
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    ExtractionCache(path=path).set("a", {"v": 1})
+
+    cache = ExtractionCache(path=path)
+    assert cache.get("a") == {"v": 1}
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.get("a") == {"v": 1}
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_disk_tier_expires_entries(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    ExtractionCache(path=path, ttl_seconds=-1).set("a", {"v": 1})
+
+    cache = ExtractionCache(path=path, ttl_seconds=-1)
+    assert cache.get("a") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_memory_tier_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.extraction_cache.time.time", lambda: now[0])
+    cache = ExtractionCache(ttl_seconds=60)
+    cache.set("a", {"v": 1})
+
+    now[0] += 60
+    assert cache.get("a") == {"v": 1}
+    now[0] += 1
+    assert cache.get("a") is None
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["memory_entries"] == 0
+
+
+def test_memory_copy_of_disk_entry_keeps_disk_age(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.extraction_cache.time.time", lambda: now[0])
+    path = str(tmp_path / "cache.sqlite3")
+    ExtractionCache(path=path, ttl_seconds=60).set("a", {"v": 1})
+
+    now[0] += 50
+    cache = ExtractionCache(path=path, ttl_seconds=60)
+    assert cache.get("a") == {"v": 1}
+    now[0] += 20
+    assert cache.get("a") is None
+
+
+def test_disk_tier_evicts_by_size(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ExtractionCache(max_entries=1, path=path, max_disk_bytes=30)
+    cache.set("a", {"v": "x" * 10})
+    cache.set("b", {"v": "y" * 10})
+
+    assert cache.stats()["disk_entries"] == 1
+    assert cache.get("a") is None
+    assert cache.get("b") == {"v": "y" * 10}
+
+
+def test_disk_reads_keep_eviction_order_without_committing(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ExtractionCache(max_entries=1, path=path, max_disk_bytes=45)
+    cache.set("a", {"v": "x" * 10})
+    cache.set("b", {"v": "y" * 10})
+    assert cache.get("a") == {"v": "x" * 10}
+    assert not cache._db.in_transaction
+
+    cache.set("c", {"v": "z" * 10})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": "x" * 10}
+
+
+def test_disk_byte_total_survives_reopen_and_replace(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ExtractionCache(path=path)
+    cache.set("a", {"v": "x" * 10})
+    cache.set("a", {"v": "x" * 20})
+    cache.close()
+
+    reopened = ExtractionCache(path=path)
+    assert reopened._disk_bytes == len(json.dumps({"v": "x" * 20}))
+    reopened.clear()
+    assert reopened._disk_bytes == 0
+
+
+def test_extractor_serves_repeat_transcripts_from_cache():
+    client = StubClient(responses=[json.dumps(VALID)])
+    cache = ExtractionCache()
+    extractor = LLMExtractor(client=client, max_attempts=1, cache=cache)
+
+    assert extractor.extract("transcript") == VALID
+    assert extractor.extract("transcript") == VALID
+    assert client.calls == 1
+    assert cache.stats()["memory_hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_extractor_cache_is_keyed_on_model():
+    cache = ExtractionCache()
+    LLMExtractor(client=StubClient([json.dumps(VALID)]), cache=cache).extract("transcript")
+
+    other = StubClient([json.dumps(VALID)], model="gpt-4o")
+    LLMExtractor(client=other, cache=cache).extract("transcript")
+
+    assert other.calls == 1
+
+
+def test_extractor_cache_is_keyed_on_response_mode():
+    cache = ExtractionCache()
+    LLMExtractor(client=StubClient([json.dumps(VALID)]), cache=cache).extract("transcript")
+
+    strict = StubClient([json.dumps(VALID)])
+    extractor = LLMExtractor(client=strict, cache=cache, response_mode="json_schema")
+    extractor.extract("transcript")
+
+    assert strict.calls == 1
+    assert extractor.retry_stats.as_dict()["by_response_mode"]["json_schema"]["extractions"] == 1
+    assert LLMExtractor().prompt_version() != LLMExtractor(response_mode="json_schema").prompt_version()
+
+
+def test_async_extraction_uses_the_cache_off_the_event_loop(monkeypatch):
+    calls = []
+    real_to_thread = asyncio.to_thread
+
+    async def to_thread(func, *args):
+        calls.append(func.__name__)
+        return await real_to_thread(func, *args)
+
+    monkeypatch.setattr("src.llm_extractor.asyncio.to_thread", to_thread)
+    cache = ExtractionCache()
+    extractor = LLMExtractor(async_client=AsyncStubClient([json.dumps(VALID)]), cache=cache)
+
+    assert asyncio.run(extractor.aextract("transcript")) == VALID
+    assert asyncio.run(extractor.aextract("transcript")) == VALID
+    assert calls == ["get", "set", "get"]
@@ -0,0 +1,49 @@
+import pytest
+
+from api.responses import FastJSONResponse
+from lib import jsonio
+
+
+PAYLOAD = {"text": "Café — résumé", "owner": None, "items": [1, 2.5, True], "nested": {"k": "v"}}
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    previous = jsonio.BACKEND
+    yield jsonio.set_backend(request.param)
+    jsonio.set_backend(previous)
+
+
+def test_round_trips_unicode_without_escaping(backend):
+    assert jsonio.loads(jsonio.dumps(PAYLOAD)) == PAYLOAD
+    assert jsonio.loads(jsonio.dumpb(PAYLOAD)) == PAYLOAD
+    assert "Café" in jsonio.dumps(PAYLOAD)
+
+
+def test_dumps_line_is_one_jsonl_record(backend):
+    line = jsonio.dumps_line({"text": "a\nb"})
+    assert line.endswith("\n") and line.count("\n") == 1
+    assert jsonio.loads(line) == {"text": "a\nb"}
+
+
+def test_decode_errors_share_one_exception_type(backend):
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads("{not json")
+
+
+def test_response_class_renders_through_selected_backend(backend):
+    response = FastJSONResponse(PAYLOAD)
+    assert response.body == jsonio.dumpb(PAYLOAD)
+    assert response.media_type == "application/json"
+
+
+def test_auto_falls_back_and_rejects_unknown_backend():
+    previous = jsonio.BACKEND
+    try:
+        assert jsonio.set_backend("auto") in ("orjson", "stdlib")
+        with pytest.raises(ValueError, match="JSON_BACKEND"):
+            jsonio.set_backend("simdjson")
+    finally:
+        jsonio.set_backend(previous)
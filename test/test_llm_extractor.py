@@ -146,3 +146,139 @@ def test_extract_integration_normalizes_dates():
     assert fu.get("needs_human_review") is True
     assert fu.get("reason") is not None
 
+
+
+class AsyncStubClient:
+    def __init__(self, responses, delay=0.0):
+        self.responses = responses
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def chat_completion(self, messages, response_format):
+        import asyncio
+
+        response = self.responses[self.calls % len(self.responses)]
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return response
+
+
+def test_aextract_retries_and_succeeds_after_schema_error():
+    import asyncio
+
+    valid = {"action_items": [], "decisions": [], "follow_ups": []}
+    client = AsyncStubClient(responses=["not-json", json.dumps(valid)])
+    extractor = LLMExtractor(async_client=client, max_attempts=2)
+
+    out = asyncio.run(extractor.aextract("Meeting transcript without date header"))
+
+    assert out == valid
+    assert client.calls == 2
+
+
+def test_aextract_raises_after_exhausting_retries():
+    import asyncio
+
+    client = AsyncStubClient(responses=["not-json"])
+    extractor = LLMExtractor(async_client=client, max_attempts=2)
+
+    with pytest.raises(ValueError, match="failed validation after 2 attempts"):
+        asyncio.run(extractor.aextract("Meeting transcript without date header"))
+
+
+def test_aextract_runs_concurrently():
+    import asyncio
+
+    valid = {"action_items": [], "decisions": [], "follow_ups": []}
+    client = AsyncStubClient(responses=[json.dumps(valid)], delay=0.05)
+    extractor = LLMExtractor(async_client=client, max_attempts=1)
+
+    async def run_many():
+        return await asyncio.gather(*(extractor.aextract("transcript") for _ in range(5)))
+
+    results = asyncio.run(run_many())
+
+    assert results == [valid] * 5
+    assert client.max_in_flight == 5
+
+
+class RecordingClient(StubClient):
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.requests = []
+
+    def chat_completion(self, messages, response_format):
+        self.requests.append([dict(m) for m in messages])
+        return super().chat_completion(messages, response_format)
+
+
+def _action_item(text, due=None):
+    return {
+        "text": text,
+        "owner": "Alex",
+        "due_raw": None,
+        "due": due,
+        "evidence": f"Alex: {text}",
+        "needs_human_review": False,
+        "reason": None,
+    }
+
+
+def test_repair_mode_resends_only_invalid_items():
+    transcript = "Alex: a long transcript line. " * 200
+    first = {
+        "action_items": [_action_item("Ship the release"), _action_item("Update deck", due="2026-01-23")],
+        "decisions": [{"text": "Use the new auth flow", "evidence": "Sam: Let's do it."}],
+        "follow_ups": [],
+    }
+    repair = {"items": [{"section": "action_items", "index": 1, "item": _action_item("Update deck")}]}
+    client = RecordingClient(responses=[json.dumps(first), json.dumps(repair)])
+    extractor = LLMExtractor(client=client, max_attempts=2, retry_mode="repair")
+
+    out = extractor.extract(transcript)
+
+    assert [item["text"] for item in out["action_items"]] == ["Ship the release", "Update deck"]
+    assert out["action_items"][1]["due"] is None
+    assert out["decisions"] == first["decisions"]
+
+    repair_request = client.requests[1]
+    assert repair_request[0]["content"].strip().startswith("You repair individual items")
+    assert transcript not in repair_request[1]["content"]
+    fragments = json.loads(repair_request[1]["content"])["items"]
+    assert [(f["section"], f["index"]) for f in fragments] == [("action_items", 1)]
+    assert "action_items[1].due" in fragments[0]["error"]
+
+    stats = extractor.retry_stats.as_dict()
+    assert stats["retries"] == 1
+    assert stats["tokens_saved"] > 0
+
+
+def test_repair_mode_falls_back_to_replay_for_unparseable_output():
+    valid = {"action_items": [], "decisions": [], "follow_ups": []}
+    client = RecordingClient(responses=["not-json", json.dumps(valid)])
+    extractor = LLMExtractor(client=client, max_attempts=2, retry_mode="repair")
+
+    assert extractor.extract("Meeting transcript") == valid
+    assert client.requests[1][1]["content"] == "Meeting transcript"
+    assert extractor.retry_stats.recent[0]["strategy"] == "replay"
+    assert extractor.retry_stats.tokens_saved == 0
+
+
+def test_repair_mode_raises_when_repairs_stay_invalid():
+    first = {"action_items": [_action_item("Update deck", due="2026-01-23")], "decisions": [], "follow_ups": []}
+    still_bad = {"items": [{"section": "action_items", "index": 0, "item": _action_item("Update deck", due="x")}]}
+    client = RecordingClient(responses=[json.dumps(first), json.dumps(still_bad)])
+    extractor = LLMExtractor(client=client, max_attempts=2, retry_mode="repair")
+
+    with pytest.raises(ValueError, match="failed validation after 2 attempts"):
+        extractor.extract("Meeting transcript")
+
+
+def test_rejects_unknown_retry_mode():
+    with pytest.raises(ValueError, match="retry_mode"):
+        LLMExtractor(client=StubClient([]), retry_mode="rewind")
@@ -0,0 +1,192 @@
+import itertools
+import random
+
+import pytest
+
+from src import matching
+from src.evaluator import _tokenize, best_text_match, evaluate, text_sim
+from src.matching import (
+    DenseScores,
+    IndexedScores,
+    SweepScores,
+    f1_matrix,
+    max_weight_matching,
+    optimal_assignment,
+)
+
+
+WORDS = ["fix", "the", "login", "bug", "update", "dashboard", "send", "report", "to", "sam", "review", "mocks"]
+
+BACKENDS = ["python"] + (["numpy"] if matching.set_backend("auto") == "numpy" else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = matching.BACKEND
+    matching.set_backend(request.param)
+    yield request.param
+    matching.set_backend(previous)
+
+
+def _texts(rng, n):
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 6))) for _ in range(n)]
+
+
+def _items(texts):
+    return [{"text": t, "owner": None, "due": None} for t in texts]
+
+
+def _greedy_reference(pred_items, gold_items, threshold):
+    # The evaluator's matching loop before the similarity matrix
+    used, matched, hallucinated = set(), [], []
+    for p in pred_items:
+        gi, score = best_text_match(p["text"], gold_items, used)
+        if gi is None or score < threshold:
+            hallucinated.append(score)
+            continue
+        used.add(gi)
+        matched.append((gi, score))
+    return matched, hallucinated
+
+
+def test_matrix_matches_text_sim_exactly(backend):
+    rng = random.Random(0)
+    preds, golds = _texts(rng, 30), _texts(rng, 25)
+    scores = f1_matrix([_tokenize(t) for t in preds], [_tokenize(t) for t in golds])
+    for i, p in enumerate(preds):
+        for j, g in enumerate(golds):
+            assert scores[i][j] == text_sim(p, g)
+
+
+def test_greedy_flag_reproduces_previous_matching(backend):
+    rng = random.Random(1)
+    for _ in range(50):
+        pred_items, gold_items = _items(_texts(rng, 8)), _items(_texts(rng, 8))
+        threshold = rng.choice([0.0, 0.3, 0.5, 0.75])
+        section = evaluate({"action_items": pred_items}, {"action_items": gold_items}, threshold, greedy=True)["action_items"]
+
+        matched, hallucinated = _greedy_reference(pred_items, gold_items, threshold)
+        gold_index = {id(g): i for i, g in enumerate(gold_items)}
+        assert [(gold_index[id(m["gold"])], m["text_score"]) for m in section["matched"]] == matched
+        assert [h["best_score"] for h in section["hallucinations"]] == hallucinated
+
+
+def test_max_weight_matching_agrees_with_brute_force():
+    rng = random.Random(2)
+    for _ in range(200):
+        n, m = rng.randint(1, 5), rng.randint(1, 5)
+        weights = [[rng.choice([0.0, rng.random()]) for _ in range(m)] for _ in range(n)]
+        pairs = max_weight_matching(weights)
+
+        assert len(pairs) == min(n, m)
+        assert len({r for r, _ in pairs}) == len({c for _, c in pairs}) == len(pairs)
+        best = max(
+            sum(weights[r][c] for r, c in zip(rows, cols))
+            for rows in itertools.permutations(range(n), min(n, m))
+            for cols in itertools.permutations(range(m), min(n, m))
+        )
+        assert sum(weights[r][c] for r, c in pairs) == pytest.approx(best)
+
+
+def test_optimal_matching_beats_greedy_order():
+    # Greedy gives the first prediction its best gold item, leaving the
+    # second prediction below threshold; the assignment matches both
+    pred = {"action_items": _items(["fix the login bug", "the login bug today"])}
+    gold = {"action_items": _items(["fix the login bug today", "fix login bug"])}
+
+    greedy = evaluate(pred, gold, 0.75, greedy=True)["action_items"]
+    optimal = evaluate(pred, gold, 0.75)["action_items"]
+
+    assert len(greedy["matched"]) == 1
+    assert len(optimal["matched"]) == 2
+    assert optimal["recall"] == 1.0
+
+
+def test_optimal_matching_is_order_independent(backend):
+    rng = random.Random(3)
+    for _ in range(30):
+        preds, golds = _texts(rng, 10), _texts(rng, 10)
+        weights = f1_matrix([_tokenize(t) for t in preds], [_tokenize(t) for t in golds])
+        pairs, _ = optimal_assignment(DenseScores(weights, 0.5))
+
+        order = list(range(len(preds)))
+        rng.shuffle(order)
+        shuffled = [weights[i] for i in order]
+        shuffled_pairs, _ = optimal_assignment(DenseScores(shuffled, 0.5))
+
+        total = sum(score for _, score in pairs.values())
+        assert sum(score for _, score in shuffled_pairs.values()) == pytest.approx(total)
+        assert len(shuffled_pairs) == len(pairs)
+        assert all(weights[i][j] == score >= 0.5 for i, (j, score) in pairs.items())
+
+
+def test_unmatched_prediction_reports_best_remaining_score():
+    pred = {"decisions": _items(["ship it", "ship it today"])}
+    gold = {"decisions": _items(["ship it"])}
+
+    section = evaluate(pred, gold)["decisions"]
+
+    assert [m["pred"]["text"] for m in section["matched"]] == ["ship it"]
+    assert section["hallucinations"][0]["best_score"] == 0.0
+
+
+def test_evaluate_reports_matching_mode():
+    assert evaluate({}, {})["matching"] == "optimal"
+    assert evaluate({}, {}, greedy=True)["matching"] == "greedy"
+
+
+# ── inverted index ───────────────────────────────────────────────────────────
+
+def _sections(rng, n):
+    texts = _texts(rng, n) + [""]
+    return {name: _items(rng.sample(texts, len(texts))) for name in ("action_items", "decisions", "follow_ups")}
+
+
+@pytest.mark.parametrize("greedy", [False, True])
+def test_indexed_scores_give_identical_results(monkeypatch, greedy):
+    rng = random.Random(4)
+    for _ in range(40):
+        pred, gold = _sections(rng, 12), _sections(rng, 12)
+        threshold = rng.choice([0.0, 0.4, 0.5, 0.75, 0.8, 1.0])
+
+        monkeypatch.setattr(matching, "DENSE_MAX_CELLS", 10**9)
+        previous = matching.set_backend("python")
+        try:
+            dense = evaluate(pred, gold, threshold, greedy=greedy)
+            monkeypatch.setattr(matching, "DENSE_MAX_CELLS", 0)
+            indexed = evaluate(pred, gold, threshold, greedy=greedy)
+        finally:
+            matching.set_backend(previous)
+        assert indexed == dense
+
+
+def test_index_prunes_gold_items_by_length():
+    pred = [["fix", "the", "bug"]]
+    gold = [["fix", "the", "bug"], ["fix"] + ["x"] * 20, ["bug", "fix"]]
+    scores = IndexedScores(pred, gold, threshold=0.75)
+
+    # 3 tokens against 21 can score at most 2*3/24 = 0.25, so it is never looked at
+    lo, hi = scores._length_window(3)
+    assert scores._scores(0, lo, hi).keys() == {0, 2}
+    assert scores.candidates(0) == {0: 1.0, 2: 0.8}
+    # Unmatched predictions still get their exact best score
+    assert scores.best_score(0, excluded={0, 2}) == text_sim("fix the bug", "fix " + "x " * 20)
+
+
+def test_threshold_equal_to_a_score_is_not_pruned():
+    # 3 * 0.8 / (2 - 0.8) rounds to 2.0000000000000004, which would exclude
+    # the 2-token gold item scoring exactly 0.8 without the allowance
+    pred, gold = [["a", "b", "c"]], [["a", "b"]]
+    assert text_sim("a b c", "a b") == 0.8
+    assert IndexedScores(pred, gold, threshold=0.8).candidates(0) == {0: 0.8}
+
+
+def test_sweep_scores_filter_and_reject_lower_thresholds():
+    pred = [_tokenize(t) for t in ("fix the login bug", "ship it")]
+    gold = [_tokenize(t) for t in ("fix the login", "ship it now")]
+    sweep = SweepScores(IndexedScores(pred, gold, 0.5))
+
+    assert sweep.at(0.5).candidates(1) == {1: pytest.approx(0.8)}
+    assert sweep.at(0.9).candidates(0) == {}
+    with pytest.raises(ValueError):
+        sweep.at(0.4)
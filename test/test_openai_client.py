@@ -0,0 +1,130 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from lib import openai_client
+from lib.openai_client import AsyncOpenAIClient, OpenAIClient, _http_client_kwargs
+from lib.rate_limiter import RateLimiter
+
+
+POOL_SETTINGS = ("max_connections", "max_keepalive_connections", "keepalive_expiry", "timeout", "connect_timeout")
+
+
+def _kwargs(**settings):
+    return _http_client_kwargs(**{name: settings.get(name) for name in POOL_SETTINGS})
+
+
+def test_no_pool_settings_keep_sdk_defaults():
+    assert _kwargs() == {}
+
+
+@pytest.mark.parametrize(
+    "name, value, read",
+    [
+        ("max_connections", 7, lambda kw: kw["limits"].max_connections),
+        ("max_keepalive_connections", 3, lambda kw: kw["limits"].max_keepalive_connections),
+        ("keepalive_expiry", 12.5, lambda kw: kw["limits"].keepalive_expiry),
+        ("timeout", 9.0, lambda kw: kw["timeout"].read),
+        ("connect_timeout", 1.5, lambda kw: kw["timeout"].connect),
+    ],
+)
+def test_each_pool_setting_applies_on_its_own(name, value, read):
+    assert read(_kwargs(**{name: value})) == value
+
+
+def test_explicit_zero_is_not_replaced_by_default():
+    kwargs = _kwargs(keepalive_expiry=0, max_keepalive_connections=0)
+    assert kwargs["limits"].keepalive_expiry == 0
+    assert kwargs["limits"].max_keepalive_connections == 0
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def _response(total_tokens=300):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))],
+        usage=SimpleNamespace(prompt_tokens=total_tokens - 50, completion_tokens=50, total_tokens=total_tokens),
+    )
+
+
+class StubCompletions:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def create(self, **request):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RateLimitError("429 Too Many Requests")
+        return _response()
+
+
+class AsyncStubCompletions(StubCompletions):
+    async def create(self, **request):
+        return StubCompletions.create(self, **request)
+
+
+def _stub_sdk(client, completions):
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return completions
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(openai_client, "retry_delay", lambda attempt: 0.0)
+
+
+def test_sdk_retries_are_disabled_behind_a_rate_limiter():
+    assert OpenAIClient(api_key="sk-test").client.max_retries == 2
+    assert OpenAIClient(api_key="sk-test", rate_limiter=RateLimiter()).client.max_retries == 0
+    assert AsyncOpenAIClient(api_key="sk-test", rate_limiter=RateLimiter()).client.max_retries == 0
+
+
+def test_every_429_reaches_the_limiter_and_halves_the_window(no_backoff):
+    limiter = RateLimiter(rpm=600, max_concurrency=8)
+    client = OpenAIClient(api_key="sk-test", rate_limiter=limiter)
+    completions = _stub_sdk(client, StubCompletions(failures=2))
+
+    assert client.chat_completion([{"role": "user", "content": "hi"}]) == "{}"
+
+    stats = limiter.stats()
+    assert completions.calls == 3
+    assert stats["rate_limited"] == 2
+    assert stats["admitted"] == 3
+    assert stats["concurrency_limit"] == 2
+
+
+def test_rate_limit_is_raised_once_retries_are_spent(no_backoff):
+    limiter = RateLimiter(max_concurrency=8)
+    client = OpenAIClient(api_key="sk-test", rate_limiter=limiter, max_retries=1)
+    _stub_sdk(client, StubCompletions(failures=5))
+
+    with pytest.raises(RateLimitError):
+        client.chat_completion([{"role": "user", "content": "hi"}])
+    assert limiter.stats()["rate_limited"] == 2
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_async_client_retries_429_through_the_limiter(no_backoff):
+    limiter = RateLimiter(max_concurrency=8)
+    client = AsyncOpenAIClient(api_key="sk-test", rate_limiter=limiter)
+    completions = _stub_sdk(client, AsyncStubCompletions(failures=1))
+
+    assert asyncio.run(client.chat_completion([{"role": "user", "content": "hi"}])) == "{}"
+    assert completions.calls == 2
+    assert limiter.stats()["concurrency_limit"] == 4
+
+
+def test_token_reservation_is_settled_from_reported_usage():
+    limiter = RateLimiter(tpm=100_000)
+    client = OpenAIClient(api_key="sk-test", rate_limiter=limiter)
+    _stub_sdk(client, StubCompletions(failures=0))
+
+    client.chat_completion([{"role": "user", "content": "hi"}])
+
+    # The reservation included a 1000-token completion reserve; only the 300 reported tokens stay charged
+    assert limiter.stats()["tokens_available"] == pytest.approx(100_000 - 300, abs=5)
+    assert limiter.stats()["token_estimate_drift"] < 0
@@ -0,0 +1,145 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+from pydantic_core import ValidationError as CoreValidationError
+
+from api.models.extraction import ActionItem, Decision, FollowUp
+from src.llm_extractor import LLMExtractor
+from src.output_schema import (
+    ITEM_CONTRACT,
+    OUTPUT_VALIDATOR,
+    SECTION_NAMES,
+    extraction_json_schema,
+    response_format_for,
+)
+
+
+MODELS = {"action_items": ActionItem, "decisions": Decision, "follow_ups": FollowUp}
+
+SAMPLE_VALUES = {"string": "x", "nullable_string": None, "null": None, "boolean": False}
+
+
+class RecordingClient:
+    def __init__(self, responses):
+        self.responses = responses
+        self.formats = []
+
+    def chat_completion(self, messages, response_format):
+        self.formats.append(response_format)
+        return self.responses[len(self.formats) - 1]
+
+
+def _sample_item(section):
+    return {field: SAMPLE_VALUES[kind] for field, kind in ITEM_CONTRACT[section].items()}
+
+
+def _walk_objects(schema):
+    if schema.get("type") == "object":
+        yield schema
+        for child in schema["properties"].values():
+            yield from _walk_objects(child)
+    elif schema.get("type") == "array":
+        yield from _walk_objects(schema["items"])
+
+
+def test_schema_is_strict_at_every_level():
+    schema = extraction_json_schema()
+    assert list(schema["properties"]) == list(SECTION_NAMES)
+    for obj in _walk_objects(schema):
+        assert obj["additionalProperties"] is False
+        assert obj["required"] == list(obj["properties"])
+
+
+def test_schema_matches_validator_contract():
+    schema = extraction_json_schema()
+    action_item = schema["properties"]["action_items"]["items"]["properties"]
+    assert action_item["due"] == {"type": "null"}
+    assert action_item["owner"] == {"type": ["string", "null"]}
+    assert action_item["needs_human_review"] == {"type": "boolean"}
+    for section in SECTION_NAMES:
+        assert list(schema["properties"][section]["items"]["properties"]) == list(ITEM_CONTRACT[section])
+
+
+@pytest.mark.parametrize("section", SECTION_NAMES)
+def test_contract_agrees_with_api_models(section):
+    model = MODELS[section]
+    assert set(ITEM_CONTRACT[section]) <= set(model.model_fields)
+    model.model_validate(_sample_item(section))
+    for field, kind in ITEM_CONTRACT[section].items():
+        if kind == "string":
+            with pytest.raises(ValidationError):
+                model.model_validate({**_sample_item(section), field: None})
+
+
+def test_sample_items_pass_the_extractor_validators():
+    data = {section: [_sample_item(section)] for section in SECTION_NAMES}
+    LLMExtractor()._validate_schema(data)
+
+
+def test_response_format_for_modes():
+    assert response_format_for("json_object") == {"type": "json_object"}
+    strict = response_format_for("json_schema")
+    assert strict["type"] == "json_schema"
+    assert strict["json_schema"]["strict"] is True
+    assert strict["json_schema"]["schema"] == extraction_json_schema()
+    with pytest.raises(ValueError, match="response_mode"):
+        response_format_for("yaml")
+
+
+def test_json_schema_mode_sends_schema_and_tracks_retry_rate():
+    valid = json.dumps({name: [] for name in SECTION_NAMES})
+    client = RecordingClient([valid, json.dumps({"action_items": []}), valid])
+    extractor = LLMExtractor(client=client, response_mode="json_schema")
+
+    extractor.extract("Alex: first")
+    extractor.extract("Alex: second")
+
+    assert all(fmt["type"] == "json_schema" for fmt in client.formats)
+    assert extractor.build_request("Alex: hi")["response_format"]["type"] == "json_schema"
+    stats = extractor.retry_stats.as_dict()["by_response_mode"]["json_schema"]
+    assert stats == {"extractions": 2, "retried": 1, "attempts": 3, "retry_rate": 0.5}
+
+
+def test_rejects_unknown_response_mode():
+    with pytest.raises(ValueError, match="response_mode"):
+        LLMExtractor(response_mode="yaml")
+
+
+def _variants():
+    good = {section: [_sample_item(section)] for section in SECTION_NAMES}
+    yield good
+    yield {**good, "extra": []}
+    yield {key: value for key, value in good.items() if key != "decisions"}
+    yield {**good, "decisions": {}}
+    yield {**good, "decisions": ["not an object"]}
+    for section in SECTION_NAMES:
+        for field in ITEM_CONTRACT[section]:
+            item = _sample_item(section)
+            del item[field]
+            yield {**good, section: [item]}
+            for value in ("x", None, True, 1, []):
+                yield {**good, section: [{**_sample_item(section), field: value}]}
+            yield {**good, section: [{**_sample_item(section), "unexpected": "x"}]}
+
+
+def _hand_validated(extractor, data):
+    try:
+        extractor._validate_schema(data)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def test_compiled_validator_agrees_with_hand_written_validators():
+    extractor = LLMExtractor()
+    for data in _variants():
+        raw = json.dumps(data)
+        try:
+            parsed = OUTPUT_VALIDATOR.validate_json(raw)
+            accepted = True
+        except CoreValidationError:
+            accepted = False
+        assert accepted == _hand_validated(extractor, data), raw
+        if accepted:
+            assert parsed == data
@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import pytest
+
+from lib.rate_limiter import RateLimiter, TokenBucket
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def test_token_bucket_reports_wait_until_refilled():
+    bucket = TokenBucket(60)  # one unit per second
+    now = time.monotonic()
+    bucket.take(60)
+    assert bucket.wait_time(2, now) == pytest.approx(2.0, abs=0.05)
+    assert bucket.wait_time(2, now + 2.5) == 0.0
+
+
+def test_token_bucket_admits_oversized_request_once_full():
+    bucket = TokenBucket(100)
+    assert bucket.wait_time(500, time.monotonic()) == 0.0
+
+
+def test_request_budget_is_consumed_per_call():
+    limiter = RateLimiter(rpm=2, poll_interval=0.01)
+    limiter.acquire(10)
+    limiter.release()
+    limiter.acquire(10)
+    limiter.release()
+    assert limiter._try_admit(10) > 0
+    stats = limiter.stats()
+    assert stats["admitted"] == 2
+    assert stats["requests_available"] < 1
+
+
+def test_token_budget_blocks_expensive_calls():
+    limiter = RateLimiter(tpm=1000)
+    limiter.acquire(900)
+    limiter.release()
+    assert limiter._try_admit(500) > 0
+    assert limiter._try_admit(50) == 0.0
+
+
+def test_rate_limited_response_halves_concurrency_and_success_regrows_it():
+    limiter = RateLimiter(max_concurrency=8, min_concurrency=1)
+    with pytest.raises(RateLimitError):
+        with limiter.limit(10):
+            raise RateLimitError()
+    assert limiter.stats()["concurrency_limit"] == 4
+    assert limiter.stats()["rate_limited"] == 1
+
+    for _ in range(20):
+        with limiter.limit(10):
+            pass
+    assert limiter.stats()["concurrency_limit"] > 4
+
+
+def test_concurrency_never_drops_below_minimum():
+    limiter = RateLimiter(max_concurrency=4, min_concurrency=2)
+    for _ in range(5):
+        limiter.acquire(1)
+        limiter.release(rate_limited=True)
+    assert limiter.stats()["concurrency_limit"] == 2
+
+
+def test_reconcile_replaces_reservation_with_reported_tokens():
+    limiter = RateLimiter(tpm=1000)
+    limiter.acquire(900)
+    limiter.release()
+    limiter.reconcile(900, 100)
+    assert limiter._try_admit(800) == 0.0
+    limiter.release()
+
+    limiter.reconcile(100, 600)
+    assert limiter.stats()["tokens_available"] < 0
+    assert limiter.stats()["token_estimate_drift"] == -800 + 500
+
+
+def test_other_errors_do_not_shrink_concurrency():
+    limiter = RateLimiter(max_concurrency=8)
+    with pytest.raises(ValueError):
+        with limiter.limit(10):
+            raise ValueError("bad output")
+    assert limiter.stats()["concurrency_limit"] == 8
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_async_callers_share_the_concurrency_window():
+    limiter = RateLimiter(max_concurrency=2, poll_interval=0.005)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter.alimit(10):
+            peak = max(peak, limiter.stats()["in_flight"])
+            await asyncio.sleep(0.01)
+
+    async def run():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(run())
+    stats = limiter.stats()
+    assert peak == 2
+    assert stats["admitted"] == 6
+    assert stats["queue_depth"] == 0
+    assert stats["total_wait_seconds"] > 0
+
+
+def test_from_env_is_disabled_without_settings(monkeypatch):
+    for name in ("OPENAI_RPM", "OPENAI_TPM", "OPENAI_MAX_CONCURRENCY"):
+        monkeypatch.delenv(name, raising=False)
+    assert RateLimiter.from_env() is None
+
+    monkeypatch.setenv("OPENAI_TPM", "30000")
+    limiter = RateLimiter.from_env()
+    assert limiter.stats()["tokens_available"] == 30000
+    assert limiter.stats()["requests_available"] is None
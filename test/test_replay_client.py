@@ -0,0 +1,136 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from lib.replay_client import (
+    AsyncReplayClient,
+    Cassette,
+    CassetteMiss,
+    ReplayClient,
+    latency_sampler,
+    replay_client_from_env,
+)
+from src.llm_extractor import LLMExtractor
+
+
+EMPTY = json.dumps({"action_items": [], "decisions": [], "follow_ups": []})
+
+
+class LiveStub:
+    model = "gpt-test"
+    temperature = 0.0
+
+    def __init__(self):
+        self.calls = 0
+
+    def chat_completion(self, messages, model=None, temperature=None, response_format=None):
+        self.calls += 1
+        return EMPTY
+
+
+class AsyncLiveStub(LiveStub):
+    async def chat_completion(self, messages, model=None, temperature=None, response_format=None):
+        self.calls += 1
+        return EMPTY
+
+    async def chat_completion_stream(self, messages, model=None, temperature=None, response_format=None):
+        self.calls += 1
+        for i in range(0, len(EMPTY), 5):
+            yield EMPTY[i:i + 5]
+
+
+def test_records_then_replays_without_calling_inner(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    live = LiveStub()
+    recorder = ReplayClient(path, inner=live, mode="record")
+    assert LLMExtractor(client=recorder).extract("Alex: ship it") == json.loads(EMPTY)
+    assert live.calls == 1
+
+    replayer = ReplayClient(path, model="gpt-test")
+    assert LLMExtractor(client=replayer).extract("Alex: ship it") == json.loads(EMPTY)
+    assert replayer.hits == 1
+
+
+def test_replay_miss_raises(tmp_path):
+    client = ReplayClient(tmp_path / "empty.jsonl")
+    with pytest.raises(CassetteMiss):
+        client.chat_completion([{"role": "user", "content": "unrecorded"}])
+
+
+def test_key_depends_on_request_content(tmp_path):
+    live = LiveStub()
+    client = ReplayClient(tmp_path / "c.jsonl", inner=live, mode="auto")
+    client.chat_completion([{"role": "user", "content": "a"}])
+    client.chat_completion([{"role": "user", "content": "a"}])
+    client.chat_completion([{"role": "user", "content": "a"}], response_format={"type": "json_object"})
+    assert live.calls == 2
+    assert (client.hits, client.misses) == (1, 2)
+    assert len(Cassette(tmp_path / "c.jsonl")) == 2
+
+
+def test_record_mode_requires_inner_client(tmp_path):
+    with pytest.raises(ValueError, match="inner client"):
+        ReplayClient(tmp_path / "c.jsonl", mode="record")
+
+
+def test_async_replay_streams_recorded_completion(tmp_path):
+    path = tmp_path / "c.jsonl"
+    messages = [{"role": "user", "content": "hi"}]
+
+    async def run():
+        recorder = AsyncReplayClient(path, inner=AsyncLiveStub(), mode="record")
+        recorded = "".join([d async for d in recorder.chat_completion_stream(messages)])
+        replayer = AsyncReplayClient(path, model="gpt-test", latency="fixed:0.01")
+        replayed = [d async for d in replayer.chat_completion_stream(messages)]
+        return recorded, replayed, await replayer.chat_completion(messages)
+
+    recorded, replayed, completion = asyncio.run(run())
+    assert recorded == EMPTY == "".join(replayed) == completion
+    assert len(replayed) > 1
+
+
+def test_async_recording_appends_to_the_cassette_off_the_event_loop(tmp_path, monkeypatch):
+    write_threads = []
+    add = Cassette.add
+
+    def recording_add(self, *args):
+        write_threads.append(threading.get_ident())
+        return add(self, *args)
+
+    monkeypatch.setattr(Cassette, "add", recording_add)
+    messages = [{"role": "user", "content": "hi"}]
+
+    async def run():
+        recorder = AsyncReplayClient(tmp_path / "c.jsonl", inner=AsyncLiveStub(), mode="record")
+        await recorder.chat_completion(messages)
+        async for _ in recorder.chat_completion_stream(messages, response_format={"type": "json_object"}):
+            pass
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert len(write_threads) == 2 and loop_thread not in write_threads
+    assert len(Cassette(tmp_path / "c.jsonl")) == 2
+
+
+def test_latency_sampler_is_seeded():
+    first = latency_sampler("lognormal:1.0,0.5", seed=3)
+    second = latency_sampler("lognormal:1.0,0.5", seed=3)
+    assert [first(0.2) for _ in range(5)] == [second(0.2) for _ in range(5)]
+    assert latency_sampler("recorded")(0.25) == 0.25
+    assert latency_sampler(None)(0.25) == 0.0
+    with pytest.raises(ValueError, match="latency spec"):
+        latency_sampler("gamma:1")
+
+
+def test_from_env_uses_cassette_without_api_key(tmp_path, monkeypatch):
+    monkeypatch.delenv("LLM_CASSETTE", raising=False)
+    assert replay_client_from_env() is None
+
+    monkeypatch.setenv("LLM_CASSETTE", str(tmp_path / "c.jsonl"))
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("EXTRACTION_CACHE", "off")
+    extractor = LLMExtractor.from_env()
+    assert isinstance(extractor.client, ReplayClient)
+    assert isinstance(extractor.async_client, AsyncReplayClient)
@@ -0,0 +1,138 @@
+import json
+import sys
+
+import pytest
+
+import eval as eval_cli
+from src.eval_runner import run_evaluation
+from src.run_history import RunHistory, compare_runs, format_comparison, history_path_from_env
+
+
+GOLD = {
+    "action_items": [{"text": "Fix the login bug", "owner": "Alex", "due": None}],
+    "decisions": [{"text": "Use the new auth flow"}],
+    "follow_ups": [],
+}
+
+
+class StubExtractor:
+    model = "gpt-test"
+
+    def __init__(self, response):
+        self.response = response
+
+    def extract(self, transcript):
+        return self.response
+
+    def prompt_version(self):
+        return "v-test"
+
+
+def _evaluate(tmp_path, pred):
+    transcript_path = tmp_path / "meeting.txt"
+    gold_path = tmp_path / "meeting.gold.json"
+    transcript_path.write_text("Alex: Fix the login bug.")
+    gold_path.write_text(json.dumps(GOLD))
+    return run_evaluation(str(transcript_path), str(gold_path), extractor=StubExtractor(pred))
+
+
+def _with_performance(result, **performance):
+    result["performance"] = {**result["performance"], **performance}
+    return result
+
+
+def test_record_round_trips_metrics_and_performance(tmp_path):
+    history = RunHistory(str(tmp_path / "history.sqlite3"))
+    result = _with_performance(_evaluate(tmp_path, GOLD), llm_calls=3, prompt_tokens=900, completion_tokens=100)
+
+    run = history.record(result, model="gpt-test", prompt_version="v-test")
+
+    assert run["id"] == 1
+    assert run["source"] == "model"
+    assert run["precision"] == 1.0 and run["recall"] == 1.0
+    assert run["sections"]["action_items"]["recall"] == 1.0
+    assert (run["llm_calls"], run["total_tokens"]) == (3, 1000)
+    assert run["wall_seconds"] >= run["scoring_seconds"]
+    assert history.get(run["id"]) == run
+
+
+def test_previous_is_the_latest_earlier_run_of_the_pair_and_source(tmp_path):
+    history = RunHistory(str(tmp_path / "history.sqlite3"))
+    result = _evaluate(tmp_path, GOLD)
+    first = history.record(result)
+    history.record(result, source="snapshot")
+    third = history.record(result)
+
+    assert history.previous(third)["id"] == first["id"]
+    assert history.previous(first) is None
+    assert [run["id"] for run in history.runs(limit=2)] == [3, 2]
+
+
+def test_compare_flags_latency_and_cost_regressions(tmp_path):
+    history = RunHistory(str(tmp_path / "history.sqlite3"))
+    baseline = history.record(
+        _with_performance(
+            _evaluate(tmp_path, GOLD), wall_seconds=2.0, llm_seconds=1.5, prompt_tokens=1000, completion_tokens=100
+        )
+    )
+    worse = {**GOLD, "decisions": []}
+    candidate = history.record(
+        _with_performance(
+            _evaluate(tmp_path, worse), wall_seconds=3.0, llm_seconds=1.55, prompt_tokens=1500, completion_tokens=100
+        )
+    )
+
+    comparison = compare_runs(baseline, candidate)
+
+    assert "wall_seconds" in comparison["regressions"]
+    assert "llm_seconds" not in comparison["regressions"]
+    assert {"prompt_tokens", "total_tokens"} <= set(comparison["regressions"])
+    assert "completion_tokens" not in comparison["regressions"]
+    recall = next(m for m in comparison["metrics"] if m["name"] == "recall")
+    assert recall["delta"] == -0.5 and not recall["regression"]
+
+    report = format_comparison(comparison)
+    assert "REGRESSION (latency)" in report
+    assert "REGRESSION (cost)" in report
+
+
+def test_compare_does_not_judge_tokens_when_usage_is_missing(tmp_path):
+    history = RunHistory(str(tmp_path / "history.sqlite3"))
+    baseline = history.record(_with_performance(_evaluate(tmp_path, GOLD), prompt_tokens=100))
+    candidate = history.record(
+        _with_performance(_evaluate(tmp_path, GOLD), prompt_tokens=500, calls_without_usage=1)
+    )
+
+    comparison = compare_runs(baseline, candidate)
+
+    assert not comparison["tokens_known"]
+    assert comparison["regressions"] == []
+    assert "token counts not judged" in format_comparison(comparison)
+
+
+def test_history_is_off_unless_a_path_is_configured(monkeypatch):
+    monkeypatch.delenv("EVAL_HISTORY_PATH", raising=False)
+    assert history_path_from_env() is None
+    monkeypatch.setenv("EVAL_HISTORY_PATH", "runs.sqlite3")
+    assert history_path_from_env() == "runs.sqlite3"
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [
+        ["--sweep", "--compare"],
+        ["--sweep", "--history", "h.sqlite3"],
+        ["--corpus", "pairs.jsonl", "--compare", "--history"],
+        ["--compare"],
+    ],
+)
+def test_cli_rejects_compare_and_history_where_runs_are_not_recorded(flags, monkeypatch, capsys):
+    monkeypatch.delenv("EVAL_HISTORY_PATH", raising=False)
+    monkeypatch.setattr(sys, "argv", ["eval.py", "t.txt", "g.json", *flags])
+
+    with pytest.raises(SystemExit) as exc_info:
+        eval_cli.main()
+
+    err = capsys.readouterr().err
+    assert exc_info.value.code == 2
+    assert "--compare" in err or "--history" in err
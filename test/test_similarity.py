@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from src import matching
+from src.evaluator import evaluate, sweep_thresholds, text_sim
+from src.similarity import (
+    SIMILARITIES,
+    char_ngrams,
+    minhash_signature,
+    similarity_backend,
+)
+
+
+WORDS = ["fix", "fixed", "the", "login", "logins", "bug", "ship", "release", "notes", "review", "reviews"]
+
+BACKENDS = ["python"] + (["numpy"] if matching.set_backend("auto") == "numpy" else [])
+
+
+def _texts(rng, n):
+    return [" ".join(rng.choices(WORDS, k=rng.randint(0, 6))) for _ in range(n)]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = matching.BACKEND
+    matching.set_backend(request.param)
+    yield request.param
+    matching.set_backend(previous)
+
+
+@pytest.mark.parametrize("name", ["token_f1", "char_jaccard"])
+def test_exact_backends_score_sections_like_pairwise(name, backend):
+    rng = random.Random(3)
+    similarity = similarity_backend(name)
+    for threshold in (0.0, 0.4, 0.75, 1.0):
+        preds, golds = _texts(rng, 12), _texts(rng, 12)
+        pred_vectors, gold_vectors = similarity.vectors(preds, golds)
+        scores = similarity.section_scores(pred_vectors, gold_vectors, threshold)
+        for i, p in enumerate(preds):
+            pairwise = {j: text_sim(p, g, name) for j, g in enumerate(golds)}
+            assert scores.candidates(i) == {j: s for j, s in pairwise.items() if s > 0 and s >= threshold}
+            assert scores.best_score(i, {0, 1}) == max(s for j, s in pairwise.items() if j not in {0, 1})
+
+
+def test_token_f1_backend_matches_text_sim_exactly():
+    rng = random.Random(5)
+    similarity = similarity_backend("token_f1")
+    preds, golds = _texts(rng, 20), _texts(rng, 20)
+    pred_vectors, gold_vectors = similarity.vectors(preds, golds)
+    for p, pv in zip(preds, pred_vectors):
+        for g, gv in zip(golds, gold_vectors):
+            assert similarity.score(pv, gv) == text_sim(p, g)
+
+
+def test_char_jaccard_tolerates_inflections():
+    assert text_sim("review the fixed logins", "reviews the fix login", "char_jaccard") > text_sim(
+        "review the fixed logins", "reviews the fix login"
+    )
+    assert text_sim("", "", "char_jaccard") == 1.0
+    assert text_sim("ship", "", "char_jaccard") == 0.0
+    assert char_ngrams("Hi!") == {" hi", "hi "}
+
+
+def test_minhash_signature_same_with_and_without_numpy(backend):
+    grams = char_ngrams("fix the login bug before the release")
+    signature = minhash_signature(grams)
+    matching.set_backend("python")
+    assert minhash_signature(grams) == signature
+
+
+def test_minhash_estimates_char_jaccard():
+    rng = random.Random(11)
+    errors = []
+    for _ in range(200):
+        a, b = _texts(rng, 2)
+        errors.append(abs(text_sim(a, b, "minhash") - text_sim(a, b, "char_jaccard")))
+    assert sum(errors) / len(errors) < 0.05
+    assert text_sim("", "", "minhash") == 1.0
+    assert text_sim("ship it", "", "minhash") == 0.0
+
+
+def test_minhash_lsh_finds_near_duplicates():
+    rng = random.Random(2)
+    words = [f"w{i}" for i in range(500)]
+    golds = [" ".join(rng.choices(words, k=10)) for _ in range(300)]
+    preds = [g + " extra" for g in golds]
+    result = evaluate(
+        {"decisions": [{"text": t} for t in preds]},
+        {"decisions": [{"text": t} for t in golds]},
+        text_threshold=0.6,
+        similarity="minhash",
+    )
+    matched = result["decisions"]["matched"]
+    assert len(matched) >= 295
+    assert all(m["pred"]["text"] == m["gold"]["text"] + " extra" for m in matched)
+
+
+def test_sweep_matches_evaluate_for_other_similarities():
+    rng = random.Random(9)
+    pred = {"action_items": [{"text": t, "owner": None, "due": None} for t in _texts(rng, 8)]}
+    gold = {"action_items": [{"text": t, "owner": None, "due": None} for t in _texts(rng, 8)]}
+    for name in SIMILARITIES:
+        for point in sweep_thresholds(pred, gold, [0.3, 0.6, 0.9], similarity=name):
+            result = evaluate(pred, gold, text_threshold=point["text_threshold"], similarity=name)
+            assert point["action_items"]["matched"] == len(result["action_items"]["matched"])
+        assert evaluate(pred, gold, similarity=name)["similarity"] == name
+
+
+def test_unknown_similarity_is_rejected():
+    with pytest.raises(ValueError, match="similarity must be one of"):
+        evaluate({}, {}, similarity="cosine")
@@ -0,0 +1,122 @@
+import asyncio
+import gzip
+
+import pytest
+
+from src.llm_extractor import LLMExtractor
+from src.snapshots import SnapshotExtractor, SnapshotMiss, SnapshotStore, snapshot_dir_from_env, with_snapshots
+
+
+PRED = {
+    "action_items": [{"text": "Send the notes", "owner": "Alex", "due": None}],
+    "decisions": [],
+    "follow_ups": [],
+}
+
+
+class StubExtractor:
+    model = "stub-model"
+
+    def __init__(self, response, version="v1"):
+        self.response = response
+        self.version = version
+        self.calls = 0
+
+    def prompt_version(self):
+        return self.version
+
+    def extract(self, transcript):
+        self.calls += 1
+        return self.response
+
+    async def aextract(self, transcript):
+        self.calls += 1
+        return self.response
+
+
+def test_store_round_trip_and_index_survives_reopen(tmp_path):
+    store = SnapshotStore(tmp_path)
+    entry = store.put("Alex: hi", "v1", "m", PRED)
+    store.put("Sam: hi", "v1", "m", {"action_items": [], "decisions": [], "follow_ups": []})
+
+    reopened = SnapshotStore(tmp_path)
+    assert len(reopened) == 2
+    assert reopened.get("Alex: hi", "v1", "m") == PRED
+    assert reopened.get("Alex: hi", "v2", "m") is None
+    assert reopened.lookup("Alex: hi", "v1", "m")["offset"] == entry["offset"]
+    # The data file is one gzip stream of JSONL records
+    lines = gzip.decompress((tmp_path / "predictions.jsonl.gz").read_bytes()).splitlines()
+    assert len(lines) == 2
+
+
+def test_store_skips_unchanged_predictions_and_sees_other_writers(tmp_path):
+    store = SnapshotStore(tmp_path)
+    other = SnapshotStore(tmp_path)
+    first = store.put("Alex: hi", "v1", "m", PRED)
+    assert store.put("Alex: hi", "v1", "m", PRED) == first
+    assert len((tmp_path / "index.jsonl").read_text().splitlines()) == 1
+
+    # Appended by another process after this store loaded its index
+    assert other.get("Alex: hi", "v1", "m") == PRED
+
+
+def test_snapshot_extractor_records_then_replays_without_calling_model(tmp_path):
+    store = SnapshotStore(tmp_path)
+    inner = StubExtractor(PRED)
+
+    assert SnapshotExtractor(store, inner).extract("Alex: hi") == PRED
+    assert inner.calls == 1
+
+    replay = SnapshotExtractor(store, inner, mode="replay")
+    assert replay.extract("Alex: hi") == PRED
+    assert asyncio.run(replay.aextract("Alex: hi")) == PRED
+    assert inner.calls == 1
+    assert replay.last_entry["model"] == "stub-model"
+
+
+def test_snapshot_extractor_replay_misses_on_new_prompt_version(tmp_path):
+    store = SnapshotStore(tmp_path)
+    SnapshotExtractor(store, StubExtractor(PRED, version="v1")).extract("Alex: hi")
+
+    with pytest.raises(SnapshotMiss, match="1 other prompt version"):
+        SnapshotExtractor(store, StubExtractor(PRED, version="v2"), mode="replay").extract("Alex: hi")
+
+
+def test_with_snapshots_needs_a_directory_to_replay():
+    extractor = StubExtractor(PRED)
+    assert with_snapshots(extractor, None) is extractor
+    with pytest.raises(ValueError):
+        with_snapshots(extractor, None, from_snapshot=True)
+
+
+def test_snapshots_are_off_unless_a_directory_is_configured(monkeypatch):
+    monkeypatch.delenv("EVAL_SNAPSHOT_DIR", raising=False)
+    assert snapshot_dir_from_env() is None
+    monkeypatch.setenv("EVAL_SNAPSHOT_DIR", "")
+    assert snapshot_dir_from_env() is None
+    monkeypatch.setenv("EVAL_SNAPSHOT_DIR", "/tmp/snaps")
+    assert snapshot_dir_from_env() == "/tmp/snaps"
+
+
+def test_async_store_access_runs_off_the_event_loop(tmp_path, monkeypatch):
+    store = SnapshotStore(tmp_path)
+    called_from = []
+    original_put = store.put
+
+    def put(*args):
+        try:
+            asyncio.get_running_loop()
+            called_from.append("event loop")
+        except RuntimeError:
+            called_from.append("worker thread")
+        return original_put(*args)
+
+    monkeypatch.setattr(store, "put", put)
+    asyncio.run(SnapshotExtractor(store, StubExtractor(PRED)).aextract("Alex: hi"))
+
+    assert called_from == ["worker thread"]
+
+
+def test_prompt_version_tracks_chunking():
+    assert LLMExtractor().prompt_version() != LLMExtractor(chunk_chars=4000).prompt_version()
+    assert LLMExtractor().prompt_version() == LLMExtractor().prompt_version()
@@ -0,0 +1,125 @@
+import random
+import time
+
+from api.services.transcript_validator import validate_transcript
+from src.transcript_analysis import analyze_transcript, count_speaker_lines
+
+
+# Seconds allowed per MB of input; linear scans take a few milliseconds, the
+# previous pattern took close to a minute on some of the inputs below
+BUDGET_SECONDS_PER_MB = 1.0
+SIZE = 500_000
+
+_LABEL_CHARS = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz \t-'")
+
+
+def _reference_count(text: str) -> int:
+    # Straightforward per-line reading of the "Label: text" format: a label of
+    # two or more label characters on one line, then whitespace (which may run
+    # onto later lines) and the first character of the text. A line whose start
+    # was taken as another line's text is not read again.
+    count = 0
+    consumed = 0
+    start = 0
+    for line in text.split("\n"):
+        line_start, start = start, start + len(line) + 1
+        if line_start < consumed:
+            continue
+        indent = len(line) - len(line.lstrip(" \t"))
+        colon = line.find(":", indent)
+        label = line[indent:colon]
+        if colon < 0 or len(label) < 2 or not label[0].isascii() or not label[0].isalpha():
+            continue
+        if not set(label) <= _LABEL_CHARS:
+            continue
+        pos = line_start + colon + 1
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos > line_start + colon + 1 and pos < len(text):
+            count += 1
+            consumed = pos + 1
+    return count
+
+
+def test_matches_reference_on_random_inputs():
+    rng = random.Random(0)
+    alphabet = "aZ -':\t\n\r1."
+    for _ in range(3000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        assert count_speaker_lines(text) == _reference_count(text), repr(text)
+        assert analyze_transcript(text).speaker_lines == _reference_count(text), repr(text)
+
+
+def test_matches_reference_on_line_shaped_inputs():
+    rng = random.Random(1)
+    pieces = ["Alex", "Priya Shah", "O'Neil", "Mary-Jo", " ", "\t", ":", ": ", "hi", "1", "", "\r"]
+    for _ in range(2000):
+        lines = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 6))) for _ in range(rng.randint(1, 5))]
+        text = "\n".join(lines)
+        assert count_speaker_lines(text) == _reference_count(text), repr(text)
+
+
+def test_limit_stops_early():
+    text = "Alex: one\nSam: two\nPriya: three\n"
+    assert count_speaker_lines(text) == 3
+    assert count_speaker_lines(text, limit=2) == 2
+    assert count_speaker_lines("Alex: one\n", limit=2) == 1
+
+
+def test_labels_do_not_span_lines():
+    assert count_speaker_lines("Alex\nand Sam: hello\n") == 1
+    assert count_speaker_lines("Alex:\n hello\nSam:\tthere\n") == 2
+    assert count_speaker_lines("\n\n  \t Alex: hello") == 1
+    # Labels need at least two characters, as in the baseline validator
+    assert count_speaker_lines("A: hi\nB: there") == 0
+
+
+def test_text_may_start_on_the_line_after_the_label():
+    for newline in ("\n", "\r\n"):
+        text = newline.join(["Alex:", "Let's start.", "Sam:", "Sure thing.", ""])
+        assert count_speaker_lines(text) == 2
+        assert analyze_transcript(text).speaker_lines == 2
+        assert validate_transcript(text).valid
+
+
+PATHOLOGICAL = {
+    "letters and spaces, one line": ("a " * SIZE)[:SIZE],
+    "letters and spaces, many lines": ("a a a a a a a a a\n" * SIZE)[:SIZE],
+    "blank lines": "\n" * SIZE,
+    "spaces then letters": " " * (SIZE // 2) + "a" * (SIZE // 2),
+    "tabs and newlines": ("\t\t\n" * SIZE)[:SIZE],
+    "colon without text": ("Speaker:\n" * SIZE)[:SIZE],
+    "colon at the end": "a" * (SIZE - 1) + ":",
+    "colons without spaces": ("a:" * SIZE)[:SIZE],
+    "label then blanks": ("Alex:" + " " * 1000 + "\n") * (SIZE // 1006),
+    "date headers without dates": ("Date:" + " " * 100) * (SIZE // 105),
+    "hyphens and apostrophes": ("-'" * SIZE)[:SIZE],
+}
+
+
+def test_pathological_inputs_stay_within_budget():
+    for name, text in PATHOLOGICAL.items():
+        budget = BUDGET_SECONDS_PER_MB * len(text) / 1_000_000
+        start = time.perf_counter()
+        validate_transcript(text)
+        analyze_transcript.__wrapped__(text)
+        elapsed = time.perf_counter() - start
+        assert elapsed < budget, f"{name}: {elapsed:.3f}s for {len(text)} chars"
+
+
+def test_scan_time_grows_linearly():
+    line = "word " * 40 + "\n"
+
+    def scan_seconds(n):
+        text = line * n
+        return min(_timed(lambda: count_speaker_lines(text)) for _ in range(3))
+
+    small, large = scan_seconds(500), scan_seconds(4000)
+    # 8x the input; a quadratic scan would be about 64x slower
+    assert large < small * 24 + 0.01
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
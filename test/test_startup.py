@@ -0,0 +1,32 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _loaded_modules(code: str) -> set[str]:
+    probe = f"{code}\nimport sys\nprint(' '.join(sys.modules))"
+    proc = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(proc.stdout.split())
+
+
+@pytest.mark.parametrize("code", ["import main", "import eval"])
+def test_cli_entry_points_do_not_import_sdk_dotenv_or_fastapi(code):
+    loaded = _loaded_modules(code)
+    assert not {"openai", "dotenv", "fastapi"} & loaded
+
+
+def test_create_app_does_not_import_openai_sdk():
+    assert "openai" not in _loaded_modules("from api.main import create_app; create_app()")
+
+
+def test_client_construction_still_loads_sdk():
+    from lib.openai_client import OpenAIClient
+
+    client = OpenAIClient(api_key="sk-test")
+    assert type(client.client).__module__.startswith("openai")
+    client.close()
@@ -0,0 +1,146 @@
+import asyncio
+import json
+
+import pytest
+
+from src.llm_extractor import LLMExtractor
+from src.stream_parser import IncrementalItemParser
+
+
+PAYLOAD = {
+    "action_items": [
+        {
+            "text": 'Rename the "}{[" parser',
+            "owner": "Alex",
+            "due_raw": "by Friday",
+            "due": None,
+            "evidence": "Alex: I'll rename it by Friday.",
+            "needs_human_review": False,
+            "reason": None,
+        },
+        {
+            "text": "Ship the release",
+            "owner": None,
+            "due_raw": None,
+            "due": None,
+            "evidence": "Sam: Someone should ship it.",
+            "needs_human_review": True,
+            "reason": "No owner named.",
+        },
+    ],
+    "decisions": [{"text": "Adopt the new auth flow", "evidence": "Sam: Let's adopt it."}],
+    "follow_ups": [
+        {"text": "Schedule a review", "owner": "Sam", "due_raw": "next Monday", "due": None, "evidence": "Sam: Review Monday."}
+    ],
+}
+
+
+def _feed_in_chunks(text, size):
+    parser = IncrementalItemParser()
+    items = []
+    for i in range(0, len(text), size):
+        items.extend(parser.feed(text[i:i + size]))
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 3, 17, 10_000])
+def test_parser_emits_every_item_regardless_of_chunking(size):
+    items = _feed_in_chunks(json.dumps(PAYLOAD, indent=2), size)
+
+    assert [(section, idx) for section, idx, _ in items] == [
+        ("action_items", 0),
+        ("action_items", 1),
+        ("decisions", 0),
+        ("follow_ups", 0),
+    ]
+    assert items[0][2] == PAYLOAD["action_items"][0]
+
+
+def test_parser_emits_item_before_payload_is_complete():
+    text = json.dumps(PAYLOAD)
+    cut = text.index('"decisions"')
+    parser = IncrementalItemParser()
+
+    items = parser.feed(text[:cut])
+
+    assert [idx for _, idx, _ in items] == [0, 1]
+
+
+class StreamingStubClient:
+    def __init__(self, text, chunk_size=5):
+        self.text = text
+        self.chunk_size = chunk_size
+        self.model = "gpt-4o-mini"
+        self.temperature = 0.0
+
+    async def chat_completion_stream(self, messages, response_format):
+        for i in range(0, len(self.text), self.chunk_size):
+            yield self.text[i:i + self.chunk_size]
+
+
+def _collect(extractor, transcript):
+    async def run():
+        return [event async for event in extractor.astream(transcript)]
+
+    return asyncio.run(run())
+
+
+def test_astream_validates_and_normalizes_each_item():
+    extractor = LLMExtractor(async_client=StreamingStubClient(json.dumps(PAYLOAD)))
+
+    events = _collect(extractor, "Date: Jan 22, 2026\nAlex: Hi.\nSam: Hello.")
+
+    assert [e["event"] for e in events] == ["item"] * 4
+    assert events[0]["item"]["due"] == "2026-01-23"
+    assert events[3]["section"] == "follow_ups"
+    assert events[3]["item"]["due"] == "2026-01-26"
+
+
+def test_astream_reports_invalid_items_and_keeps_going():
+    payload = json.loads(json.dumps(PAYLOAD))
+    payload["action_items"][0]["due"] = "2026-01-23"
+    extractor = LLMExtractor(async_client=StreamingStubClient(json.dumps(payload)))
+
+    events = _collect(extractor, "Alex: Hi.\nSam: Hello.")
+
+    assert events[0]["event"] == "invalid_item"
+    assert "action_items[0].due" in events[0]["error"]
+    assert [e["event"] for e in events[1:]] == ["item"] * 3
+
+
+@pytest.mark.parametrize("size", [1, 4, 10_000])
+def test_parser_emits_non_object_elements(size):
+    text = '{"action_items": ["ship it", 42, {"text": "x"}, [1], true, null], "decisions": [], "follow_ups": [ -1.5 ]}'
+
+    items = _feed_in_chunks(text, size)
+
+    assert items == [
+        ("action_items", 0, "ship it"),
+        ("action_items", 1, 42),
+        ("action_items", 2, {"text": "x"}),
+        ("action_items", 3, [1]),
+        ("action_items", 4, True),
+        ("action_items", 5, None),
+        ("follow_ups", 0, -1.5),
+    ]
+
+
+def test_astream_reports_non_object_elements_as_invalid_items():
+    payload = json.loads(json.dumps(PAYLOAD))
+    payload["action_items"][1:1] = ["ship it", 7]
+    extractor = LLMExtractor(async_client=StreamingStubClient(json.dumps(payload)))
+
+    events = _collect(extractor, "Alex: Hi.\nSam: Hello.")
+
+    invalid = [e for e in events if e["event"] == "invalid_item"]
+    assert [(e["section"], e["index"]) for e in invalid] == [("action_items", 1), ("action_items", 2)]
+    assert "must be an object" in invalid[0]["error"]
+    assert [e["index"] for e in events if e["event"] == "item" and e["section"] == "action_items"] == [0, 3]
+
+
+def test_astream_raises_on_truncated_output():
+    text = json.dumps(PAYLOAD)
+    extractor = LLMExtractor(async_client=StreamingStubClient(text[: len(text) // 2]))
+
+    with pytest.raises(ValueError):
+        _collect(extractor, "Alex: Hi.\nSam: Hello.")
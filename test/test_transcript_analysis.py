@@ -0,0 +1,102 @@
+import re
+from datetime import date
+
+import pytest
+
+from api.models.validation import TranscriptValidationResult
+from api.services.transcript_validator import validate_transcript
+from src.date_normalizer import parse_meeting_date
+from src.transcript_analysis import analyze_transcript
+
+
+TRANSCRIPT = (
+    "Meeting: Weekly Product Sync\n"
+    "Date: Jan 22, 2026\n"
+    "Attendees: Alex, Priya\n"
+    "\n"
+    "Alex: Let's get started.\n"
+    "Priya: I'll update the onboarding screens by Friday.\n"
+    "  continuing the same turn: still Priya\n"
+    "Alex: Sounds good.\n"
+)
+
+
+def test_index_has_turns_headers_and_counts():
+    index = analyze_transcript(TRANSCRIPT)
+
+    assert index.speaker_lines == 7
+    assert [turn.split(":")[0] for turn in index.turns()] == ["Alex", "Priya", "  continuing the same turn", "Alex"]
+    assert index.preamble == "Meeting: Weekly Product Sync\nDate: Jan 22, 2026\nAttendees: Alex, Priya\n\n"
+    assert "".join([index.preamble] + index.turns()) == TRANSCRIPT
+    assert index.date_header.month == "Jan" and TRANSCRIPT[index.date_header.start:].startswith("Date:")
+    assert index.has_meeting_header
+    assert index.word_count == len(TRANSCRIPT.split())
+
+
+def test_index_is_shared_across_callers():
+    assert analyze_transcript(TRANSCRIPT) is analyze_transcript(TRANSCRIPT)
+
+
+def test_date_header_not_at_line_start_is_still_found():
+    transcript = "Notes from sync. Date: Mar 3, 2026\nAlex: hi there\nSam: hello\n"
+    assert parse_meeting_date(transcript) == date(2026, 3, 3)
+    assert analyze_transcript(transcript).turns()[0].startswith("Alex:")
+
+
+def test_transcript_without_headers_or_turns():
+    index = analyze_transcript("just some notes\nwith no speakers\n")
+
+    assert index.speaker_lines == 0
+    assert index.turns() == []
+    assert index.preamble_end == len(index.text)
+    assert index.date_header is None
+    assert not index.has_meeting_header
+
+
+def test_validator_reads_the_index():
+    result = validate_transcript(TRANSCRIPT)
+    assert result.valid
+    assert result.warnings == [f"Transcript is very short ({len(TRANSCRIPT.split())} words); results may be limited."]
+
+    result = validate_transcript("Alex: one\nSam: two\n")
+    assert result.valid
+    assert any("Date:" in w for w in result.warnings)
+    assert any("Meeting:" in w for w in result.warnings)
+
+
+# The validator as it was before the shared index, kept to pin down its warnings
+_BASELINE_SPEAKER_LINE_RE = re.compile(r"^\s*[A-Za-z][A-Za-z\s\-']+:\s+\S", re.MULTILINE)
+_BASELINE_DATE_HEADER_RE = re.compile(r"Date:\s*[A-Za-z]{3}\s+\d{1,2},\s+\d{4}")
+_BASELINE_MEETING_HEADER_RE = re.compile(r"Meeting:", re.IGNORECASE)
+
+
+def _baseline_validate(content: str) -> TranscriptValidationResult:
+    warnings = []
+    if len(_BASELINE_SPEAKER_LINE_RE.findall(content)) < 2:
+        return TranscriptValidationResult(valid=False, errors=["speaker lines"], warnings=warnings)
+    if not _BASELINE_DATE_HEADER_RE.search(content):
+        warnings.append("Missing 'Date: Mon DD, YYYY' header — due-date normalization will be skipped.")
+    if not _BASELINE_MEETING_HEADER_RE.search(content):
+        warnings.append("Missing 'Meeting:' header.")
+    word_count = len(content.split())
+    if word_count < 50:
+        warnings.append(f"Transcript is very short ({word_count} words); results may be limited.")
+    return TranscriptValidationResult(valid=True, errors=[], warnings=warnings)
+
+
+@pytest.mark.parametrize(
+    "transcript",
+    [
+        TRANSCRIPT,
+        "Team Meeting: Sprint review\nAlex: hi there\nSam: hello\n",
+        "Subject - Meeting: Q1\nAlex: hi there\nSam: hello\n",
+        "Meeting:\nAlex: hi there\nSam: hello\n",
+        "MEETING: offsite\nAlex: hi there\nSam: hello\n",
+        "Notes. meeting: later\nAlex: hi there\nSam: hello\n",
+        "Notes from sync. Date: Mar 3, 2026\nAlex: hi there\nSam: hello\n",
+        "Alex: one\nSam: two\n",
+        "Alex: we need a meeting soon\nSam: agreed\n",
+    ],
+)
+def test_validator_warnings_match_the_baseline_validator(transcript):
+    assert validate_transcript(transcript).warnings == _baseline_validate(transcript).warnings
@@ -0,0 +1,84 @@
+import json
+from types import SimpleNamespace
+
+from lib import usage
+from lib.openai_client import OpenAIClient
+from lib.replay_client import ReplayClient
+from src.llm_extractor import LLMExtractor
+
+
+EMPTY = json.dumps({"action_items": [], "decisions": [], "follow_ups": []})
+
+
+class StubClient:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = 0
+
+    def chat_completion(self, messages, model=None, temperature=None, response_format=None):
+        response = self.responses[min(self.calls, len(self.responses) - 1)]
+        self.calls += 1
+        usage.record_call(0.5, SimpleNamespace(prompt_tokens=100, completion_tokens=20))
+        return response
+
+
+class FakeCompletions:
+    def create(self, **kwargs):
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=EMPTY))],
+            usage=SimpleNamespace(prompt_tokens=42, completion_tokens=7),
+        )
+
+
+def test_openai_client_records_response_usage():
+    client = OpenAIClient(api_key="sk-test")
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+
+    with usage.metering() as meter:
+        assert client.chat_completion([{"role": "user", "content": "hi"}]) == EMPTY
+
+    stats = meter.as_dict()
+    assert stats["llm_calls"] == 1
+    assert (stats["prompt_tokens"], stats["completion_tokens"]) == (42, 7)
+    assert stats["calls_without_usage"] == 0
+
+
+def test_calls_outside_metering_are_not_recorded():
+    with usage.metering() as meter:
+        pass
+    LLMExtractor(client=StubClient([EMPTY])).extract("Alex: ship it")
+    assert meter.calls == 0
+
+
+def test_metering_counts_windows_attempts_and_retries():
+    client = StubClient([json.dumps({"action_items": []}), EMPTY])
+    with usage.metering() as meter:
+        LLMExtractor(client=client, max_attempts=2).extract("Alex: ship it")
+
+    stats = meter.as_dict()
+    assert (stats["llm_calls"], stats["windows"], stats["attempts"], stats["retries"]) == (2, 1, 2, 1)
+    assert stats["prompt_tokens"] == 200
+    assert stats["llm_seconds"] == 1.0
+
+
+def test_chunked_extraction_reports_every_window_to_the_caller():
+    transcript = "Meeting: Planning\n" + "\n".join(f"Alex: item number {i} needs doing soon." for i in range(40))
+    extractor = LLMExtractor(client=StubClient([EMPTY]), chunk_chars=300, max_concurrency=4)
+
+    with usage.metering() as meter:
+        extractor.extract(transcript)
+
+    assert meter.windows > 1
+    assert meter.calls == meter.windows
+
+
+def test_replayed_calls_report_latency_without_usage(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    LLMExtractor(client=ReplayClient(path, inner=StubClient([EMPTY]), mode="record")).extract("Alex: ship it")
+
+    with usage.metering() as meter:
+        LLMExtractor(client=ReplayClient(path)).extract("Alex: ship it")
+
+    assert meter.calls == 1
+    assert meter.calls_without_usage == 1
+    assert meter.prompt_tokens == 0